@@ -0,0 +1,161 @@
+"""
+Benchmarks of :func:`deinterlace <deinterlacing.deinterlace>` for airspeed velocity.
+
+Each implementation selected by the dispatchers is timed on the same stack, while the
+remaining suites sweep the scaling axes (frame size, stack length, dtype, block size,
+and unstable frames). Every suite reports the time, the throughput (frames/s), and the
+peak memory of the process.
+
+Run the suite against the current checkout and compare two commits or releases using:
+
+.. code-block:: bash
+
+    asv run
+    asv continuous v1.0.5 HEAD
+    asv compare v1.0.5 HEAD
+"""
+
+from dataclasses import fields
+from time import perf_counter
+from typing import Any, ClassVar
+
+import numpy as np
+
+from deinterlacing import DeinterlaceParameters, deinterlace
+from deinterlacing.backends import available_fft_backends
+from deinterlacing.synthetic import generate_stack
+
+#: Parameters selecting each implementation of the dispatchers (on the CPU)
+PATHS: dict[str, dict[str, Any]] = {
+    "pixel": {},
+    "pixel-pool-mean": {"pool": "mean"},
+    "pixel-pool-median": {"pool": "median"},
+    "pixel-pool-std": {"pool": "std"},
+    "pixel-pool-sum": {"pool": "sum"},
+    "pixel-unstable": {"unstable": 64},
+    "pixel-stride": {"stride": 4},
+    "pixel-rows-auto": {"rows": "auto"},
+    "pixel-probe": {"probe_interval": 4},
+    "pixel-workers": {"workers": 2},
+    "pixel-processes": {"workers": 2, "executor": "process"},
+    "pixel-channel": {"channel": 0},
+    "pixel-channel-mean": {"channel": "mean"},
+    "pixel-planes": {"planes": 2},
+    "pixel-float32": {"precision": "float32"},
+    "subpixel": {"align": "subpixel"},
+    "subpixel-pool-std": {"align": "subpixel", "pool": "std"},
+    "subpixel-unstable": {"align": "subpixel", "unstable": 64},
+    "subpixel-linear": {"align": "subpixel", "interpolation": "linear"},
+    "subpixel-cubic": {"align": "subpixel", "interpolation": "cubic"},
+    "subpixel-lanczos": {"align": "subpixel", "interpolation": "lanczos"},
+    "subpixel-float32": {"align": "subpixel", "precision": "float32"},
+    "variable": {"align": "variable"},
+    "variable-unstable": {"align": "variable", "unstable": 64},
+    "subpixel-scipy": {"align": "subpixel", "fft_backend": "scipy"},
+    "subpixel-pyfftw": {"align": "subpixel", "fft_backend": "pyfftw"},
+}
+
+#: Number of channels of the multichannel stacks (see `channel`)
+CHANNELS = 2
+
+#: Names of the benchmark parameters that are passed to the deinterlacing parameters
+_FIELDS = frozenset(field.name for field in fields(DeinterlaceParameters))
+
+
+def interlaced_stack(frames: int, size: int, dtype: str = "uint16") -> np.ndarray:
+    """
+    Generate a synthetic stack of interlaced frames (see
+    :func:`generate_stack <deinterlacing.synthetic.generate_stack>`).
+
+    :param frames: The number of frames.
+    :param size: The number of rows and columns of each frame.
+    :param dtype: The dtype of the stack.
+    :returns: The stack (frames, size, size).
+    """
+    return generate_stack(frames, (size, size), offsets=3.0, dtype=dtype)
+
+
+class _Deinterlace:
+    """Shared timing, throughput, and memory benchmarks."""
+
+    number = 1
+    repeat = (1, 5, 60.0)
+    timeout = 600.0
+
+    #: Parameters shared by every benchmark of the suite (the progress bar is
+    #: disabled, so rendering it is never timed)
+    options: ClassVar[dict[str, Any]] = {"block_size": 64, "progress": False}
+
+    def _parameters(self, *params: Any) -> DeinterlaceParameters:
+        # NOTE: Benchmark parameters named after a parameter of the deinterlacing
+        #  (e.g., align) override the shared options
+        named = dict(zip(self.param_names, params, strict=True))
+        options = {**self.options}
+        options.update({name: named[name] for name in _FIELDS & named.keys()})
+        return DeinterlaceParameters(**options)
+
+    def _deinterlace(self, *params: Any) -> None:
+        # NOTE: The parameters are mutated during validation, so they are constructed
+        #  for every call
+        deinterlace(self.images, self._parameters(*params))
+
+    def time_deinterlace(self, *params: Any) -> None:
+        self._deinterlace(*params)
+
+    def peakmem_deinterlace(self, *params: Any) -> None:
+        self._deinterlace(*params)
+
+    def track_frames_per_second(self, *params: Any) -> float:
+        start = perf_counter()
+        self._deinterlace(*params)
+        return self.images.shape[0] / (perf_counter() - start)
+
+    track_frames_per_second.unit = "frames/s"
+
+
+class DispatchPaths(_Deinterlace):
+    """
+    Every implementation of the dispatchers on a 256 x 512 x 512 uint16 stack, which
+    is split into two channels for the paths selecting a reference channel.
+    """
+
+    params = (list(PATHS),)
+    param_names = ("path",)
+
+    def setup(self, path: str) -> None:
+        backend = PATHS[path].get("fft_backend", "numpy")
+        if backend not in available_fft_backends():
+            # NOTE: asv skips benchmarks whose setup raises NotImplementedError
+            msg = f"The '{backend}' FFT backend is not installed."
+            raise NotImplementedError(msg)
+        self.options = {**_Deinterlace.options, **PATHS[path]}
+        self.images = interlaced_stack(256, 512)
+        if "channel" in PATHS[path]:
+            # NOTE: The same number of frames is split across the channels
+            self.images = self.images.reshape(-1, CHANNELS, 512, 512)
+            self.options["block_size"] //= CHANNELS
+
+
+class FrameScaling(_Deinterlace):
+    """Scaling with the frame size, stack length, and dtype."""
+
+    params = (
+        ["pixel", "subpixel"],
+        ["uint16", "float32"],
+        [256, 512, 1024],
+        [128, 512],
+    )
+    param_names = ("align", "dtype", "size", "frames")
+
+    def setup(self, align: str, dtype: str, size: int, frames: int) -> None:  # noqa: ARG002
+        self.images = interlaced_stack(frames, size, dtype)
+
+
+class BlockScaling(_Deinterlace):
+    """Scaling with the block size and the number of unstable frames."""
+
+    params = (["pixel", "subpixel"], [16, 64, 256], [None, 64, 256])
+    param_names = ("align", "block_size", "unstable")
+
+    def setup(self, align: str, block_size: int, unstable: int | None) -> None:  # noqa: ARG002
+        self.images = interlaced_stack(512, 512)
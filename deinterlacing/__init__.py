@@ -1,7 +1,23 @@
+from deinterlacing.instrumentation import MetricsRecorder
+from deinterlacing.offsets import OffsetTrace
 from deinterlacing.parameters import DeinterlaceParameters
-from deinterlacing.processing import deinterlace
+from deinterlacing.processing import (
+    apply_offsets,
+    deinterlace,
+    deinterlace_file,
+    estimate_offsets,
+)
+from deinterlacing.streaming import StreamingDeinterlacer
+from deinterlacing.tuning import tune
 
 __all__ = [
     "DeinterlaceParameters",
+    "MetricsRecorder",
+    "OffsetTrace",
+    "StreamingDeinterlacer",
+    "apply_offsets",
     "deinterlace",
+    "deinterlace_file",
+    "estimate_offsets",
+    "tune",
 ]
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from math import floor
+from threading import Lock
 from typing import Literal
 
 import numpy as np
@@ -11,44 +14,128 @@ except ImportError:
 
 __all__ = [
     "align_pixels",
+    "align_pixels_framewise",
     "align_subpixels",
+    "align_subpixels_framewise",
+    "align_subpixels_interpolated",
+    "align_subpixels_interpolated_framewise",
+    "align_variable",
     "correct_subpixel_offset",
+    "correct_subpixel_offsets",
+    "interpolate_subpixel_offset",
 ]
 
 
 def align_pixels(images: NDArrayLike, start: int, stop: int, offset: int) -> None:
     if offset > 0:
-        images[start:stop, 1::2, offset:] = images[start:stop, 1::2, :-offset]
+        images[start:stop, ..., 1::2, offset:] = images[start:stop, ..., 1::2, :-offset]
     elif offset < 0:
-        images[start:stop, 1::2, :offset] = images[start:stop, 1::2, -offset:]
+        images[start:stop, ..., 1::2, :offset] = images[start:stop, ..., 1::2, -offset:]
+
+
+class _PhaseRampCache:
+    """
+    Thread-safe, least-recently-used cache of the complex phase ramps used to shift
+    lines by a subpixel offset. Ramps are keyed by the line length, offset, precision
+    and backend, so blocks sharing an offset skip the transcendental work entirely.
+    The least-recently-used ramps are evicted once the cache exceeds `max_bytes`.
+
+    :param max_bytes: The maximum size of the cached ramps in bytes.
+    """
+
+    def __init__(self, max_bytes: int = 2**26) -> None:
+        self.max_bytes = max_bytes
+        #: Number of lookups served from the cache
+        self.hits = 0
+        #: Number of lookups requiring a ramp to be calculated
+        self.misses = 0
+        self._ramps = OrderedDict()
+        self._nbytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._ramps)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the cached ramps in bytes."""
+        return self._nbytes
+
+    def clear(self) -> None:
+        """Remove all cached ramps."""
+        with self._lock:
+            self._ramps.clear()
+            self._nbytes = 0
+
+    def get(
+        self,
+        n: int,
+        offset: float,
+        fft_module: Literal[np, cp] = np,
+        precision: Literal["float32", "float64"] = "float64",
+    ) -> NDArrayLike:
+        """
+        Retrieve (or calculate and cache) the phase ramp shifting lines of length `n`
+        by `offset`.
+
+        :param n: The length of the lines.
+        :param offset: The subpixel offset.
+        :param fft_module: The module used to calculate the fourier transforms.
+        :param precision: The floating-point precision of the calculation.
+        :returns: The phase ramp for the non-negative frequencies (n // 2 + 1).
+        """
+        offset = float(offset)
+        key = (n, offset, np.dtype(precision).str, fft_module.__name__)
+        with self._lock:
+            if (ramp := self._ramps.get(key)) is not None:
+                self._ramps.move_to_end(key)
+                self.hits += 1
+                return ramp
+            self.misses += 1
+        # NOTE: The ramp is calculated outside the lock so other threads are not
+        #  blocked; a concurrent miss on the same key simply stores an identical ramp
+        freq = fft_module.fft.rfftfreq(n).astype(precision, copy=False)
+        ramp = fft_module.exp(1j * (-2.0 * fft_module.pi * offset * freq))
+        with self._lock:
+            if (previous := self._ramps.pop(key, None)) is not None:
+                self._nbytes -= previous.nbytes
+            self._ramps[key] = ramp
+            self._nbytes += ramp.nbytes
+            while self._nbytes > self.max_bytes and len(self._ramps) > 1:
+                _, evicted = self._ramps.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+        return ramp
+
+
+#: Phase ramps shared by all subpixel corrections
+_PHASE_RAMPS = _PhaseRampCache()
 
 
 def correct_subpixel_offset(
     backward_lines: NDArrayLike,
     offset: float,
     fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
 ) -> None:
     vectorized = backward_lines.reshape(-1, backward_lines.shape[-1])
-    fft_lines = fft_module.fft.fft(vectorized, axis=-1)
-
-    # FREQUENCY CACHE
-    n = fft_lines.shape[-1]
-    if (freq := getattr(align_subpixels, "freq", None)) is None:
-        # Cache the frequencies for the first time
-        freq = fft_module.fft.fftfreq(n)
-        align_subpixels.freq = {n: freq}
-    elif (freq := freq.get(n)) is None:
-        freq = fft_module.fft.fftfreq(n)
-        align_subpixels.freq[n] = freq
-    # HACK: This hack makes sure the frequency cache is an appropriate type, because
-    #  the test suite will fail stochastically if there are mismatches
-    try:
-        freq = fft_module.asarray(freq)
-    except TypeError:
-        freq = freq.get()
-    phase = -2.0 * fft_module.pi * offset * freq
-    fft_lines *= fft_module.exp(1j * phase)
-    return fft_module.real(fft_module.fft.ifft(fft_lines, axis=-1))
+    vectorized = vectorized.astype(precision, copy=False)
+    # NOTE: The lines are real-valued, so only the non-negative frequencies are
+    #  shifted (rfft) and irfft returns the real-valued lines directly
+    n = vectorized.shape[-1]
+    fft_lines = fft_module.fft.rfft(vectorized, axis=-1)
+    return _shift_spectrum(fft_lines, n, offset, fft_module, precision)
+
+
+def _shift_spectrum(
+    fft_lines: NDArrayLike,
+    n: int,
+    offset: float,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+) -> NDArrayLike:
+    # Apply the phase ramp to the spectrum of the lines (in-place) and invert it
+    fft_lines *= _PHASE_RAMPS.get(n, offset, fft_module, precision)
+    return fft_module.fft.irfft(fft_lines, n=n, axis=-1)
 
 
 def align_subpixels(
@@ -57,15 +144,310 @@ def align_subpixels(
     stop: int,
     offset: float,
     fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+    spectrum: NDArrayLike | None = None,
 ) -> None:
-    backward_lines = images[start:stop, 1::2, ...]
-    if fft_module == cp:
-        corrector = wrap_cupy(correct_subpixel_offset, "backward_lines", "offset")
+    backward_lines = images[start:stop, ..., 1::2, :]
+    if spectrum is not None:
+        # NOTE: The spectrum of the backward lines was retained while estimating the
+        #  offset (see calculate_offset_matrix_and_spectrum), so only the inverse
+        #  transform remains. The spectrum is consumed (shifted in-place).
+        images[start:stop, ..., 1::2, :] = _shift_spectrum(
+            spectrum, images.shape[-1], offset, fft_module, precision
+        )
+        return
+    if fft_module is cp and cp is not np:
+        corrector = wrap_cupy(correct_subpixel_offset, "backward_lines")
     else:
         corrector = correct_subpixel_offset
-    vectorized_correction = corrector(backward_lines, offset, fft_module=fft_module)
-    images[start:stop, 1::2, ...] = vectorized_correction.reshape(backward_lines.shape)
+    vectorized_correction = corrector(
+        backward_lines, offset, fft_module=fft_module, precision=precision
+    )
+    images[start:stop, ..., 1::2, :] = vectorized_correction.reshape(
+        backward_lines.shape
+    )
+
+
+def align_pixels_framewise(
+    images: NDArrayLike, start: int, stop: int, offsets: np.ndarray
+) -> None:
+    """
+    Align each frame by its own pixel offset in a single vectorized gather, which is
+    equivalent to calling :func:`align_pixels` for each frame individually.
+
+    :param images: The images to align in-place.
+    :param start: The index of the first frame to align.
+    :param stop: The index after the last frame to align.
+    :param offsets: The pixel offset of each frame (stop - start).
+    """
+    columns = np.arange(images.shape[-1])
+    source = columns - np.asarray(offsets, dtype=int)[:, np.newaxis]
+    # NOTE: Columns shifted in from outside the image retain their original values
+    source = np.where((source >= 0) & (source < images.shape[-1]), source, columns)
+    images[start:stop, ..., 1::2, :] = np.take_along_axis(
+        images[start:stop, ..., 1::2, :],
+        source.reshape(-1, *(1,) * (images.ndim - 2), images.shape[-1]),
+        axis=-1,
+    )
+
+
+def correct_subpixel_offsets(
+    backward_lines: NDArrayLike,
+    offsets: NDArrayLike,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+) -> NDArrayLike:
+    """
+    Shift the backward-scanned lines of each frame by its own subpixel offset, which
+    is equivalent to calling :func:`correct_subpixel_offset` for each frame.
+
+    :param backward_lines: The backward-scanned lines (frames, ..., columns).
+    :param offsets: The subpixel offset of each frame (on the host).
+    :param fft_module: The module used to calculate the fourier transforms.
+    :param precision: The floating-point precision of the calculation.
+    :returns: The shifted backward-scanned lines.
+    """
+    n = backward_lines.shape[-1]
+    fft_lines = fft_module.fft.rfft(
+        backward_lines.astype(precision, copy=False), axis=-1
+    )
+    # NOTE: Frames sharing an offset share a (cached) phase ramp
+    unique, inverse = np.unique(np.asarray(offsets), return_inverse=True)
+    ramps = fft_module.stack(
+        [_PHASE_RAMPS.get(n, offset, fft_module, precision) for offset in unique]
+    )
+    ramps = ramps[fft_module.asarray(inverse.ravel())]
+    fft_lines *= ramps.reshape(
+        (ramps.shape[0],) + (1,) * (backward_lines.ndim - 2) + (ramps.shape[-1],)
+    )
+    return fft_module.fft.irfft(fft_lines, n=n, axis=-1)
+
+
+def align_subpixels_framewise(
+    images: NDArrayLike,
+    start: int,
+    stop: int,
+    offsets: np.ndarray,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+) -> None:
+    """
+    Align each frame by its own subpixel offset in a single batch of fourier
+    transforms, which is equivalent to calling :func:`align_subpixels` for each
+    frame individually.
+
+    :param images: The images to align in-place.
+    :param start: The index of the first frame to align.
+    :param stop: The index after the last frame to align.
+    :param offsets: The subpixel offset of each frame (stop - start).
+    :param fft_module: The module used to calculate the fourier transforms.
+    :param precision: The floating-point precision of the calculation.
+    """
+    backward_lines = images[start:stop, ..., 1::2, :]
+    if fft_module is cp and cp is not np:
+        corrector = wrap_cupy(correct_subpixel_offsets, "backward_lines")
+    else:
+        corrector = correct_subpixel_offsets
+    images[start:stop, ..., 1::2, :] = corrector(
+        backward_lines, np.asarray(offsets), fft_module=fft_module, precision=precision
+    )
+
+
+def _cubic(x: np.ndarray) -> np.ndarray:
+    # Keys' cubic convolution kernel (a = -0.5)
+    x = np.abs(x)
+    return np.where(
+        x <= 1,
+        (1.5 * x - 2.5) * x * x + 1,
+        np.where(x < 2, ((-0.5 * x + 2.5) * x - 4) * x + 2, 0.0),
+    )
 
 
-def align_variable(images: NDArrayLike) -> None:
-    print(f"{images.shape=}")
+#: Support (half-width in pixels) and kernel of each interpolation
+_KERNELS = {
+    "linear": (1, lambda x: np.maximum(1 - np.abs(x), 0.0)),
+    "cubic": (2, _cubic),
+    "lanczos": (3, lambda x: np.sinc(x) * np.sinc(x / 3)),
+}
+
+#: Size (bytes) of the intermediate buffers of each chunk of interpolated lines, such
+#: that the buffers remain in cache
+_INTERPOLATION_CHUNK_BYTES = 2**17
+
+
+def _interpolation_kernel(
+    offset: float,
+    interpolation: Literal["linear", "cubic", "lanczos"],
+    precision: Literal["float32", "float64"] = "float64",
+) -> tuple[int, np.ndarray]:
+    # Returns the (relative) column of the first tap and the weights of each tap
+    # such that shifted[x] = sum(weights[k] * lines[x + first + k])
+    support, kernel = _KERNELS[interpolation]
+    source = -float(offset)
+    whole = floor(source)
+    taps = np.arange(1 - support, support + 1)
+    if (fraction := source - whole) == 0:
+        # NOTE: Integer offsets are exact shifts (the kernels are only approximately
+        #  zero at the other taps)
+        weights = (taps == 0).astype(float)
+    else:
+        weights = kernel(fraction - taps)
+        weights /= weights.sum()
+    return whole + 1 - support, weights.astype(precision)
+
+
+def interpolate_subpixel_offset(
+    backward_lines: NDArrayLike,
+    offset: float,
+    interpolation: Literal["linear", "cubic", "lanczos"] = "cubic",
+    precision: Literal["float32", "float64"] = "float64",
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Shift the backward-scanned lines by a subpixel offset using a short interpolation
+    kernel, which is applied as a small convolution along the last axis rather than
+    a round-trip through the fourier domain. Columns shifted in from outside the
+    image replicate the edge columns.
+
+    The lines are convolved in small chunks whose (padded) copy and accumulator stay
+    in cache, so no temporaries the size of the lines are allocated and the lines can
+    be shifted in-place by providing them as `out`.
+
+    :param backward_lines: The backward-scanned lines (..., columns).
+    :param offset: The subpixel offset.
+    :param interpolation: The interpolation kernel: linear (2 taps), cubic (4 taps),
+        or a windowed sinc (lanczos, 6 taps).
+    :param precision: The floating-point precision of the calculation.
+    :param out: Array in which to write the shifted lines (e.g., the lines
+        themselves). By default, a new array of the provided precision.
+    :returns: The shifted backward-scanned lines.
+    """
+    width = backward_lines.shape[-1]
+    if out is None:
+        out = np.empty(backward_lines.shape, dtype=precision)
+    first, weights = _interpolation_kernel(offset, interpolation, precision)
+    before = max(-first, 0)
+    after = max(first + weights.size - 1, 0)
+    taps = [
+        (before + first + tap, weight)
+        for tap, weight in enumerate(weights)
+        if weight != 0
+    ]
+
+    chunk = max(_INTERPOLATION_CHUNK_BYTES // (width * np.dtype(precision).itemsize), 1)
+    padded = np.empty((chunk, before + width + after), dtype=precision)
+    shifted = np.empty((chunk, width), dtype=precision)
+    product = np.empty_like(shifted)
+    # NOTE: Each chunk is copied before it is overwritten, so the lines may be
+    #  shifted in-place
+    stacked, stacked_out = np.atleast_2d(backward_lines), np.atleast_2d(out)
+    for index in np.ndindex(stacked.shape[:-2]):
+        lines, target = stacked[index], stacked_out[index]
+        for row in range(0, lines.shape[0], chunk):
+            rows = min(chunk, lines.shape[0] - row)
+            lines_chunk, shifted_chunk = padded[:rows], shifted[:rows]
+            lines_chunk[:, before : before + width] = lines[row : row + rows]
+            lines_chunk[:, :before] = lines_chunk[:, before : before + 1]
+            lines_chunk[:, before + width :] = lines_chunk[
+                :, before + width - 1 : before + width
+            ]
+            (column, weight), *remaining = taps
+            np.multiply(
+                lines_chunk[:, column : column + width], weight, out=shifted_chunk
+            )
+            for column, weight in remaining:
+                np.multiply(
+                    lines_chunk[:, column : column + width], weight, out=product[:rows]
+                )
+                shifted_chunk += product[:rows]
+            target[row : row + rows] = shifted_chunk
+    return out
+
+
+def align_subpixels_interpolated(
+    images: NDArrayLike,
+    start: int,
+    stop: int,
+    offset: float,
+    interpolation: Literal["linear", "cubic", "lanczos"] = "cubic",
+    precision: Literal["float32", "float64"] = "float64",
+) -> None:
+    """
+    Align the backward-scanned lines by a subpixel offset using an interpolation
+    kernel (see :func:`interpolate_subpixel_offset`) rather than fourier transforms.
+
+    :param images: The images to align in-place.
+    :param start: The index of the first frame to align.
+    :param stop: The index after the last frame to align.
+    :param offset: The subpixel offset.
+    :param interpolation: The interpolation kernel.
+    :param precision: The floating-point precision of the calculation.
+    """
+    backward_lines = images[start:stop, ..., 1::2, :]
+    interpolate_subpixel_offset(
+        backward_lines, offset, interpolation, precision, out=backward_lines
+    )
+
+
+def align_subpixels_interpolated_framewise(
+    images: NDArrayLike,
+    start: int,
+    stop: int,
+    offsets: np.ndarray,
+    interpolation: Literal["linear", "cubic", "lanczos"] = "cubic",
+    precision: Literal["float32", "float64"] = "float64",
+) -> None:
+    """
+    Align each frame by its own subpixel offset using an interpolation kernel, which
+    is equivalent to calling :func:`align_subpixels_interpolated` for each frame.
+
+    :param images: The images to align in-place.
+    :param start: The index of the first frame to align.
+    :param stop: The index after the last frame to align.
+    :param offsets: The subpixel offset of each frame (stop - start).
+    :param interpolation: The interpolation kernel.
+    :param precision: The floating-point precision of the calculation.
+    """
+    backward_lines = images[start:stop, ..., 1::2, :]
+    offsets = np.asarray(offsets)
+    # NOTE: Frames sharing an offset are shifted together
+    for offset in np.unique(offsets):
+        frames = np.flatnonzero(offsets == offset)
+        backward_lines[frames] = interpolate_subpixel_offset(
+            backward_lines[frames], offset, interpolation, precision
+        )
+
+
+def align_variable(
+    images: NDArrayLike,
+    start: int,
+    stop: int,
+    offsets: np.ndarray,
+    precision: Literal["float32", "float64"] = "float64",
+) -> None:
+    """
+    Align the backward-scanned lines by a field-dependent offset, such that each
+    column is shifted by its own (subpixel) offset. The shifted lines are linearly
+    interpolated in a single vectorized gather.
+
+    :param images: The images to align in-place.
+    :param start: The index of the first frame to align.
+    :param stop: The index after the last frame to align.
+    :param offsets: The offset of each column (columns), or of each column of each
+        frame (stop - start, columns).
+    :param precision: The floating-point precision of the interpolation.
+    """
+    backward_lines = images[start:stop, ..., 1::2, :]
+    width = images.shape[-1]
+    columns = np.arange(width)
+    source = columns - np.asarray(offsets, dtype=precision)
+    # NOTE: Columns shifted in from outside the image retain their original values
+    source = np.where((source >= 0) & (source <= width - 1), source, columns)
+    lower = np.minimum(np.floor(source).astype(int), width - 2)
+    weight = (source - lower).astype(precision, copy=False)
+    # (columns) or (frames, columns) -> broadcastable against (frames, ..., columns)
+    lower = lower.reshape(-1, *(1,) * (images.ndim - 2), width)
+    weight = weight.reshape(-1, *(1,) * (images.ndim - 2), width)
+    left = np.take_along_axis(backward_lines, lower, axis=-1)
+    right = np.take_along_axis(backward_lines, lower + 1, axis=-1)
+    images[start:stop, ..., 1::2, :] = left * (1 - weight) + right * weight
@@ -0,0 +1,178 @@
+from collections.abc import Callable
+from importlib.util import find_spec
+from os import cpu_count
+from typing import Any
+
+import numpy as np
+
+from deinterlacing.tools import NDArrayLike
+
+__all__ = [
+    "FFTBackend",
+    "available_fft_backends",
+    "get_fft_backend",
+    "register_fft_backend",
+]
+
+
+class FFTBackend:
+    """
+    Stand-in for the numpy module whose fourier transforms are calculated by another
+    library. Every attribute other than `fft` is numpy's, so a backend can be passed
+    wherever an `fft_module` is expected.
+
+    :param name: The name of the backend.
+    :param fft: Namespace providing rfft, irfft, rfftfreq, and ifftshift with the
+        signatures of :mod:`numpy.fft` (including the `out` argument).
+    :param native_out: Whether the transforms write directly into the `out` argument.
+        Otherwise each result is assumed to be allocated and then copied into `out`,
+        which the memory model accounts for (see
+        :func:`pixel_cost <deinterlacing.memory.pixel_cost>`).
+    """
+
+    def __init__(self, name: str, fft: Any, *, native_out: bool = False) -> None:
+        self.__name__ = name
+        self.fft = fft
+        self.native_out = native_out
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(np, attribute)
+
+    def __repr__(self) -> str:
+        return f"FFTBackend(name='{self.__name__}')"
+
+
+class _RealTransforms:
+    """
+    Namespace adapting the real-valued transforms of a library to the signatures of
+    numpy.fft. Neither scipy.fft nor the numpy interfaces of pyFFTW accept an `out`
+    argument, so the transforms are calculated out-of-place and the result is copied
+    into the provided buffer. Each transform into a buffer of the workspace therefore
+    allocates a temporary of the same size as the buffer.
+    """
+
+    rfftfreq = staticmethod(np.fft.rfftfreq)
+    ifftshift = staticmethod(np.fft.ifftshift)
+
+    def __init__(self, rfft: Callable, irfft: Callable, **kwargs: Any) -> None:
+        self._rfft = rfft
+        self._irfft = irfft
+        self._kwargs = kwargs
+
+    def rfft(
+        self,
+        a: NDArrayLike,
+        n: int | None = None,
+        axis: int = -1,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        return _copy_into(self._rfft(a, n=n, axis=axis, **self._kwargs), out)
+
+    def irfft(
+        self,
+        a: NDArrayLike,
+        n: int | None = None,
+        axis: int = -1,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        return _copy_into(self._irfft(a, n=n, axis=axis, **self._kwargs), out)
+
+
+def _copy_into(result: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+    if out is None:
+        return result
+    out[...] = result
+    return out
+
+
+def _numpy_backend(workers: int | None) -> Any:  # noqa: ARG001
+    # NOTE: The module itself is returned so that the in-place transforms of
+    #  numpy (and any checks for the numpy module) are unaffected
+    return np
+
+
+def _scipy_backend(workers: int | None) -> FFTBackend:
+    import scipy.fft
+
+    # NOTE: Negative workers are interpreted by scipy as relative to the cpu count
+    workers = -1 if workers is None else workers
+    return FFTBackend(
+        "scipy", _RealTransforms(scipy.fft.rfft, scipy.fft.irfft, workers=workers)
+    )
+
+
+def _pyfftw_backend(workers: int | None) -> FFTBackend:
+    from pyfftw.interfaces import cache, numpy_fft
+
+    # NOTE: Each block of a stack is typically the same shape, so keeping the plans
+    #  alive between calls avoids planning every block. The wisdom accumulated by
+    #  planning is shared by all plans of the process.
+    cache.enable()
+    threads = cpu_count() if workers is None else workers
+    return FFTBackend(
+        "pyfftw", _RealTransforms(numpy_fft.rfft, numpy_fft.irfft, threads=threads)
+    )
+
+
+#: Registered backends (name -> required module, factory)
+_BACKENDS: dict[str, tuple[str | None, Callable[[int | None], Any]]] = {
+    "numpy": (None, _numpy_backend),
+    "scipy": ("scipy", _scipy_backend),
+    "pyfftw": ("pyfftw", _pyfftw_backend),
+}
+
+
+def register_fft_backend(
+    name: str,
+    factory: Callable[[int | None], Any],
+    requires: str | None = None,
+) -> None:
+    """
+    Register a backend for calculating the fourier transforms on the CPU, which can
+    then be selected using the `fft_backend` parameter.
+
+    :param name: The name of the backend.
+    :param factory: Callable returning the fft_module (e.g., a :class:`FFTBackend`)
+        given the number of threads used by each transform (None for the default).
+    :param requires: The module that must be installed for the backend to be
+        available.
+    """
+    _BACKENDS[name] = (requires, factory)
+
+
+def available_fft_backends() -> tuple[str, ...]:
+    """
+    The registered backends whose required modules are installed.
+
+    :returns: The names of the available backends.
+    """
+    return tuple(
+        name
+        for name, (requires, _) in _BACKENDS.items()
+        if requires is None or find_spec(requires) is not None
+    )
+
+
+def get_fft_backend(name: str = "numpy", workers: int | None = None) -> Any:
+    """
+    Retrieve the module used to calculate the fourier transforms on the CPU.
+
+    :param name: The name of the backend.
+    :param workers: The number of threads used by each transform, or None to use
+        every core (numpy's transforms are always single-threaded).
+    :returns: The fft_module of the backend.
+    """
+    if name not in _BACKENDS:
+        msg = (
+            f"Invalid fft_backend='{name}'. Registered backends are "
+            f"{', '.join(map(repr, _BACKENDS))}."
+        )
+        raise ValueError(msg)
+    if name not in available_fft_backends():
+        msg = (
+            f"The '{name}' FFT backend is not available. "
+            f"Is {_BACKENDS[name][0]} installed?"
+        )
+        raise ValueError(msg)
+    _, factory = _BACKENDS[name]
+    return factory(workers)
@@ -0,0 +1,105 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeAlias
+
+import numpy as np
+
+__all__ = [
+    "BlockMetrics",
+    "MetricsRecorder",
+    "Observer",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class BlockMetrics:
+    """
+    Timing of each stage of the deinterlacing of a block of frames, or of a batch of
+    individually-deinterlaced (unstable) frames.
+
+    :var start: The index of the first frame of the block within its plane.
+    :var stop: The index after the last frame of the block within its plane.
+    :var offset: The offset of the block, or the offset of each frame of a batch of
+        unstable frames.
+    :var nbytes: The size of the frames of the block in bytes.
+    :var extraction: Wall time (s) spent extracting (e.g., pooling or cropping) the
+        images used to estimate the offset.
+    :var estimation: Wall time (s) spent estimating the offset.
+    :var alignment: Wall time (s) spent aligning the frames.
+    :var plane: The plane of the block.
+    :var unstable: Whether the frames were deinterlaced individually.
+    """
+
+    start: int
+    stop: int
+    offset: Any
+    nbytes: int
+    extraction: float
+    estimation: float
+    alignment: float
+    plane: int = 0
+    unstable: bool = False
+
+    @property
+    def frames(self) -> int:
+        """Number of frames in the block."""
+        return self.stop - self.start
+
+    @property
+    def elapsed(self) -> float:
+        """Wall time (s) spent on all stages."""
+        return self.extraction + self.estimation + self.alignment
+
+    @property
+    def frames_per_second(self) -> float:
+        """Throughput of the block."""
+        return self.frames / self.elapsed if self.elapsed > 0 else np.inf
+
+
+#: Type alias for observers, which are called with the metrics of each block as it
+#: completes (from the calling thread)
+Observer: TypeAlias = Callable[[BlockMetrics], None]
+
+
+@dataclass(slots=True)
+class MetricsRecorder:
+    """
+    Observer recording the metrics of every block (e.g., to export to monitoring or
+    identify the bottleneck of a dataset).
+
+    .. code-block:: python
+
+        recorder = MetricsRecorder()
+        deinterlace(images, DeinterlaceParameters(progress=False), observer=recorder)
+        recorder.summary()
+
+    :var blocks: The metrics of each block in the order they completed.
+    """
+
+    blocks: list[BlockMetrics] = field(default_factory=list)
+
+    def __call__(self, metrics: BlockMetrics) -> None:
+        self.blocks.append(metrics)
+
+    def summary(self) -> dict[str, float]:
+        """
+        Summarize the recorded blocks. Stage times are summed across blocks, so when
+        blocks are deinterlaced concurrently they exceed the wall time of the call
+        and the throughput is that of a single worker.
+
+        :returns: The frames, bytes, time spent on each stage, and throughput.
+        """
+        frames = sum(block.frames for block in self.blocks)
+        stages = {
+            stage: sum(getattr(block, stage) for block in self.blocks)
+            for stage in ("extraction", "estimation", "alignment")
+        }
+        elapsed = sum(stages.values())
+        return {
+            "blocks": len(self.blocks),
+            "frames": frames,
+            "nbytes": sum(block.nbytes for block in self.blocks),
+            **stages,
+            "elapsed": elapsed,
+            "frames_per_second": frames / elapsed if elapsed > 0 else np.inf,
+        }
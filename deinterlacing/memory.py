@@ -0,0 +1,223 @@
+from math import prod
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from deinterlacing.alignment import _INTERPOLATION_CHUNK_BYTES
+from deinterlacing.backends import available_fft_backends, get_fft_backend
+
+if TYPE_CHECKING:
+    from deinterlacing.parameters import DeinterlaceParameters
+
+__all__ = [
+    "available_memory",
+    "block_memory",
+    "fuses_spectrum",
+    "max_block_size",
+    "pixel_cost",
+]
+
+#: Single-precision transforms in numpy are staged through double-precision buffers,
+#: which hold 16 bytes per pixel of the (half-height) transformed lines
+_SINGLE_PRECISION_STAGING = 8.0
+
+#: The memory (in bytes) assumed to be available when it cannot be determined
+_FALLBACK_AVAILABLE_MEMORY = 2**30
+
+#: The memory statistics of the linux kernel
+_MEMINFO = Path("/proc/meminfo")
+
+
+def fuses_spectrum(parameters: "DeinterlaceParameters") -> bool:
+    """
+    Whether the spectrum of the backward-scanned lines calculated while estimating
+    the offset of each block is retained and reused to align the block (i.e., the
+    lines are only transformed once per block).
+
+    :param parameters: The parameters of the deinterlacing.
+    :returns: Whether the estimation and alignment are fused.
+    """
+    return (
+        parameters.align == "subpixel"
+        and parameters.interpolation == "fft"
+        and parameters.pool is None
+        and parameters.stride == 1
+        and parameters.rows is None
+        and parameters.columns is None
+        and parameters.channel is None
+        and parameters.probe_interval is None
+        and not parameters.use_gpu
+    )
+
+
+def pixel_cost(
+    parameters: "DeinterlaceParameters", dtype: DTypeLike
+) -> tuple[float, float]:
+    """
+    The memory (in bytes) required to deinterlace a block of images, per pixel of
+    the block and per pixel of a single frame, excluding the images themselves.
+
+    With `s` the itemsize of the images and `p` the itemsize of the `precision`, the
+    peak memory per pixel of the block is `W + max(E, T, A)`, where:
+
+    * `W` is the workspace of the estimation, which persists while the block is
+      aligned: `1.75p` (the backward lines, their magnitude, and the spectra of the
+      forward and backward lines), plus `0.5p` when the spectrum is retained (see
+      :func:`fuses_spectrum`). Pooled blocks only ever transform a single frame, so
+      `W` is zero.
+    * `E` is the extraction of the block: `s` for the "median" pool (which copies
+      the block), `p` for the "std" pool, and an additional `s` for pooled channels.
+    * `T` is the transient staging of single-precision transforms (`8` bytes), or
+      the result of each transform of the workspace (`0.5p`) when the FFT backend
+      does not write into the workspace natively (see
+      :class:`FFTBackend <deinterlacing.backends.FFTBackend>`).
+    * `A` is the alignment: `0.5s` for "pixel" (the overlapping shift), `0.5p` for
+      fused "subpixel", `1.5p` for other "subpixel" (the cast lines, their spectrum,
+      and the shifted lines), `1.25p + s` for "variable", and nothing for
+      interpolated "subpixel" (which is shifted in-place in small chunks).
+
+    A single frame (e.g., the pooled image, the offset matrices, or the transforms of
+    the pooled image) requires at most `4p` per pixel regardless of the size
+    of the block, plus `0.5p` when the FFT backend does not write into its output
+    natively. Interpolated "subpixel" alignment additionally requires three
+    cache-sized buffers regardless of the size of the frames (see
+    :func:`block_memory`).
+
+    :param parameters: The parameters of the deinterlacing.
+    :param dtype: The dtype of the images.
+    :returns: The bytes per pixel of the block and per pixel of a frame.
+    """
+    s = np.dtype(dtype).itemsize
+    p = np.dtype(parameters.precision).itemsize
+    fused = fuses_spectrum(parameters)
+
+    if parameters.pool is not None:
+        workspace = 0.0
+    else:
+        workspace = 1.75 * p + (0.5 * p if fused else 0.0)
+
+    extraction = {"median": s, "std": p}.get(parameters.pool, 0.0)
+    if isinstance(parameters.channel, str):
+        extraction += s
+
+    staging = _SINGLE_PRECISION_STAGING if p == 4 else 0.0
+    # NOTE: The transforms of a block (or of a frame) yield at most half the lines,
+    #  each with half the frequencies of complex values or every real value
+    copied = 0.5 * p if _copies_transforms(parameters) else 0.0
+    if workspace:
+        staging = max(staging, copied)
+
+    match parameters.align:
+        case "pixel":
+            alignment = 0.5 * s
+        case "subpixel" if parameters.interpolation != "fft":
+            alignment = 0.0
+        case "subpixel":
+            alignment = 0.5 * p if fused else 1.5 * p
+        case _:
+            alignment = 1.25 * p + s
+
+    return workspace + max(extraction, staging, alignment), 4.0 * p + copied
+
+
+def block_memory(
+    parameters: "DeinterlaceParameters",
+    shape: tuple[int, ...],
+    dtype: DTypeLike,
+    block_size: int,
+) -> int:
+    """
+    The memory (in bytes) required to deinterlace a block of images according to the
+    cost model of :func:`pixel_cost`.
+
+    :param parameters: The parameters of the deinterlacing.
+    :param shape: The shape of the images (frames, ..., rows, columns).
+    :param dtype: The dtype of the images.
+    :param block_size: The number of frames in the block.
+    :returns: The bytes required to deinterlace the block.
+    """
+    per_pixel, per_frame = pixel_cost(parameters, dtype)
+    pixels = prod(shape[1:])
+    memory = (per_pixel * block_size + per_frame) * pixels
+    return int(np.ceil(memory)) + _buffer_memory(parameters, shape)
+
+
+def available_memory() -> int:
+    """
+    The physical memory (in bytes) available without swapping, including the page
+    cache the kernel can reclaim. It is read from `MemAvailable` of `/proc/meminfo`
+    on linux or, on other platforms, from :func:`psutil.virtual_memory` if psutil is
+    installed. Otherwise, a conservative 1 GiB is assumed.
+
+    :returns: The available memory.
+    """
+    try:
+        with _MEMINFO.open() as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    # NOTE: The statistics are reported in kibibytes
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return _FALLBACK_AVAILABLE_MEMORY
+    return psutil.virtual_memory().available
+
+
+def max_block_size(
+    parameters: "DeinterlaceParameters",
+    shape: tuple[int, ...],
+    dtype: DTypeLike,
+    budget: int | None = None,
+    resident: int = 0,
+    *,
+    concurrent: bool = True,
+) -> int:
+    """
+    The largest block size whose memory (see :func:`block_memory`) fits within the
+    memory budget.
+
+    :param parameters: The parameters of the deinterlacing.
+    :param shape: The shape of the images (frames, ..., rows, columns).
+    :param dtype: The dtype of the images.
+    :param budget: The memory budget in bytes, or None to use the `memory_budget` of
+        the parameters ("auto" uses half of the available memory).
+    :param resident: Additional bytes per pixel of the block (e.g., when each block
+        is copied into memory from a file).
+    :param concurrent: Whether the blocks deinterlaced concurrently (see `workers`)
+        share the budget.
+    :returns: The block size, which is at least one frame and at most all frames.
+    """
+    budget = parameters.memory_budget if budget is None else budget
+    if budget == "auto":
+        budget = available_memory() // 2
+    if concurrent:
+        budget //= parameters.workers or 1
+    budget -= _buffer_memory(parameters, shape)
+    per_pixel, per_frame = pixel_cost(parameters, dtype)
+    pixels = prod(shape[1:])
+    block_size = int((budget / pixels - per_frame) // (per_pixel + resident))
+    return min(max(block_size, 1), shape[0])
+
+
+def _copies_transforms(parameters: "DeinterlaceParameters") -> bool:
+    # Whether the FFT backend allocates each transform and copies it into its output
+    # (on the GPU, the transforms never reside on the host)
+    if parameters.use_gpu or parameters.fft_backend not in available_fft_backends():
+        return False
+    fft_module = get_fft_backend(parameters.fft_backend, parameters.fft_workers)
+    return fft_module is not np and not getattr(fft_module, "native_out", False)
+
+
+def _buffer_memory(parameters: "DeinterlaceParameters", shape: tuple[int, ...]) -> int:
+    # The padded lines, products, and accumulator of the interpolated alignment (see
+    # interpolate_subpixel_offset), which hold at least one (padded) line each
+    if parameters.align != "subpixel" or parameters.interpolation == "fft":
+        return 0
+    itemsize = np.dtype(parameters.precision).itemsize
+    rows = max(_INTERPOLATION_CHUNK_BYTES // (shape[-1] * itemsize), 1)
+    return rows * (3 * shape[-1] + 6) * itemsize
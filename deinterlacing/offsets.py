@@ -1,6 +1,12 @@
-from typing import Literal
+from collections.abc import Iterator
+from dataclasses import dataclass
+from math import prod
+from pathlib import Path
+from threading import local
+from typing import Any, Literal
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from deinterlacing.tools import NDArrayLike
 
@@ -10,45 +16,66 @@ except ImportError:
     cp = np
 
 __all__ = [
+    "OffsetTrace",
+    "OffsetWorkspace",
+    "calculate_alignment_error",
+    "calculate_band_offset_matrices",
+    "calculate_offset_matrices",
     "calculate_offset_matrix",
+    "calculate_offset_matrix_and_spectrum",
     "find_pixel_offset",
+    "find_pixel_offsets",
     "find_subpixel_offset",
+    "find_subpixel_offsets",
+    "find_variable_offset",
+    "find_variable_offsets",
 ]
 
+#: Alignment error of lines that are perfectly anti-correlated or do not overlap
+_MAX_ALIGNMENT_ERROR = 2.0
+
 
 def find_pixel_offset(
     images: NDArrayLike,
     offset_matrix: NDArrayLike,
     subsearch: int,
 ) -> int:
+    # NOTE: A single offset matrix is simply a stack of one offset matrix, so the
+    #  semantics are defined once (see find_pixel_offsets)
+    return find_pixel_offsets(images, offset_matrix[np.newaxis, :], subsearch)[0]
+
+
+def find_pixel_offsets(
+    images: NDArrayLike,
+    offset_matrices: NDArrayLike,
+    subsearch: int,
+) -> np.ndarray:
+    """
+    Find the pixel offset of each offset matrix in a stack of offset matrices (e.g.,
+    one per frame or one per block) without looping over the matrices.
+
+    :param images: The images used to calculate the offset matrices.
+    :param offset_matrices: The offset matrices (..., width).
+    :param subsearch: The number of pixels to search on either side of the center.
+    :returns: The pixel offset of each offset matrix (...).
+    """
     # search only subspace to save computation time and avoid any artifacts from edge
     # of image. Extremely important for avoiding artifacts, not sure about about
     # performance impact in practice.
-    peak = np.argmax(
-        offset_matrix[
-            -subsearch + images.shape[-1] // 2 : images.shape[-1] // 2 + subsearch + 1
-        ]
-    )
+    center = images.shape[-1] // 2
+    window = offset_matrices[..., center - subsearch : center + subsearch + 1]
+    peaks = np.argmax(window, axis=-1)
 
     # If the image is very sparse, the peak here could be determined by the statistics
     # of PMT noise, which is unrelated to scanning artifacts. To avoid this, we can
     # check if the second highest peak is significantly lower than the zeroth peak in
     # the case that the calculated phase offset is 0
-    if peak == subsearch:
-        # argpart is log(n) complexity, so it is faster than sorting the entire array
-        pk0, pk1 = np.argpartition(
-            -offset_matrix[
-                -subsearch + images.shape[-1] // 2 : images.shape[-1] // 2
-                + subsearch
-                + 1
-            ],
-            2,
-        )[:2]
-        # If peak is +/- 1 from the first peak, it is likely not genuine
-        if (new_peak := pk1) - pk0 != 1:
-            peak = new_peak
-
-    return -(peak - subsearch)
+    # argpart is log(n) complexity, so it is faster than sorting the entire array
+    pk0, pk1 = np.moveaxis(np.argpartition(-window, 2, axis=-1)[..., :2], -1, 0)
+    # If peak is +/- 1 from the first peak, it is likely not genuine
+    peaks = np.where((peaks == subsearch) & (pk1 - pk0 != 1), pk1, peaks)
+
+    return -(peaks - subsearch)
 
 
 def find_subpixel_offset(
@@ -56,46 +83,506 @@ def find_subpixel_offset(
     offset_matrix: NDArrayLike,
     subsearch: int,
 ) -> float:
-    peak = find_pixel_offset(images, offset_matrix, subsearch)
-    if peak <= 0 or peak >= offset_matrix.shape[0] - 1:
-        return float(peak)  # Just a boundary check here; return it as is
+    # NOTE: A single offset matrix is simply a stack of one offset matrix, so the
+    #  semantics are defined once (see find_subpixel_offsets)
+    return find_subpixel_offsets(images, offset_matrix[np.newaxis, :], subsearch)[0]
+
+
+def find_subpixel_offsets(
+    images: NDArrayLike,
+    offset_matrices: NDArrayLike,
+    subsearch: int,
+) -> np.ndarray:
+    """
+    Find the subpixel offset of each offset matrix in a stack of offset matrices
+    (e.g., one per frame or one per block) without looping over the matrices.
+
+    :param images: The images used to calculate the offset matrices.
+    :param offset_matrices: The offset matrices (..., width).
+    :param subsearch: The number of pixels to search on either side of the center.
+    :returns: The subpixel offset of each offset matrix (...).
+    """
+    pixel_offsets = find_pixel_offsets(images, offset_matrices, subsearch)
+    # NOTE: Offsets are measured from the center, so the peak of each offset matrix
+    #  is at the index (center - offset)
+    peaks = offset_matrices.shape[-1] // 2 - pixel_offsets
+    # A displacement of the peak towards higher indices decreases the offset
+    return (pixel_offsets - _interpolate_peaks(offset_matrices, peaks)).astype(float)
+
+
+def _interpolate_peaks(offset_matrices: NDArrayLike, peaks: np.ndarray) -> np.ndarray:
+    # Displacement of the peak of each offset matrix from its index (...)
+    # Just a boundary check here; peaks at the boundary are returned as is
+    interior = (peaks > 0) & (peaks < offset_matrices.shape[-1] - 1)
 
     # this part is just a manual implementation of quadratic interpolation
     # to find sub-pixel offset. Something more sophisticated might be more appropriate,
     # but this is the first thing that came to mind.
-    y0, y1, y2 = offset_matrix[peak - 1], offset_matrix[peak], offset_matrix[peak + 1]
+    indices = np.clip(peaks, 1, offset_matrices.shape[-1] - 2)[..., np.newaxis]
+    y0, y1, y2 = (
+        np.take_along_axis(offset_matrices, indices + shift, axis=-1)[..., 0]
+        for shift in (-1, 0, 1)
+    )
     denominator = y0 - 2 * y1 + y2
-    if abs(denominator) < 1e-10:
-        # If the denominator is too close to zero, interpolation is not reliable.
-        return float(peak)
-    subpixel_offset = 0.5 * (y0 - y2) / denominator
-    return peak - subpixel_offset
+    # If the denominator is too close to zero, interpolation is not reliable.
+    reliable = interior & (np.abs(denominator) >= 1e-10)
+    displacement = 0.5 * (y0 - y2) / np.where(reliable, denominator, 1.0)
+    return np.where(reliable, displacement, 0.0)
 
 
-def calculate_offset_matrix(
-    images: NDArrayLike, fft_module: Literal[np, cp] = np
-) -> NDArrayLike:
+@dataclass(frozen=True, slots=True)
+class OffsetTrace:
+    """
+    Compact record of the offsets estimated for a stack of images (see
+    :func:`estimate_offsets <deinterlacing.estimate_offsets>`), such that they can be
+    applied to the images, or to any other images acquired alongside them, without
+    estimating them again (see :func:`apply_offsets <deinterlacing.apply_offsets>`).
+
+    :var starts: The index of the first frame of each block (blocks).
+    :var stops: The index after the last frame of each block (blocks).
+    :var offsets: The offset of each block (blocks), or the offset of each column of
+        each block (blocks, columns) when using the "variable" alignment.
+    :var align: The alignment the offsets were estimated for.
+    :var step: The stride between the frames of each block, which is the number of
+        interleaved planes (i.e., each block spans frames[start:stop:step]).
+    """
+
+    starts: np.ndarray
+    stops: np.ndarray
+    offsets: np.ndarray
+    align: Literal["pixel", "subpixel", "variable"] = "pixel"
+    step: int = 1
+
+    def __len__(self) -> int:
+        return self.starts.shape[0]
+
+    def __iter__(self) -> Iterator[tuple[int, int, int | float | np.ndarray]]:
+        for start, stop, offset in zip(
+            self.starts.tolist(), self.stops.tolist(), self.offsets, strict=True
+        ):
+            yield start, stop, offset.item() if offset.ndim == 0 else offset
+
+    @property
+    def frames(self) -> int:
+        """Number of frames spanned by the offsets."""
+        return int(self.stops.max(initial=0))
+
+    def framewise(self) -> np.ndarray:
+        """
+        Expand the offsets to the offset of each frame.
+
+        :returns: The offset of each frame (frames) or (frames, columns).
+        """
+        counts = (self.stops - self.starts + self.step - 1) // self.step
+        # Index of each frame of each block within its block
+        position = np.arange(counts.sum()) - np.repeat(counts.cumsum() - counts, counts)
+        frames = np.repeat(self.starts, counts) + self.step * position
+        framewise = np.zeros((self.frames, *self.offsets.shape[1:]), self.offsets.dtype)
+        framewise[frames] = np.repeat(self.offsets, counts, axis=0)
+        return framewise
+
+    def save(self, path: str | Path) -> Path:
+        """
+        Save the offsets to a numpy archive (.npz).
+
+        :param path: The path of the archive.
+        :returns: The path of the archive.
+        """
+        path = Path(path).with_suffix(".npz")
+        np.savez(
+            path,
+            starts=self.starts,
+            stops=self.stops,
+            offsets=self.offsets,
+            align=np.array(self.align),
+            step=np.array(self.step),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "OffsetTrace":
+        """
+        Load offsets saved by :meth:`save`.
+
+        :param path: The path of the archive.
+        :returns: The offsets.
+        """
+        with np.load(Path(path), allow_pickle=False) as archive:
+            return cls(
+                starts=archive["starts"],
+                stops=archive["stops"],
+                offsets=archive["offsets"],
+                align=str(archive["align"]),
+                step=int(archive["step"]) if "step" in archive else 1,
+            )
+
+
+class OffsetWorkspace:
+    """
+    Preallocated buffers for the calculation of offset matrices, such that the
+    spectra, magnitudes, and inverse transforms of each block are computed in-place
+    rather than allocating several block-sized temporaries per block. The buffers are
+    allocated for the first block and reused by every subsequent block of the same or
+    smaller size. Each thread is given its own buffers, so a single workspace can be
+    shared by concurrent blocks.
+
+    .. note::
+        Only the NumPy implementation uses a workspace.
+    """
+
+    def __init__(self) -> None:
+        self._local = local()
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the buffers allocated by the calling thread in bytes."""
+        return sum(buffer.nbytes for buffer in vars(self._local).values())
+
+    def clear(self) -> None:
+        """Release the buffers allocated by the calling thread."""
+        vars(self._local).clear()
+
+    def buffer(self, name: str, shape: tuple[int, ...], dtype: DTypeLike) -> np.ndarray:
+        """
+        Retrieve a buffer of the given shape and dtype, which is only (re)allocated
+        if the existing buffer is too small or of a different dtype.
+
+        :param name: The name of the buffer.
+        :param shape: The shape of the buffer.
+        :param dtype: The dtype of the buffer.
+        :returns: The (uninitialized) buffer.
+        """
+        size = prod(shape)
+        buffer = getattr(self._local, name, None)
+        if buffer is None or buffer.dtype != dtype or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            setattr(self._local, name, buffer)
+        return buffer[:size].reshape(shape)
+
+
+def _cross_power_spectra(
+    images: NDArrayLike,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+    *,
+    keep_spectrum: bool = False,
+    workspace: OffsetWorkspace | None = None,
+) -> tuple[NDArrayLike, NDArrayLike | None]:
+    # Returns the normalized cross-power spectrum of each pair of forward and
+    # backward lines and, if requested, the spectrum of the backward lines
+    if _in_workspace(fft_module, workspace):
+        return _cross_power_spectra_in_place(
+            images, fft_module, precision, keep_spectrum, workspace
+        )
+
     # offset used simply to avoid division by zero in normalization
     OFFSET = 1e-10  # noqa: N806
 
-    backward = fft_module.fft.fft(images[..., 1::2, :], axis=-1)
-    backward /= fft_module.abs(backward) + OFFSET
+    # NOTE: The images are real-valued, so the spectra are hermitian and only the
+    #  non-negative frequencies need to be computed (rfft). The inverse of their
+    #  product is real-valued by construction, so irfft yields the same correlation
+    #  as the full complex transform in half the time and memory.
+
+    # NOTE: Casting the lines (rather than letting the transform promote them) keeps
+    #  every intermediate in the requested precision (float32 -> complex64)
+    backward = fft_module.fft.rfft(
+        images[..., 1::2, :].astype(precision, copy=False), axis=-1
+    )
+    if keep_spectrum:
+        # Normalize out-of-place so the spectrum of the backward lines is retained
+        spectrum = backward
+        backward = backward / (fft_module.abs(backward) + OFFSET)
+    else:
+        spectrum = None
+        backward /= fft_module.abs(backward) + OFFSET
 
-    forward = fft_module.fft.fft(images[..., ::2, :], axis=-1)
+    forward = fft_module.fft.rfft(
+        images[..., ::2, :].astype(precision, copy=False), axis=-1
+    )
     fft_module.conj(forward, out=forward)
     forward /= fft_module.abs(forward) + OFFSET
     forward = forward[..., : backward.shape[-2], :]
 
+    backward *= forward
+    return backward, spectrum
+
+
+def _in_workspace(fft_module: Any, workspace: OffsetWorkspace | None) -> bool:
+    # The buffers of the workspace reside on the host, so they are used by every
+    # backend except cupy
+    return workspace is not None and (fft_module is not cp or cp is np)
+
+
+def _cross_power_spectra_in_place(
+    images: NDArrayLike,
+    fft_module: Any,
+    precision: Literal["float32", "float64"],
+    keep_spectrum: bool,  # noqa: FBT001
+    workspace: OffsetWorkspace,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    # NOTE: Identical to _cross_power_spectra, except that every block-sized
+    #  intermediate is written into the buffers of the workspace
+    OFFSET = 1e-10  # noqa: N806
+    width = images.shape[-1]
+    backward_lines = images[..., 1::2, :]
+    # The forward lines without a backward counterpart are never used
+    forward_lines = images[..., ::2, :][..., : backward_lines.shape[-2], :]
+    complex_dtype = np.result_type(precision, np.complex64)
+    lines_shape = backward_lines.shape
+    spectra_shape = (*lines_shape[:-1], width // 2 + 1)
+
+    lines = workspace.buffer("lines", lines_shape, precision)
+    magnitude = workspace.buffer("magnitude", spectra_shape, precision)
+    backward = workspace.buffer("backward", spectra_shape, complex_dtype)
+    forward = workspace.buffer("forward", spectra_shape, complex_dtype)
+
+    lines[...] = backward_lines
+    fft_module.fft.rfft(lines, axis=-1, out=backward)
+    np.abs(backward, out=magnitude)
+    magnitude += OFFSET
+    if keep_spectrum:
+        # Normalize out-of-place so the spectrum of the backward lines is retained
+        spectrum = backward
+        backward = workspace.buffer("normalized", spectra_shape, complex_dtype)
+        np.divide(spectrum, magnitude, out=backward)
+    else:
+        spectrum = None
+        backward /= magnitude
+
+    lines[...] = forward_lines
+    fft_module.fft.rfft(lines, axis=-1, out=forward)
+    np.conj(forward, out=forward)
+    np.abs(forward, out=magnitude)
+    magnitude += OFFSET
+    forward /= magnitude
+
+    backward *= forward
+    return backward, spectrum
+
+
+def _offset_matrices(
+    images: NDArrayLike,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+    *,
+    keep_spectrum: bool = False,
+    workspace: OffsetWorkspace | None = None,
+) -> tuple[NDArrayLike, NDArrayLike | None]:
+    width = images.shape[-1]
+    cross_power, spectrum = _cross_power_spectra(
+        images,
+        fft_module,
+        precision,
+        keep_spectrum=keep_spectrum,
+        workspace=workspace,
+    )
     # inverse
-    comp_conj = fft_module.fft.ifft(backward * forward, axis=-1)
-    comp_conj = fft_module.real(comp_conj)
-    if comp_conj.ndim == 3:
-        comp_conj = comp_conj.mean(axis=1)
-    if comp_conj.ndim == 2:
-        comp_conj = comp_conj.mean(axis=0)
-    return fft_module.fft.ifftshift(comp_conj)
+    if _in_workspace(fft_module, workspace):
+        comp_conj = workspace.buffer(
+            "lines", (*cross_power.shape[:-1], width), precision
+        )
+        fft_module.fft.irfft(cross_power, n=width, axis=-1, out=comp_conj)
+    else:
+        comp_conj = fft_module.fft.irfft(cross_power, n=width, axis=-1)
+    return fft_module.fft.ifftshift(comp_conj.mean(axis=-2), axes=-1), spectrum
     # REVIEW: Should this be ifftshift or fftshift?
 
 
-def find_variable_offset(images: np.ndarray) -> 0:
-    print(f"{images.shape=}")
+def calculate_offset_matrices(
+    images: NDArrayLike,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+    workspace: OffsetWorkspace | None = None,
+) -> NDArrayLike:
+    """
+    Calculate the offset matrix of each frame (or of each frame and channel) rather
+    than a single offset matrix for all the images. The offset matrix of all the
+    images is simply the mean of these matrices, so the frames are transformed in a
+    single batch rather than individually.
+
+    :param images: The images (..., rows, columns).
+    :param fft_module: The module used to calculate the fourier transforms.
+    :param precision: The floating-point precision of the calculation.
+    :param workspace: Preallocated buffers reused across calls.
+    :returns: The offset matrices (..., columns).
+    """
+    offset_matrices, _ = _offset_matrices(
+        images, fft_module, precision, workspace=workspace
+    )
+    return offset_matrices
+
+
+def calculate_offset_matrix(
+    images: NDArrayLike,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+    workspace: OffsetWorkspace | None = None,
+) -> NDArrayLike:
+    offset_matrices = calculate_offset_matrices(
+        images, fft_module, precision, workspace
+    )
+    return offset_matrices.reshape(-1, offset_matrices.shape[-1]).mean(axis=0)
+
+
+def calculate_offset_matrix_and_spectrum(
+    images: NDArrayLike,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+    workspace: OffsetWorkspace | None = None,
+) -> tuple[NDArrayLike, NDArrayLike]:
+    """
+    Calculate the offset matrix of the images while retaining the (unnormalized)
+    spectrum of their backward-scanned lines, such that the lines can subsequently
+    be shifted without transforming them again (see
+    :func:`align_subpixels <deinterlacing.alignment.align_subpixels>`).
+
+    :param images: The images (..., rows, columns).
+    :param fft_module: The module used to calculate the fourier transforms.
+    :param precision: The floating-point precision of the calculation.
+    :param workspace: Preallocated buffers reused across calls. The returned
+        spectrum is then one of these buffers, so it is only valid until the next
+        call using the same workspace.
+    :returns: The offset matrix (columns) and the spectrum of the backward-scanned
+        lines (..., rows // 2, columns // 2 + 1).
+    """
+    offset_matrices, spectrum = _offset_matrices(
+        images, fft_module, precision, keep_spectrum=True, workspace=workspace
+    )
+    offset_matrix = offset_matrices.reshape(-1, offset_matrices.shape[-1]).mean(axis=0)
+    return offset_matrix, spectrum
+
+
+def calculate_band_offset_matrices(
+    images: NDArrayLike,
+    bands: int,
+    fft_module: Literal[np, cp] = np,
+    precision: Literal["float32", "float64"] = "float64",
+    workspace: OffsetWorkspace | None = None,
+) -> NDArrayLike:
+    """
+    Calculate the offset matrix of each frame within each of several bands of columns.
+    Any remaining columns (i.e., if the width is not divisible by the number of
+    bands) are excluded.
+
+    :param images: The images (..., rows, columns).
+    :param bands: The number of bands of columns.
+    :param fft_module: The module used to calculate the fourier transforms.
+    :param precision: The floating-point precision of the calculation.
+    :param workspace: Preallocated buffers reused across calls.
+    :returns: The offset matrices (..., bands, columns // bands).
+    """
+    band_width = images.shape[-1] // bands
+    banded = images[..., : bands * band_width].reshape(
+        *images.shape[:-1], bands, band_width
+    )
+    # (..., rows, bands, band_width) -> (..., bands, rows, band_width)
+    banded = fft_module.moveaxis(banded, -2, -3)
+    return calculate_offset_matrices(banded, fft_module, precision, workspace)
+
+
+def _fit_variable_offsets(
+    band_offsets: np.ndarray, band_width: int, width: int
+) -> np.ndarray:
+    # NOTE: The velocity of a resonant scanner is sinusoidal across the field of view,
+    #  so the offset is smoothly varying. A low-order polynomial is fit to the offset
+    #  at the center of each band (all frames at once), and evaluated at every column.
+    bands = band_offsets.shape[-1]
+    degree = min(2, bands - 1)
+    centers = (np.arange(bands) + 0.5) * band_width - 0.5
+    flattened = band_offsets.reshape(-1, bands)
+    coefficients = np.polyfit(centers, flattened.T, degree)
+    offsets = np.vander(np.arange(width), degree + 1) @ coefficients
+    return offsets.T.reshape(*band_offsets.shape[:-1], width)
+
+
+def find_variable_offsets(
+    images: NDArrayLike,
+    offset_matrices: NDArrayLike,
+    subsearch: int,
+) -> np.ndarray:
+    """
+    Find the field-dependent offset of each set of band offset matrices (e.g., one
+    per frame) without looping over them. See :func:`find_variable_offset`.
+
+    :param images: The images used to calculate the offset matrices.
+    :param offset_matrices: The band offset matrices (..., bands, band_width).
+    :param subsearch: The number of pixels to search on either side of the center.
+        Limited to half the width of each band.
+    :returns: The offset of each column (..., columns).
+    """
+    band_width = offset_matrices.shape[-1]
+    # NOTE: The peak finders only use the images to determine the width of the offset
+    #  matrices, which is the width of the bands here
+    band_offsets = find_subpixel_offsets(
+        offset_matrices, offset_matrices, min(subsearch, band_width // 2 - 1)
+    )
+    return _fit_variable_offsets(band_offsets, band_width, images.shape[-1])
+
+
+def find_variable_offset(
+    images: NDArrayLike,
+    offset_matrices: NDArrayLike,
+    subsearch: int,
+) -> np.ndarray:
+    """
+    Find the field-dependent offset of the images. Because the velocity of resonant
+    scanners is sinusoidal, the offset between the forward and backward-scanned lines
+    varies across the field of view. The subpixel offset of each band of columns is
+    found from the band offset matrices (see :func:`calculate_band_offset_matrices`)
+    and a smoothly-varying offset is fit to the bands and evaluated at each column.
+
+    :param images: The images used to calculate the offset matrices.
+    :param offset_matrices: The band offset matrices (..., bands, band_width).
+    :param subsearch: The number of pixels to search on either side of the center.
+        Limited to half the width of each band.
+    :returns: The offset of each column (columns).
+    """
+    bands, band_width = offset_matrices.shape[-2:]
+    offset_matrices = offset_matrices.reshape(-1, bands, band_width).mean(axis=0)
+    return find_variable_offsets(images, offset_matrices, subsearch)
+
+
+def calculate_alignment_error(
+    images: NDArrayLike,
+    offset: float | np.ndarray,
+) -> float:
+    """
+    Calculate a cheap measure of how poorly the forward and backward-scanned lines
+    would be aligned by the provided offset. The images are averaged into a single
+    frame, the backward-scanned lines are shifted by the (discretized) offset, and
+    the error is one minus the correlation between the overlapping portions of the
+    forward and backward-scanned lines. No fourier transforms are required, so this
+    is suitable for detecting drift in the offset between full estimations.
+
+    :param images: The images to evaluate.
+    :param offset: The offset that would be used to align the images, or the offset
+        of each column (columns) for the "variable" alignment.
+    :returns: The alignment error (0 is perfectly correlated, 2 is perfectly
+        anti-correlated or not overlapping).
+    """
+    mean_image = images.reshape(-1, *images.shape[-2:]).mean(axis=0)
+    backward = mean_image[1::2, :]
+    forward = mean_image[::2, :][: backward.shape[0], :]
+    width = mean_image.shape[-1]
+    if np.ndim(offset) > 0:
+        # NOTE: Each forward column is paired with the backward column displaced by
+        #  its own offset (see align_variable)
+        columns = np.arange(width)
+        sources = columns - np.rint(np.asarray(offset)).astype(int)
+        overlapping = (sources >= 0) & (sources < width)
+        if not overlapping.any():
+            return _MAX_ALIGNMENT_ERROR
+        forward = forward[:, columns[overlapping]]
+        backward = backward[:, sources[overlapping]]
+    elif abs(shift := round(offset)) >= width:
+        # NOTE: The lines would not overlap at all (e.g., a spurious estimate)
+        return _MAX_ALIGNMENT_ERROR
+    elif shift > 0:
+        forward, backward = forward[:, shift:], backward[:, :-shift]
+    elif shift < 0:
+        forward, backward = forward[:, :shift], backward[:, -shift:]
+    forward = forward - forward.mean()
+    backward = backward - backward.mean()
+    # offset used simply to avoid division by zero in normalization
+    denominator = np.sqrt((forward * forward).sum() * (backward * backward).sum())
+    return float(1.0 - (forward * backward).sum() / (denominator + 1e-10))
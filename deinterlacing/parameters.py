@@ -6,6 +6,8 @@ import numpy as np
 from pydantic import ConfigDict, Field, field_validator
 from pydantic.dataclasses import dataclass
 
+from deinterlacing.backends import available_fft_backends
+from deinterlacing.memory import max_block_size
 from deinterlacing.tools import NDArrayLike
 
 try:
@@ -34,6 +36,50 @@ class DeinterlaceParameters:
     :var has_turnaround: f
     :var null_edges: f
     :var use_gpu: f
+    :var precision: Floating-point precision of all intermediate calculations.
+        Single-precision ("float32") halves the memory required by each block.
+    :var workers: Number of blocks deinterlaced concurrently on a thread pool.
+    :var executor: Whether concurrent blocks are deinterlaced by threads or processes.
+    :var probe_interval: Maximum number of blocks between full estimations of the
+        offset. Between estimations, the last offset is reused unless drift is
+        detected. None estimates the offset of every block.
+    :var drift_tolerance: Relative increase in alignment error (see
+        :func:`calculate_alignment_error
+        <deinterlacing.offsets.calculate_alignment_error>`) tolerated before the
+        offset is re-estimated.
+    :var bands: Number of bands of columns in which the offset is estimated when
+        using the "variable" alignment.
+    :var interpolation: How the backward-scanned lines are shifted when using the
+        "subpixel" alignment: by a phase shift in the fourier domain ("fft") or by
+        a short linear, cubic, or windowed-sinc ("lanczos") interpolation kernel.
+    :var stride: Only every `stride`-th frame of each block is used to estimate its
+        offset (all frames are still aligned).
+    :var rows: Band of rows (start, stop) used to estimate the offset, or "auto" to
+        select the quarter of the rows with the most signal in each block. The band
+        must begin on a forward-scanned (even) row. All rows are still aligned.
+    :var columns: Window of columns (start, stop) used to estimate the offset (e.g.,
+        to exclude the turnaround at the edges of the field of view). All columns
+        are still aligned.
+    :var channel: The reference channel used to estimate the offsets of multichannel
+        images (frames, channels, rows, columns), or the pooling of the channels
+        ("mean", "median", "std", or "sum") into a single reference channel. None
+        estimates the offsets from all channels. The offsets are always applied to
+        all channels.
+    :var planes: Number of interleaved planes of volumetric acquisitions (i.e., frames
+        cycle through the planes). Each plane is deinterlaced independently with its
+        own offsets, and the `block_size` and `unstable` frames apply per plane.
+    :var fft_backend: Library calculating the fourier transforms on the CPU ("numpy",
+        "scipy", "pyfftw", or any backend registered using
+        :func:`register_fft_backend <deinterlacing.backends.register_fft_backend>`).
+        Unused when `use_gpu` is True.
+    :var fft_workers: Number of threads used by each fourier transform of the
+        "scipy" and "pyfftw" backends. None uses every core.
+    :var progress: Whether a progress bar is displayed (e.g., disable for headless
+        batch jobs).
+    :var memory_budget: Memory (in bytes) available for deinterlacing, or "auto" for
+        half of the available memory. If the `block_size` is None, it is set to the
+        largest block size that fits within the budget (see
+        :func:`pixel_cost <deinterlacing.memory.pixel_cost>`). None uses all frames.
     :var images: f
     """
 
@@ -45,13 +91,40 @@ class DeinterlaceParameters:
     # has_turnaround: bool = False
     # null_edges: bool = False
     use_gpu: bool = False
+    precision: Literal["float32", "float64"] = "float64"
+    workers: int | None = None
+    executor: Literal["thread", "process"] = "thread"
+    probe_interval: int | None = None
+    drift_tolerance: float = 0.1
+    bands: int = 4
+    interpolation: Literal["fft", "linear", "cubic", "lanczos"] = "fft"
+    stride: int = 1
+    rows: tuple[int, int] | Literal["auto"] | None = None
+    columns: tuple[int, int] | None = None
+    channel: int | Literal["mean", "median", "std", "sum"] | None = None
+    planes: int = 1
+    fft_backend: str = "numpy"
+    fft_workers: int | None = None
+    progress: bool = True
+    memory_budget: int | Literal["auto"] | None = None
     images: InitVar[NDArrayLike | None] = None
 
     def __post_init__(self, images: NDArrayLike | None) -> None:
         if images is not None:
             self.validate_with_images(images)
 
-    @field_validator("block_size", "unstable", "subsearch", mode="after")
+    @field_validator(
+        "block_size",
+        "unstable",
+        "subsearch",
+        "workers",
+        "probe_interval",
+        "bands",
+        "stride",
+        "planes",
+        "fft_workers",
+        mode="after",
+    )
     @classmethod
     def _validate_positive_integer(cls, value: int | None, ctx: Field) -> int | None:
         """
@@ -64,6 +137,34 @@ class DeinterlaceParameters:
             raise ParameterError(parameter=ctx.field_name, value=value, limits=(0, inf))
         return value
 
+    @field_validator("memory_budget", mode="after")
+    @classmethod
+    def _validate_memory_budget(
+        cls, value: int | Literal["auto"] | None, ctx: Field
+    ) -> int | Literal["auto"] | None:
+        """
+        Validate that the memory budget is positive, "auto", or None.
+
+        :param value: The value to validate.
+        :returns: The validated value.
+        """
+        if isinstance(value, int) and value <= 0:
+            raise ParameterError(parameter=ctx.field_name, value=value, limits=(0, inf))
+        return value
+
+    @field_validator("drift_tolerance", mode="after")
+    @classmethod
+    def _validate_non_negative(cls, value: float, ctx: Field) -> float:
+        """
+        Validate that the given value is non-negative.
+
+        :param value: The value to validate.
+        :returns: The validated value.
+        """
+        if value < 0:
+            raise ParameterError(parameter=ctx.field_name, value=value, limits=(0, inf))
+        return value
+
     def validate_with_images(self, images: NDArrayLike) -> None:
         """
         Validate the parameters against the provided images..
@@ -71,40 +172,138 @@ class DeinterlaceParameters:
         :param images: The images to validate against.
         :returns: None
         """
+        # DIMENSIONS
+        if images.ndim not in {3, 4}:
+            msg = (
+                "The images must be either (frames, rows, columns) or "
+                "(frames, channels, rows, columns)."
+            )
+            raise ValueError(msg)
+
+        # PLANES
+        if self.planes > images.shape[0]:
+            raise ParameterError(
+                parameter="planes", value=self.planes, limits=(1, images.shape[0])
+            )
+        # NOTE: Blocks never span planes, so the frames of the shortest plane bound
+        #  the block size and unstable frames
+        frames = images.shape[0] // self.planes
+
         # BLOCK SIZE
+        if self.block_size is None and self.memory_budget is not None:
+            self.block_size = max_block_size(
+                self, (frames, *images.shape[1:]), images.dtype
+            )
         if self.block_size is None:
-            self.block_size = images.shape[0]
-        if self.block_size > images.shape[0]:
+            self.block_size = frames
+        if self.block_size > frames:
             raise ParameterError(
                 parameter="block_size",
                 value=self.block_size,
-                limits=(1, images.shape[0]),
+                limits=(1, frames),
             )
 
         # SUBSEARCH
         if self.subsearch is None:
-            min_dim = min(images.shape[1:])  # Get the minimum spatial dimension
+            min_dim = min(images.shape[-2:])  # Get the minimum spatial dimension
             self.subsearch = min_dim // 16
-        if self.subsearch > min(images.shape[1:]):
+        if self.subsearch > min(images.shape[-2:]):
             raise ParameterError(
                 parameter="subsearch",
                 value=self.subsearch,
-                limits=(1, min(images.shape[1:]) - 1),
+                limits=(1, min(images.shape[-2:]) - 1),
             )
 
+        # BANDS
+        # NOTE: Each band must be wide enough to search at least one pixel on either
+        #  side of its center
+        if self.align == "variable" and self.bands > images.shape[-1] // 4:
+            raise ParameterError(
+                parameter="bands",
+                value=self.bands,
+                limits=(1, images.shape[-1] // 4),
+            )
+
+        # REGION OF INTEREST
+        height, width = images.shape[-2:]
+        if isinstance(self.rows, tuple):
+            if not 0 <= self.rows[0] < self.rows[1] <= height:
+                raise ParameterError(
+                    parameter="rows", value=self.rows, limits=(0, height)
+                )
+            if self.rows[0] % 2 or self.rows[1] - self.rows[0] < 2:
+                msg = (
+                    "The rows used to estimate the offset must begin on a "
+                    "forward-scanned (even) row and include at least one pair of lines."
+                )
+                raise ValueError(msg)
+        if self.columns is not None:
+            if not 0 <= self.columns[0] < self.columns[1] <= width:
+                raise ParameterError(
+                    parameter="columns", value=self.columns, limits=(0, width)
+                )
+            if self.columns[1] - self.columns[0] <= 2 * self.subsearch:
+                msg = (
+                    "The columns used to estimate the offset must span more than "
+                    "twice the subsearch."
+                )
+                raise ValueError(msg)
+            if self.align == "variable":
+                msg = "A window of columns cannot be used with the variable alignment."
+                raise ValueError(msg)
+
+        # CHANNEL
+        if self.channel is not None:
+            if images.ndim != 4:
+                msg = (
+                    "A reference channel requires multichannel images "
+                    "(frames, channels, rows, columns)."
+                )
+                raise ValueError(msg)
+            if (
+                isinstance(self.channel, int)
+                and not 0 <= self.channel < images.shape[1]
+            ):
+                raise ParameterError(
+                    parameter="channel",
+                    value=self.channel,
+                    limits=(0, images.shape[1] - 1),
+                )
+
         # UNSTABLE
-        if self.unstable is not None and self.unstable > images.shape[0]:
+        if self.unstable is not None and self.unstable > frames:
             raise ParameterError(
                 parameter="unstable",
                 value=self.unstable,
-                limits=(0, images.shape[0]),
+                limits=(0, frames),
             )
 
+        # EXECUTOR
+        if self.use_gpu and self.executor == "process":
+            msg = "GPU acceleration cannot be used with the process executor."
+            raise ValueError(msg)
+
+        # PROBE INTERVAL
+        if self.probe_interval is not None and (self.workers or 1) > 1:
+            msg = (
+                "Adaptive re-estimation (probe_interval) depends on the previous "
+                "block and cannot be used with multiple workers."
+            )
+            raise ValueError(msg)
+
         # USE GPU
         if self.use_gpu and cp == np:
             msg = "CuPy is not available. GPU acceleration cannot be used."
             raise ValueError(msg)
 
+        # FFT BACKEND
+        if not self.use_gpu and self.fft_backend not in available_fft_backends():
+            msg = (
+                f"The '{self.fft_backend}' FFT backend is not available. Available "
+                f"backends are {', '.join(map(repr, available_fft_backends()))}."
+            )
+            raise ValueError(msg)
+
 
 class ParameterError(ValueError):
     """Custom exception for parameter validation errors in deinterlacing."""
@@ -1,23 +1,58 @@
-from collections.abc import Callable
+import mmap
+from collections.abc import Callable, Generator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import replace
 from functools import partial
+from itertools import chain, islice
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Literal
 
 import numpy as np
+from boltons.iterutils import chunk_ranges
+from numpy.typing import DTypeLike
 from tqdm import tqdm
 
-from deinterlacing.alignment import align_pixels, align_subpixels
+from deinterlacing.alignment import (
+    align_pixels,
+    align_pixels_framewise,
+    align_subpixels,
+    align_subpixels_framewise,
+    align_subpixels_interpolated,
+    align_subpixels_interpolated_framewise,
+    align_variable,
+)
+from deinterlacing.backends import get_fft_backend
+from deinterlacing.instrumentation import BlockMetrics, Observer
+from deinterlacing.memory import fuses_spectrum, max_block_size
 from deinterlacing.offsets import (
+    OffsetTrace,
+    OffsetWorkspace,
+    calculate_alignment_error,
+    calculate_band_offset_matrices,
+    calculate_offset_matrices,
     calculate_offset_matrix,
+    calculate_offset_matrix_and_spectrum,
     find_pixel_offset,
+    find_pixel_offsets,
     find_subpixel_offset,
+    find_subpixel_offsets,
+    find_variable_offset,
+    find_variable_offsets,
 )
 from deinterlacing.parameters import DeinterlaceParameters
 from deinterlacing.tools import (
     NDArrayLike,
     compose,
+    crop_image_block,
+    extract_channel,
     extract_image_block,
     index_image_blocks,
     wrap_cupy,
 )
+from deinterlacing.tuning import tuned_parameters
 
 try:
     import cupy as cp
@@ -26,58 +61,434 @@ except ImportError:
 
 
 __all__ = [
+    "apply_offsets",
     "deinterlace",
+    "deinterlace_file",
+    "estimate_offsets",
 ]
 
 
+class _AdaptiveOffset:
+    """
+    Stateful wrapper of an offset calculation that only fully estimates the offset on
+    sparse probe blocks. The scan phase offset is typically constant for thousands of
+    frames, so the last offset is reused for the following blocks as long as the
+    (fourier-free) alignment error it yields stays within the tolerance of the error
+    at the last probe. Once drift is detected the offset is re-estimated immediately.
+
+    .. note::
+        Blocks must be provided in order, so this is not compatible with concurrent
+        workers.
+    """
+
+    def __init__(
+        self, calculate_offset: Callable, parameters: DeinterlaceParameters
+    ) -> None:
+        self.calculate_offset = calculate_offset
+        self.probe_interval = parameters.probe_interval
+        self.drift_tolerance = parameters.drift_tolerance
+        self.estimations = 0
+        self.offset = None
+        self.reference = None
+        self.since_probe = 0
+
+    def __call__(self, images: NDArrayLike) -> float:
+        if self.offset is not None and self.since_probe < self.probe_interval - 1:
+            error = calculate_alignment_error(images, self.offset)
+            if error <= self.reference * (1.0 + self.drift_tolerance):
+                self.since_probe += 1
+                return self.offset
+        self.offset = self.calculate_offset(images)
+        self.reference = calculate_alignment_error(images, self.offset)
+        self.estimations += 1
+        self.since_probe = 0
+        return self.offset
+
+
+class _SpectralOffset:
+    """
+    Offset calculation for the subpixel alignment of unpooled blocks on the CPU that
+    retains the spectrum of the backward-scanned lines, such that the lines are only
+    transformed once per block (see _deinterlace_block). When called directly it
+    simply calculates the offset.
+    """
+
+    def __init__(self, find_peak: Callable, parameters: DeinterlaceParameters) -> None:
+        self.find_peak = find_peak
+        self.fft_module = get_fft_backend(
+            parameters.fft_backend, parameters.fft_workers
+        )
+        self.precision = parameters.precision
+        self.workspace = OffsetWorkspace()
+
+    def __call__(self, images: NDArrayLike) -> float:
+        offset_matrix = calculate_offset_matrix(
+            images, self.fft_module, self.precision, self.workspace
+        )
+        return self.find_peak(images, offset_matrix)
+
+    def estimate(self, images: NDArrayLike) -> tuple[float, np.ndarray]:
+        # NOTE: The spectrum is a buffer of the workspace, so it must be consumed
+        #  before the next block is estimated by this thread
+        offset_matrix, spectrum = calculate_offset_matrix_and_spectrum(
+            images, self.fft_module, self.precision, self.workspace
+        )
+        return self.find_peak(images, offset_matrix), spectrum
+
+
+def _matrix_dispatcher(
+    parameters: DeinterlaceParameters, *, batch: bool = False
+) -> Callable:
+    # Set implementation for calculating offset matrices. When batched, a matrix is
+    # calculated for each frame rather than for the entire block.
+    match parameters.align:
+        case "variable":
+            calculate_matrix = partial(
+                calculate_band_offset_matrices, bands=parameters.bands
+            )
+        case _ if batch:
+            calculate_matrix = calculate_offset_matrices
+        case _:
+            calculate_matrix = calculate_offset_matrix
+    match parameters.use_gpu:
+        case False:
+            # NOTE: The buffers of the workspace are reused by every block estimated
+            #  through this implementation (one set of buffers per thread)
+            return partial(
+                calculate_matrix,
+                fft_module=get_fft_backend(
+                    parameters.fft_backend, parameters.fft_workers
+                ),
+                precision=parameters.precision,
+                workspace=OffsetWorkspace(),
+            )
+        case True:
+            return wrap_cupy(
+                partial(
+                    calculate_matrix, fft_module=cp, precision=parameters.precision
+                ),
+                "images",
+            )
+
+
+def _estimator_dispatcher(
+    parameters: DeinterlaceParameters,
+) -> tuple[Callable, Callable]:
+    # Set implementations for estimating offsets. These are kept separate from the
+    # dispatcher so that estimators that accumulate offset matrices over time (e.g.,
+    # streaming) can calculate the matrix and find its peak independently.
+    match parameters.align:
+        case "pixel":
+            find_peak = partial(find_pixel_offset, subsearch=parameters.subsearch)
+        case "subpixel":
+            find_peak = partial(find_subpixel_offset, subsearch=parameters.subsearch)
+        case "variable":
+            find_peak = partial(find_variable_offset, subsearch=parameters.subsearch)
+        case _:  # pragma: no cover
+            msg = f"Invalid align='{parameters.align}'."
+            raise ValueError(msg)
+    return _matrix_dispatcher(parameters), find_peak
+
+
 def _dispatcher(parameters: DeinterlaceParameters) -> tuple[Callable, Callable]:
     # Set implementations for calculations
+    calculate_matrix, find_peak = _estimator_dispatcher(parameters)
+    calculate_offset = compose(calculate_matrix)(find_peak)
+    if parameters.probe_interval is not None:
+        calculate_offset = _AdaptiveOffset(calculate_offset, parameters)
+    elif fuses_spectrum(parameters):
+        # NOTE: Fuse the estimation and correction such that the spectrum of the
+        #  backward lines is reused (on the GPU it is cheaper to transform the lines
+        #  again than to move the spectrum between devices)
+        calculate_offset = _SpectralOffset(find_peak, parameters)
     match (parameters.align, parameters.use_gpu):
-        case ("pixel", False):
-            calculate_matrix = partial(calculate_offset_matrix, fft_module=np)
-            find_peak = partial(find_pixel_offset, subsearch=parameters.subsearch)
-            calculate_offset = compose(calculate_matrix)(find_peak)
+        case ("pixel", _):
             align_images = align_pixels
-        case ("pixel", True):
-            calculate_matrix = wrap_cupy(
-                partial(calculate_offset_matrix, fft_module=cp), "images"
+        case ("subpixel", _) if parameters.interpolation != "fft":
+            # NOTE: The interpolation kernels are short convolutions, so like the
+            #  pixel alignment they are performed on the CPU
+            align_images = partial(
+                align_subpixels_interpolated,
+                interpolation=parameters.interpolation,
+                precision=parameters.precision,
             )
-            find_peaks = partial(find_pixel_offset, subsearch=parameters.subsearch)
-            calculate_offset = compose(calculate_matrix)(find_peaks)
-            align_images = align_pixels
         case ("subpixel", False):
-            calculate_matrix = partial(calculate_offset_matrix, fft_module=np)
-            find_peak = partial(find_subpixel_offset, subsearch=parameters.subsearch)
-            calculate_offset = compose(calculate_matrix)(find_peak)
-            align_images = partial(align_subpixels, fft_module=np)
+            align_images = partial(
+                align_subpixels,
+                fft_module=get_fft_backend(
+                    parameters.fft_backend, parameters.fft_workers
+                ),
+                precision=parameters.precision,
+            )
         case ("subpixel", True):
-            calculate_matrix = wrap_cupy(
-                partial(calculate_offset_matrix, fft_module=cp), "images"
+            align_images = partial(
+                align_subpixels, fft_module=cp, precision=parameters.precision
             )
-            find_peak = partial(find_subpixel_offset, subsearch=parameters.subsearch)
-            calculate_offset = compose(calculate_matrix)(find_peak)
-            align_images = partial(align_subpixels, fft_module=cp)
-        # case ("variable", False):
-        #    calculate_offset = print
-        #    align_images = print
-        # case ("variable", True):
-        #    calculate_offset = print
-        #    align_images = print
+        case ("variable", _):
+            # NOTE: The field-dependent shift is a gather, so like the pixel alignment
+            #  it is performed on the CPU
+            align_images = partial(align_variable, precision=parameters.precision)
         case _:  # pragma: no cover
             # NOTE: This should never be reached due to the validation in
             #  DeinterlaceParameters
             msg = (
                 f"Invalid combination of align='{parameters.align}' and use_gpu={parameters.use_gpu}. "
-                "Align must be either 'pixel' or 'subpixel', and use_gpu must be a boolean."
+                "Align must be either 'pixel', 'subpixel', or 'variable', and use_gpu must be a boolean."
             )
             raise ValueError(msg)
 
     return calculate_offset, align_images
 
 
+def _batch_dispatcher(parameters: DeinterlaceParameters) -> tuple[Callable, Callable]:
+    # Set implementations for deinterlacing each frame individually (e.g., the
+    # unstable frames) using batches of frames rather than one frame at a time
+    match (parameters.align, parameters.use_gpu):
+        case ("pixel", _):
+            find_peaks = partial(find_pixel_offsets, subsearch=parameters.subsearch)
+            align_frames = align_pixels_framewise
+        case ("subpixel", _) if parameters.interpolation != "fft":
+            find_peaks = partial(find_subpixel_offsets, subsearch=parameters.subsearch)
+            align_frames = partial(
+                align_subpixels_interpolated_framewise,
+                interpolation=parameters.interpolation,
+                precision=parameters.precision,
+            )
+        case ("subpixel", False):
+            find_peaks = partial(find_subpixel_offsets, subsearch=parameters.subsearch)
+            align_frames = partial(
+                align_subpixels_framewise,
+                fft_module=get_fft_backend(
+                    parameters.fft_backend, parameters.fft_workers
+                ),
+                precision=parameters.precision,
+            )
+        case ("subpixel", True):
+            find_peaks = partial(find_subpixel_offsets, subsearch=parameters.subsearch)
+            align_frames = partial(
+                align_subpixels_framewise,
+                fft_module=cp,
+                precision=parameters.precision,
+            )
+        case ("variable", _):
+            find_peaks = partial(find_variable_offsets, subsearch=parameters.subsearch)
+            align_frames = partial(align_variable, precision=parameters.precision)
+        case _:  # pragma: no cover
+            msg = f"Invalid align='{parameters.align}'."
+            raise ValueError(msg)
+    calculate_matrices = _matrix_dispatcher(parameters, batch=True)
+
+    def calculate_frame_matrices(images: NDArrayLike) -> NDArrayLike:
+        # NOTE: The matrices of each channel of multichannel frames are averaged
+        matrices = calculate_matrices(images)
+        return matrices.mean(axis=1) if images.ndim == 4 else matrices
+
+    return compose(calculate_frame_matrices)(find_peaks), align_frames
+
+
+def _deinterlace_frames(
+    images: NDArrayLike,
+    start: int,
+    stop: int,
+    parameters: DeinterlaceParameters,
+    calculate_offsets: Callable,
+    align_frames: Callable,
+) -> list[BlockMetrics]:
+    # NOTE: Each frame is deinterlaced individually, but the offsets of up to
+    #  block_size frames are estimated in a single batch of fourier transforms and
+    #  applied in a single vectorized operation. Pooling a single frame is (at best)
+    #  the identity, so pool is not applied here.
+    metrics = []
+    for batch_start, batch_stop in chunk_ranges(
+        stop - start, parameters.block_size, input_offset=start
+    ):
+        extracted = perf_counter()
+        frames = _estimation_frames(images, batch_start, batch_stop, parameters)
+        estimated = perf_counter()
+        offsets = calculate_offsets(frames)
+        aligned = perf_counter()
+        align_frames(images, batch_start, batch_stop, offsets)
+        metrics.append(
+            BlockMetrics(
+                start=batch_start,
+                stop=batch_stop,
+                offset=offsets,
+                nbytes=images[batch_start:batch_stop, ...].nbytes,
+                extraction=estimated - extracted,
+                estimation=aligned - estimated,
+                alignment=perf_counter() - aligned,
+                unstable=True,
+            )
+        )
+    return metrics
+
+
+def _estimation_block(
+    images: NDArrayLike, start: int, stop: int, parameters: DeinterlaceParameters
+) -> NDArrayLike:
+    # The (pooled, strided, reference channel, and cropped) block of images used to
+    # estimate the offset of the block
+    block_images = extract_image_block(
+        images, start, stop, parameters.pool, parameters.precision, parameters.stride
+    )
+    block_images = extract_channel(
+        block_images, parameters.channel, parameters.precision
+    )
+    return crop_image_block(block_images, parameters.rows, parameters.columns)
+
+
+def _estimation_frames(
+    images: NDArrayLike, start: int, stop: int, parameters: DeinterlaceParameters
+) -> NDArrayLike:
+    # The (reference channel and cropped) frames used to estimate the offset of each
+    # frame individually
+    frames = extract_channel(
+        images[start:stop, ...], parameters.channel, parameters.precision
+    )
+    return crop_image_block(frames, parameters.rows, parameters.columns)
+
+
+def _deinterlace_block(
+    images: NDArrayLike,
+    start: int,
+    stop: int,
+    parameters: DeinterlaceParameters,
+    calculate_offset: Callable,
+    align_images: Callable,
+) -> BlockMetrics:
+    # NOTE: We invoke a similar routine for ALL implementations:
+    #  (1) We extract a block of the provided images
+    #  (2) We calculate the offset/s necessary to correct deinterlacing artifacts
+    #  (3) We align the images such that the artifact is minimized or eliminated
+
+    # NOTE: Extraction isn't done inline due to the 'pool' parameter potentially
+    #  changing the shape of the images being processed. In some cases this means
+    #  the returned block_images will not be views of the original images, but
+    #  currently this only occurs when reducing the number of frames to process
+    #  through pool.If adding a feature here in the future (e.g., upscaling), one
+    #  will need to remember this is no view guarantee here.
+
+    extracted = perf_counter()
+    block_images = _estimation_block(images, start, stop, parameters)
+    estimated = perf_counter()
+    if isinstance(calculate_offset, _SpectralOffset):
+        # NOTE: Without pooling the block is the images themselves, so the spectrum
+        #  of the backward lines calculated during estimation is reused to align them
+        offset, spectrum = calculate_offset.estimate(block_images)
+        aligned = perf_counter()
+        align_images(images, start, stop, offset, spectrum=spectrum)
+    else:
+        offset = calculate_offset(block_images)
+        aligned = perf_counter()
+        align_images(images, start, stop, offset)
+    return BlockMetrics(
+        start=start,
+        stop=stop,
+        offset=offset,
+        nbytes=images[start:stop, ...].nbytes,
+        extraction=estimated - extracted,
+        estimation=aligned - estimated,
+        alignment=perf_counter() - aligned,
+    )
+
+
+#: State of each worker process in the process executor (see _initialize_worker)
+_WORKER_STATE: dict[str, Any] = {}
+
+
+@contextmanager
+def _shared_images(images: np.ndarray) -> Generator[tuple, None, None]:
+    """
+    Expose the images to worker processes without pickling any pixel data. Writable
+    memory-mapped files are shared directly by re-opening the file in each worker.
+    All other arrays are copied once into shared memory and copied back on exit.
+
+    :param images: The images to share.
+    :returns: A description of the shared images to pass to _initialize_worker.
+    """
+    if (
+        isinstance(images, np.memmap)
+        and isinstance(images.base, mmap.mmap)
+        and images.mode in {"r+", "w+"}
+        and images.flags.c_contiguous
+    ):
+        yield "memmap", images.filename, images.offset
+        images.flush()
+        return
+
+    shared_memory = SharedMemory(create=True, size=max(images.nbytes, 1))
+    try:
+        shared = np.ndarray(images.shape, dtype=images.dtype, buffer=shared_memory.buf)
+        shared[...] = images
+        yield "shared_memory", shared_memory.name
+        images[...] = shared
+        # NOTE: The view must be released before the shared memory can be closed
+        del shared
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+def _initialize_worker(
+    source: tuple,
+    shape: tuple[int, ...],
+    dtype: np.dtype,
+    parameters: DeinterlaceParameters,
+) -> None:
+    match source:
+        case ("memmap", filename, offset):
+            images = np.memmap(
+                filename, dtype=dtype, mode="r+", shape=shape, offset=offset
+            )
+        case ("shared_memory", name):
+            # NOTE: Workers share the resource tracker of the parent process, which
+            #  owns (and unlinks) the shared memory once all blocks are complete.
+            shared_memory = SharedMemory(name=name)
+            images = np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+            _WORKER_STATE["shared_memory"] = shared_memory
+    _WORKER_STATE["images"] = images
+    _WORKER_STATE["parameters"] = parameters
+    _WORKER_STATE["implementation"] = _dispatcher(parameters)
+
+
+def _deinterlace_shared_block(plane: int, start: int, stop: int) -> BlockMetrics:
+    planes = _WORKER_STATE["parameters"].planes
+    metrics = _deinterlace_block(
+        _WORKER_STATE["images"][plane::planes, ...],
+        start,
+        stop,
+        _WORKER_STATE["parameters"],
+        *_WORKER_STATE["implementation"],
+    )
+    return replace(metrics, plane=plane)
+
+
+def _split_planes(images: NDArrayLike, planes: int) -> list[NDArrayLike]:
+    # NOTE: The frames of each plane are a strided view of the images (no copies),
+    #  so each plane is deinterlaced in-place exactly like a stack of its own
+    return [images[plane::planes, ...] for plane in range(planes)]
+
+
+def _index_plane_blocks(
+    stacks: list[NDArrayLike], parameters: DeinterlaceParameters
+) -> list[tuple[int, int, int]]:
+    # The (plane, start, stop) of each block of stable frames within each plane. The
+    # unstable frames of each plane (one block each) are deinterlaced separately.
+    return [
+        (plane, start, stop)
+        for plane, stack in enumerate(stacks)
+        for start, stop in islice(
+            index_image_blocks(stack, parameters.block_size, parameters.unstable),
+            parameters.unstable or 0,
+            None,
+        )
+    ]
+
+
 def deinterlace(
     images: NDArrayLike,
     parameters: DeinterlaceParameters | None = None,
+    observer: Observer | None = None,
 ) -> None:
     """
     Deinterlace images collected using resonance-scanning microscopes such that the
@@ -94,6 +505,38 @@ def deinterlace(
     using GPU-parallelization. To mitigate these issues, deinterlacing can be performed
     batch-wise while maintaining numerically identical results (see `block_size`).
 
+    Because the velocity of resonant scanners is sinusoidal, the offset may vary across
+    the field of view. Setting `align` to "variable" estimates the offset within
+    several bands of columns (see `bands`) and shifts the backward-scanned lines by a
+    smoothly-varying, field-dependent offset.
+
+    Subpixel alignment shifts the backward-scanned lines in the fourier domain by
+    default. Setting `interpolation` to "linear", "cubic", or "lanczos" instead
+    applies the fractional shift as a short convolution along each line, which avoids
+    the forward and inverse transforms (and their complex temporaries) of every line.
+
+    For long blocks, the estimation of the offset can be accelerated by setting
+    `stride`, which estimates the offset from only every `stride`-th frame of each
+    block (reducing the transforms, and the memory they require, in proportion).
+
+    The offset can also be estimated from a region of interest (see `rows` and
+    `columns`), which reduces the cost of estimation in proportion to its size and
+    excludes regions (e.g., the turnaround at the edges of the field of view) that
+    would otherwise contaminate the estimate. The entire frame is still aligned.
+
+    Volumetric acquisitions interleave the frames of several planes, each of which
+    may have its own offset (e.g., due to the piezo or electrically-tunable lens).
+    Setting `planes` deinterlaces the frames of each plane independently, through
+    strided views of the images rather than copies.
+
+    Multichannel images (frames, channels, rows, columns) share a single scan phase,
+    so the offsets can be estimated from a reference channel or a pool of the channels
+    (see `channel`) and applied to every channel in a single vectorized operation.
+
+    On the CPU, the fourier transforms can be calculated by multi-threaded libraries
+    (see `fft_backend` and `fft_workers`), such as scipy.fft or pyFFTW (whose plans
+    are cached between blocks). NumPy is used by default.
+
     To improve performance, the deinterlacing algorithm can be applied to a pool
     of the images while maintaining efficacy. Specifically, setting the `pool`
     parameter will apply the deinterlacing algorithm to the the standard deviation of
@@ -105,6 +548,32 @@ def deinterlace(
     software are unstable until a sufficient number of frames have been collected.
     Therefore, the `unstable` parameter can be used to specify the number of frames
     that should be deinterlaced individually before switching to batch-wise processing.
+    The offsets of the unstable frames are still estimated in batches of up to
+    `block_size` frames and applied in a single vectorized operation per batch.
+
+    For long, stable recordings the offset rarely changes between blocks. Setting the
+    `probe_interval` parameter fully estimates the offset only every `probe_interval`
+    blocks and reuses it in between, unless a cheap measure of the alignment error
+    drifts beyond the `drift_tolerance` (in which case the offset is re-estimated).
+
+    Blocks are independent of one another, so the `workers` parameter can be used to
+    deinterlace several blocks concurrently on a thread pool. The results are
+    identical to serial processing, but the memory required scales with the number
+    of blocks in flight (i.e., `workers` x `block_size`). Setting `executor` to
+    "process" instead distributes the blocks across worker processes, which also
+    parallelizes the pure-python portions of the algorithm. The images are shared with
+    the workers rather than pickled: writable memory-mapped files are re-opened by each
+    worker, while in-memory arrays are placed in shared memory for the duration of the
+    call (temporarily requiring twice the memory of the images).
+
+    The time spent extracting, estimating, and aligning each block, its offset, and
+    its size are reported to the `observer` (e.g., a
+    :class:`MetricsRecorder <deinterlacing.instrumentation.MetricsRecorder>`) as each
+    block completes. The progress bar can be disabled using `progress`.
+
+    When called without parameters, the configuration tuned on this host for frames
+    of the same shape and dtype (see :func:`tune <deinterlacing.tuning.tune>`) is
+    used, if any.
 
     .. note::
         This function operates in-place.
@@ -114,31 +583,337 @@ def deinterlace(
         smaller than the maximum number of frames that fit within your GPU's VRAM
         (`CuPy <https://cupy.dev>`_) or RAM (`NumPy <https://numpy.org>`_). This
         function will not automatically revert to the NumPy implementation if there is
-        not sufficient VRAM. Instead, an out of memory error will be raised.
+        not sufficient VRAM. Instead, an out of memory error will be raised. On the
+        CPU, setting `memory_budget` selects the largest block size that fits.
+    """
+    parameters = (
+        parameters
+        or tuned_parameters(images.shape, images.dtype)
+        or DeinterlaceParameters()
+    )
+    parameters.validate_with_images(images)
+    stacks = _split_planes(images, parameters.planes)
+    # NOTE: Each plane has its own implementation, such that stateful estimators
+    #  (i.e., probe_interval) only ever track the offset of a single plane
+    implementations = [_dispatcher(parameters) for _ in stacks]
+
+    pbar = tqdm(
+        total=images.shape[0],
+        desc="Deinterlacing Images",
+        colour="blue",
+        disable=not parameters.progress,
+    )
+
+    def report(metrics: BlockMetrics) -> None:
+        # NOTE: Blocks are always reported from this thread as they complete, so
+        #  neither the bar nor the observer is ever called concurrently
+        pbar.update(metrics.frames)
+        if observer is not None:
+            observer(metrics)
+
+    if unstable := parameters.unstable or 0:
+        batch_implementation = _batch_dispatcher(parameters)
+        for plane, stack in enumerate(stacks):
+            for metrics in _deinterlace_frames(
+                stack, 0, unstable, parameters, *batch_implementation
+            ):
+                report(replace(metrics, plane=plane))
+    blocks = _index_plane_blocks(stacks, parameters)
+    if parameters.workers is None or parameters.workers == 1:
+        for plane, start, stop in blocks:
+            metrics = _deinterlace_block(
+                stacks[plane], start, stop, parameters, *implementations[plane]
+            )
+            report(replace(metrics, plane=plane))
+    elif parameters.executor == "thread":
+        # NOTE: Blocks never overlap, so they can be extracted, estimated, and aligned
+        #  in-place concurrently without changing the result. The heavy lifting (FFTs,
+        #  slicing, copying) releases the GIL.
+        with ThreadPoolExecutor(max_workers=parameters.workers) as executor:
+            futures = {
+                executor.submit(
+                    _deinterlace_block,
+                    stacks[plane],
+                    start,
+                    stop,
+                    parameters,
+                    *implementations[plane],
+                ): plane
+                for plane, start, stop in blocks
+            }
+            for future in as_completed(futures):
+                report(replace(future.result(), plane=futures[future]))
+    else:
+        # NOTE: Only the (plane, start, stop) indices of each block are sent to the
+        #  workers. The images themselves are attached once per worker.
+        with (
+            _shared_images(images) as source,
+            ProcessPoolExecutor(
+                max_workers=parameters.workers,
+                initializer=_initialize_worker,
+                initargs=(source, images.shape, images.dtype, parameters),
+            ) as executor,
+        ):
+            futures = [
+                executor.submit(_deinterlace_shared_block, plane, start, stop)
+                for plane, start, stop in blocks
+            ]
+            for future in as_completed(futures):
+                report(future.result())
+    pbar.close()
+
+
+def estimate_offsets(
+    images: NDArrayLike,
+    parameters: DeinterlaceParameters | None = None,
+) -> OffsetTrace:
+    """
+    Estimate the offsets that :func:`deinterlace` would apply to the images without
+    aligning them. The offsets can then be applied to the images, or to any images
+    acquired alongside them (e.g., other channels or derived arrays), using
+    :func:`apply_offsets`, and can be saved and shipped without the images (see
+    :class:`OffsetTrace <deinterlacing.offsets.OffsetTrace>`).
+
+    The offsets are estimated exactly as in :func:`deinterlace`: each of the first
+    `unstable` frames is given its own offset, and every subsequent block a single
+    offset. Blocks are estimated serially, so `workers` is not used.
+
+    :param images: The images to estimate the offsets of (frames, rows, columns).
+    :param parameters: Parameters controlling the estimation.
+    :returns: The offset of each frame or block of frames.
     """
     parameters = parameters or DeinterlaceParameters()
     parameters.validate_with_images(images)
-    calculate_offset, align_images = _dispatcher(parameters)
+    stacks = _split_planes(images, parameters.planes)
+    calculate_offsets, _ = _batch_dispatcher(parameters)
 
-    pbar = tqdm(total=images.shape[0], desc="Deinterlacing Images", colour="blue")
-    for start, stop in index_image_blocks(
-        images, parameters.block_size, parameters.unstable
-    ):
-        # NOTE: We invoke a similar routine for ALL implementations:
-        #  (1) We extract a block of the provided images
-        #  (2) We calculate the offset/s necessary to correct deinterlacing artifacts
-        #  (3) We align the images such that the artifact is minimized or eliminated
-
-        # NOTE: Extraction isn't done inline due to the 'pool' parameter potentially
-        #  changing the shape of the images being processed. In some cases this means
-        #  the returned block_images will not be views of the original images, but
-        #  currently this only occurs when reducing the number of frames to process
-        #  through pool.If adding a feature here in the future (e.g., upscaling), one
-        #  will need to remember this is no view guarantee here.
-
-        block_images = extract_image_block(images, start, stop, parameters.pool)
-        offset = calculate_offset(block_images)
-        align_images(images, start, stop, offset)
+    # NOTE: The blocks of each plane are recorded by the (start, stop) of their
+    #  frames within the images, which are strided by the number of planes
+    planes = parameters.planes
+    starts, stops, offsets = [], [], []
+    unstable = parameters.unstable or 0
+    pbar = tqdm(
+        total=images.shape[0],
+        desc="Estimating Offsets",
+        colour="blue",
+        disable=not parameters.progress,
+    )
+    for plane, stack in enumerate(stacks):
+        for start, stop in chunk_ranges(unstable, parameters.block_size):
+            offsets.extend(
+                calculate_offsets(_estimation_frames(stack, start, stop, parameters))
+            )
+            starts.extend(plane + planes * frame for frame in range(start, stop))
+            stops.extend(plane + planes * frame + 1 for frame in range(start, stop))
+            pbar.update(stop - start)
+        calculate_offset, _ = _dispatcher(parameters)
+        for _, start, stop in _index_plane_blocks([stack], parameters):
+            offsets.append(
+                calculate_offset(_estimation_block(stack, start, stop, parameters))
+            )
+            starts.append(plane + planes * start)
+            stops.append(plane + planes * (stop - 1) + 1)
+            pbar.update(stop - start)
+    pbar.close()
+    return OffsetTrace(
+        starts=np.asarray(starts, dtype=np.int64),
+        stops=np.asarray(stops, dtype=np.int64),
+        offsets=np.asarray(offsets),
+        align=parameters.align,
+        step=planes,
+    )
+
+
+def apply_offsets(
+    images: NDArrayLike,
+    trace: OffsetTrace,
+    parameters: DeinterlaceParameters | None = None,
+) -> None:
+    """
+    Align the images using offsets estimated by :func:`estimate_offsets`, without
+    estimating them again.
+
+    .. note::
+        This function operates in-place.
+
+    :param images: The images to align (frames, rows, columns).
+    :param trace: The offsets of each frame or block of frames.
+    :param parameters: Parameters controlling the alignment (e.g., `use_gpu`,
+        `precision`, or `interpolation`). The `align` parameter must match the
+        alignment the offsets were estimated for. By default, the offsets are
+        applied using the default parameters for their alignment.
+    """
+    parameters = parameters or DeinterlaceParameters(align=trace.align)
+    if parameters.align != trace.align:
+        msg = (
+            f"The offsets were estimated for align='{trace.align}' and cannot be "
+            f"applied with align='{parameters.align}'."
+        )
+        raise ValueError(msg)
+    if trace.frames > images.shape[0]:
+        msg = (
+            f"The offsets span {trace.frames} frames, but the images contain only "
+            f"{images.shape[0]} frames."
+        )
+        raise ValueError(msg)
+    if trace.align == "variable" and trace.offsets.shape[-1] != images.shape[-1]:
+        msg = (
+            f"The offsets span {trace.offsets.shape[-1]} columns, but the images "
+            f"contain {images.shape[-1]} columns."
+        )
+        raise ValueError(msg)
+    parameters.validate_with_images(images)
+    _, align_images = _dispatcher(parameters)
+
+    pbar = tqdm(
+        total=trace.frames,
+        desc="Applying Offsets",
+        colour="blue",
+        disable=not parameters.progress,
+    )
+    stacks = _split_planes(images, trace.step)
+    for start, stop, offset in trace:
+        # (start, stop) within the images -> (start, stop) within the plane
+        plane_start, plane_stop = start // trace.step, (stop - 1) // trace.step + 1
+        align_images(stacks[start % trace.step], plane_start, plane_stop, offset)
+        pbar.update(plane_stop - plane_start)
+    pbar.close()
+
+
+def _open_images(
+    path: Path,
+    mode: Literal["r", "r+"],
+    shape: tuple[int, ...] | None,
+    dtype: DTypeLike | None,
+    offset: int,
+) -> np.memmap:
+    if path.suffix == ".npy":
+        return np.load(path, mmap_mode=mode, allow_pickle=False)
+    if shape is None or dtype is None:
+        msg = f"The shape and dtype of raw file '{path}' must be provided."
+        raise ValueError(msg)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape, offset=offset)
+
+
+def deinterlace_file(
+    path: str | Path,
+    out_path: str | Path | None = None,
+    parameters: DeinterlaceParameters | None = None,
+    memory_budget: int | Literal["auto"] = 2**30,
+    shape: tuple[int, ...] | None = None,
+    dtype: DTypeLike | None = None,
+    offset: int = 0,
+    observer: Observer | None = None,
+) -> Path:
+    """
+    Deinterlace images stored in a file without loading the entire file into memory.
+    The images are memory-mapped and streamed block-by-block: each block is read into
+    memory, deinterlaced, and flushed to the output file before the next block is
+    read. Consequently, the resident memory is bounded by the size of a single block
+    and its intermediate calculations rather than the size of the file.
 
-        pbar.update(stop - start)
+    The file may either be a numpy file (.npy) or a raw binary file, in which case
+    its `shape`, `dtype`, and header `offset` must be provided. If `out_path` is
+    None, the file is deinterlaced in-place. Otherwise, the input file is opened
+    read-only and the deinterlaced images are written to `out_path`, whose suffix
+    determines its format: a numpy file if it ends in ".npy" and a raw binary file
+    (without a header) otherwise.
+
+    If the `block_size` of the provided parameters is None, it is set to the largest
+    number of frames whose estimated memory footprint (see
+    :func:`pixel_cost <deinterlacing.memory.pixel_cost>`) fits within the
+    `memory_budget` of the parameters or, if None, within `memory_budget`.
+    Blocks are always processed sequentially, so the `workers` parameter is unused.
+
+    :param path: Path to the file containing the images.
+    :param out_path: Path to write the deinterlaced images to (optional).
+    :param parameters: Parameters controlling the deinterlacing.
+    :param memory_budget: Approximate memory available for each block, in bytes, or
+        "auto" for half of the available memory.
+    :param shape: Shape of the images in a raw file.
+    :param dtype: Data type of the images in a raw file.
+    :param offset: Offset of the images in a raw file, in bytes.
+    :param observer: Called with the metrics of each block as it completes (see
+        :func:`deinterlace`).
+    :returns: Path to the deinterlaced images.
+    """
+    path = Path(path)
+    parameters = parameters or DeinterlaceParameters()
+    images = _open_images(path, "r" if out_path else "r+", shape, dtype, offset)
+    if out_path is None:
+        out_path, output = path, images
+    elif (out_path := Path(out_path)).suffix == ".npy":
+        output = np.lib.format.open_memmap(
+            out_path, mode="w+", dtype=images.dtype, shape=images.shape
+        )
+    else:
+        output = np.memmap(out_path, dtype=images.dtype, mode="w+", shape=images.shape)
+
+    if parameters.block_size is None:
+        # NOTE: Each block is also resident in memory in its native dtype
+        parameters.block_size = max_block_size(
+            parameters,
+            (len(images) // parameters.planes, *images.shape[1:]),
+            images.dtype,
+            parameters.memory_budget or memory_budget,
+            resident=images.dtype.itemsize,
+            concurrent=False,
+        )
+    parameters.validate_with_images(images)
+    calculate_offsets, align_frames = _batch_dispatcher(parameters)
+
+    unstable = parameters.unstable or 0
+    pbar = tqdm(
+        total=images.shape[0],
+        desc="Deinterlacing Images",
+        colour="blue",
+        disable=not parameters.progress,
+    )
+    for plane, (stack, stack_output) in enumerate(
+        zip(
+            _split_planes(images, parameters.planes),
+            _split_planes(output, parameters.planes),
+            strict=True,
+        )
+    ):
+        calculate_offset, align_images = _dispatcher(parameters)
+        for start, stop in chain(
+            chunk_ranges(unstable, parameters.block_size),
+            islice(
+                index_image_blocks(stack, parameters.block_size, parameters.unstable),
+                unstable,
+                None,
+            ),
+        ):
+            block = np.array(stack[start:stop, ...])
+            if stop <= unstable:
+                metrics = _deinterlace_frames(
+                    block, 0, stop - start, parameters, calculate_offsets, align_frames
+                )
+            else:
+                metrics = [
+                    _deinterlace_block(
+                        block,
+                        0,
+                        stop - start,
+                        parameters,
+                        calculate_offset,
+                        align_images,
+                    )
+                ]
+            stack_output[start:stop, ...] = block
+            output.flush()
+            pbar.update(stop - start)
+            if observer is not None:
+                # (start, stop) within the block -> (start, stop) within the plane
+                for batch in metrics:
+                    observer(
+                        replace(
+                            batch,
+                            start=start + batch.start,
+                            stop=start + batch.stop,
+                            plane=plane,
+                        )
+                    )
     pbar.close()
+    return out_path
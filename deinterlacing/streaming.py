@@ -0,0 +1,175 @@
+from collections import deque
+from collections.abc import Generator, Iterable
+from typing import Literal
+
+import numpy as np
+
+from deinterlacing.parameters import DeinterlaceParameters
+from deinterlacing.processing import (
+    _batch_dispatcher,
+    _deinterlace_block,
+    _deinterlace_frames,
+    _dispatcher,
+    _estimator_dispatcher,
+)
+from deinterlacing.tools import NDArrayLike, crop_image_block, extract_channel
+
+__all__ = [
+    "StreamingDeinterlacer",
+]
+
+
+class StreamingDeinterlacer:
+    """
+    Deinterlace frames as they are acquired rather than requiring the entire image
+    stack up front (e.g., for closed-loop experiments or real-time display).
+
+    Frames are pushed as they arrive and the deinterlaced frames are returned as soon
+    as they can be corrected. The first `unstable` frames are always deinterlaced
+    individually and returned immediately. Thereafter, the offset is estimated in one
+    of two modes:
+
+    * "block" buffers `block_size` frames before estimating a single offset for the
+      entire block, exactly as :func:`deinterlace <deinterlacing.deinterlace>` would.
+      The latency is therefore at most `block_size` - 1 frames.
+    * "rolling" estimates the offset of each frame from a rolling window of the last
+      `block_size` frames (including the frame itself), so every frame is returned
+      immediately. Each frame is transformed only once, as the offset matrix of the
+      window is the average of the offset matrices of its frames. The `pool`
+      parameter is not used in this mode.
+
+    :param parameters: Parameters controlling the deinterlacing. The `block_size`
+        must be provided.
+    :param mode: Whether to estimate the offset per block or over a rolling window.
+    """
+
+    def __init__(
+        self,
+        parameters: DeinterlaceParameters,
+        mode: Literal["block", "rolling"] = "block",
+    ) -> None:
+        if parameters.block_size is None:
+            msg = "The block_size must be provided when streaming frames."
+            raise ValueError(msg)
+        if parameters.planes != 1:
+            msg = "Interleaved planes cannot be streamed."
+            raise ValueError(msg)
+        if mode not in {"block", "rolling"}:
+            msg = f"Invalid mode='{mode}'. Mode must be either 'block' or 'rolling'."
+            raise ValueError(msg)
+        self.parameters = parameters
+        self.mode = mode
+        #: Number of frames pushed so far
+        self.frames_seen = 0
+        self._buffer = []
+        self._matrices = deque(maxlen=parameters.block_size)
+        self._implementation = None
+        self._estimators = None
+        self._batch = None
+
+    @property
+    def buffered(self) -> int:
+        """Number of frames pushed but not yet returned."""
+        return sum(len(frames) for frames in self._buffer)
+
+    def push(self, frames: NDArrayLike) -> np.ndarray:
+        """
+        Push one frame (rows, columns) or a chunk of frames (frames, rows, columns).
+
+        :param frames: The newly acquired frame/s.
+        :returns: The frames deinterlaced as a result of this push, which may be none.
+        """
+        frames = np.array(frames, ndmin=3)
+        if self._implementation is None:
+            self._initialize(frames)
+        calculate_offset, align_images = self._implementation
+
+        # WARM-UP
+        unstable = self.parameters.unstable or 0
+        warmup = min(max(unstable - self.frames_seen, 0), frames.shape[0])
+        _deinterlace_frames(frames, 0, warmup, self.parameters, *self._batch)
+        self.frames_seen += frames.shape[0]
+        ready = [frames[:warmup, ...]]
+        stable = frames[warmup:, ...]
+
+        if self.mode == "rolling":
+            calculate_matrix, find_peak = self._estimators
+            for index in range(stable.shape[0]):
+                # NOTE: Like the blocks of deinterlace, the offset is estimated from
+                #  the (cropped) reference channel
+                frame = extract_channel(
+                    stable[index : index + 1, ...],
+                    self.parameters.channel,
+                    self.parameters.precision,
+                )
+                frame = crop_image_block(
+                    frame, self.parameters.rows, self.parameters.columns
+                )
+                self._matrices.append(calculate_matrix(frame))
+                offset = find_peak(frame, np.mean(self._matrices, axis=0))
+                align_images(stable, index, index + 1, offset)
+            ready.append(stable)
+        else:
+            self._buffer.append(stable)
+            if self.buffered >= self.parameters.block_size:
+                pending = np.concatenate(self._buffer)
+                blocks = pending.shape[0] // self.parameters.block_size
+                stop = blocks * self.parameters.block_size
+                for start in range(0, stop, self.parameters.block_size):
+                    _deinterlace_block(
+                        pending,
+                        start,
+                        start + self.parameters.block_size,
+                        self.parameters,
+                        calculate_offset,
+                        align_images,
+                    )
+                ready.append(pending[:stop, ...])
+                self._buffer = [pending[stop:, ...]]
+
+        return np.concatenate(ready)
+
+    def flush(self) -> np.ndarray:
+        """
+        Deinterlace any frames remaining in a partially-filled block (e.g., at the end
+        of an acquisition).
+
+        :returns: The remaining deinterlaced frames, which may be none.
+        """
+        if self._implementation is None:
+            return np.empty((0, 0, 0))
+        pending = np.concatenate(self._buffer)
+        if pending.shape[0] > 0:
+            _deinterlace_block(
+                pending, 0, pending.shape[0], self.parameters, *self._implementation
+            )
+        self._buffer = [pending[:0, ...]]
+        return pending
+
+    def stream(
+        self, frames: Iterable[NDArrayLike]
+    ) -> Generator[np.ndarray, None, None]:
+        """
+        Deinterlace an iterable of frames or chunks of frames (e.g., a generator
+        yielding frames from the microscope), yielding each frame once deinterlaced.
+
+        :param frames: An iterable of frames or chunks of frames.
+        :returns: A generator yielding the deinterlaced frames.
+        """
+        for chunk in frames:
+            yield from self.push(chunk)
+        yield from self.flush()
+
+    def _initialize(self, frames: np.ndarray) -> None:
+        # NOTE: The parameters are validated against a (zero-memory) stand-in for a
+        #  stack large enough to contain the block and the unstable frames
+        length = max(self.parameters.block_size, self.parameters.unstable or 0)
+        self.parameters.validate_with_images(
+            np.broadcast_to(
+                np.zeros((), dtype=frames.dtype), (length, *frames.shape[1:])
+            )
+        )
+        self._implementation = _dispatcher(self.parameters)
+        self._estimators = _estimator_dispatcher(self.parameters)
+        self._batch = _batch_dispatcher(self.parameters)
+        self._buffer = [frames[:0, ...]]
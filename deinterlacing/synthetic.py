@@ -0,0 +1,281 @@
+from collections.abc import Generator
+from math import ceil
+from typing import Literal
+
+import numpy as np
+from boltons.iterutils import chunk_ranges
+from numpy.typing import ArrayLike, DTypeLike
+
+__all__ = [
+    "generate_offsets",
+    "generate_stack",
+    "stream_stack",
+]
+
+#: Shape of the gamma-distributed gain of each photon detected by a PMT (excess noise
+#: factor of 1.5)
+_PMT_SHAPE = 2.0
+
+#: Distance from its center (in widths of the widest source) beyond which each source
+#: is not rendered
+_SUPPORT = 5.0
+
+
+def generate_offsets(
+    frames: int,
+    columns: int,
+    offset: float | ArrayLike = 2.0,
+    drift: float = 0.0,
+    fill_fraction: float | None = None,
+) -> np.ndarray:
+    """
+    Generate the ground-truth offsets of a synthetic stack (see
+    :func:`generate_stack`).
+
+    :param frames: The number of frames.
+    :param columns: The number of columns of each frame.
+    :param offset: The offset of every frame, or of each frame (frames). Offsets may
+        be integer or subpixel.
+    :param drift: Change in the offset from the first to the last frame, added
+        linearly over time.
+    :param fill_fraction: Fraction of the sinusoidal sweep of a resonant scanner
+        spanned by the field of view. The offset is proportional to the velocity of
+        the scanner, so it is largest at the center and decreases towards the edges.
+        None generates the same offset for every column.
+    :returns: The offset of each frame (frames), or of each column of each frame
+        (frames, columns) when `fill_fraction` is provided.
+    """
+    offsets = np.broadcast_to(np.asarray(offset, dtype=np.float64), (frames,))
+    offsets = offsets + drift * np.linspace(0.0, 1.0, frames)
+    if fill_fraction is None:
+        return offsets
+    if not 0 < fill_fraction <= 1:
+        msg = f"The fill_fraction must be within (0, 1], not {fill_fraction}."
+        raise ValueError(msg)
+    position = np.linspace(-fill_fraction, fill_fraction, columns)
+    return offsets[:, np.newaxis] * np.sqrt(1.0 - position**2)
+
+
+def stream_stack(
+    frames: int,
+    shape: tuple[int, int] = (512, 512),
+    offsets: float | ArrayLike = 2.0,
+    dtype: DTypeLike = "uint16",
+    noise: Literal["none", "poisson", "pmt"] = "poisson",
+    photons: float = 100.0,
+    activity: float = 0.05,
+    sources: int | None = None,
+    chunk_size: int = 64,
+    seed: int = 0,
+) -> Generator[np.ndarray, None, None]:
+    """
+    Generate a synthetic stack of interlaced images chunk-by-chunk, such that stacks
+    larger than memory can be streamed to disk or deinterlaced as they are generated.
+    See :func:`generate_stack`.
+
+    :returns: A generator yielding chunks of up to `chunk_size` frames (frames, rows,
+        columns).
+    """
+    rows, columns = shape
+    offsets = _broadcast_offsets(offsets, frames, columns)
+    if noise not in {"none", "poisson", "pmt"}:
+        msg = f"Invalid noise='{noise}'. Noise must be 'none', 'poisson', or 'pmt'."
+        raise ValueError(msg)
+
+    # NOTE: Each stochastic component draws from its own stream, so the stack is
+    #  identical regardless of the offsets or the chunk size
+    scene_rng, event_rng, transient_rng, photon_rng, gain_rng = (
+        np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(5)
+    )
+    sources = sources or max(rows * columns // 1024, 1)
+    centers = scene_rng.uniform((0, 0), (rows, columns), (sources, 2))
+    widths = scene_rng.uniform(1.5, 4.0, sources)[:, np.newaxis]
+    brightness = scene_rng.lognormal(0.0, 0.5, sources)
+
+    # NOTE: Each source is only rendered within a window of the rows and columns
+    #  around it (sources, window), which is scattered onto a padded canvas. The
+    #  profiles are truncated in the coordinates of the scene, so the displaced
+    #  backward-scanned lines remain exact shifts of the scene.
+    support = _SUPPORT * widths.max()
+    half = ceil(support) + 1
+    window = np.arange(-half, half + 1)
+    nearest = np.rint(centers).astype(int)
+    first_rows = nearest[:, :1] - half
+    forward_rows = first_rows + first_rows % 2 + 2 * np.arange(half + 1)
+    backward_rows = forward_rows - 1
+    forward_columns = nearest[:, 1:] + window
+    forward_weights = (
+        _gaussian(forward_rows, centers[:, :1], widths, support)[..., np.newaxis]
+        * _gaussian(forward_columns, centers[:, 1:], widths, support)[:, np.newaxis]
+    )
+    backward_profiles = _gaussian(backward_rows, centers[:, :1], widths, support)
+    # NOTE: The window of the backward-scanned lines is widened by the variation of
+    #  the offset across each frame (i.e., field-varying offsets)
+    spreads = np.ceil(np.ptp(offsets, axis=1)).astype(int) + 1
+    padding = (half + 1, half + spreads.max() + ceil(np.abs(offsets).max()) + 1)
+    canvas = (rows + 2 * padding[0], columns + 2 * padding[1])
+    forward_indices = _scatter_indices(forward_rows, forward_columns, padding, canvas)
+    center_columns = np.clip(nearest[:, 1:], 0, columns - 1)
+
+    for start, stop in chunk_ranges(frames, chunk_size):
+        # Sparse activity: each source is transiently brighter in a fraction of frames
+        events = event_rng.random((stop - start, sources)) < activity
+        transients = transient_rng.exponential(3.0, (stop - start, sources))
+        amplitudes = brightness * (1.0 + events * transients)
+
+        expected = np.empty((stop - start, rows, columns))
+        for index, frame in enumerate(range(start, stop)):
+            # The backward-scanned lines sample the scene displaced by the offset,
+            # such that aligning them by the offset recovers the scene
+            spread = half + spreads[frame]
+            backward_columns = np.rint(
+                centers[:, 1:] - offsets[frame, center_columns]
+            ).astype(int) + np.arange(-spread, spread + 1)
+            displaced = (
+                backward_columns
+                + offsets[frame, np.clip(backward_columns, 0, columns - 1)]
+            )
+            backward_weights = (
+                backward_profiles[..., np.newaxis]
+                * _gaussian(displaced, centers[:, 1:], widths, support)[:, np.newaxis]
+            )
+            amplitude = amplitudes[index, :, np.newaxis, np.newaxis]
+            scene = np.bincount(
+                np.concatenate(
+                    (
+                        forward_indices.ravel(),
+                        _scatter_indices(
+                            backward_rows, backward_columns, padding, canvas
+                        ).ravel(),
+                    )
+                ),
+                np.concatenate(
+                    (
+                        (forward_weights * amplitude).ravel(),
+                        (backward_weights * amplitude).ravel(),
+                    )
+                ),
+                minlength=canvas[0] * canvas[1],
+            ).reshape(canvas)
+            expected[index] = scene[
+                padding[0] : padding[0] + rows, padding[1] : padding[1] + columns
+            ]
+        expected += 0.05
+        expected *= photons
+
+        match noise:
+            case "poisson":
+                expected = photon_rng.poisson(expected).astype(np.float64)
+            case "pmt":
+                detected = photon_rng.poisson(expected)
+                expected = gain_rng.gamma(detected * _PMT_SHAPE, 1.0 / _PMT_SHAPE)
+        yield _cast(expected, dtype)
+
+
+def generate_stack(
+    frames: int,
+    shape: tuple[int, int] = (512, 512),
+    offsets: float | ArrayLike = 2.0,
+    dtype: DTypeLike = "uint16",
+    noise: Literal["none", "poisson", "pmt"] = "poisson",
+    photons: float = 100.0,
+    activity: float = 0.05,
+    sources: int | None = None,
+    chunk_size: int = 64,
+    seed: int = 0,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Generate a synthetic stack of interlaced images with known (ground-truth) offsets,
+    such that the speed and accuracy of each estimator can be measured at any scale
+    without real data.
+
+    The scene is a field of sparsely-active, gaussian sources rendered analytically
+    (within a few widths of each source), so the backward-scanned lines are displaced
+    by integer, subpixel, time-varying, or field-varying offsets (see
+    :func:`generate_offsets`) without any interpolation.
+    The backward-scanned lines are displaced by +offset, which is the offset
+    estimated by :func:`deinterlace <deinterlacing.deinterlace>`. Generating the same
+    stack with zero offsets yields its ground truth.
+
+    :param frames: The number of frames.
+    :param shape: The number of rows and columns of each frame.
+    :param offsets: The offset of every frame, of each frame (frames), or of each
+        column of each frame (frames, columns).
+    :param dtype: The dtype of the stack. Integer stacks are rounded and clipped to
+        the range of the dtype.
+    :param noise: Whether the detected photons are noiseless ("none"), Poisson
+        distributed ("poisson"), or Poisson distributed and amplified by the
+        stochastic gain of a photomultiplier tube ("pmt").
+    :param photons: The expected number of photons at the center of a source at rest.
+    :param activity: The probability that each source is active in each frame.
+    :param sources: The number of sources, or None for one per 1024 pixels.
+    :param chunk_size: The number of frames rendered at once.
+    :param seed: The seed of the random number generator.
+    :param out: Array (e.g., a memory-mapped file) in which to write the stack.
+    :returns: The stack (frames, rows, columns).
+    """
+    if out is None:
+        out = np.empty((frames, *shape), dtype=dtype)
+    start = 0
+    for chunk in stream_stack(
+        frames,
+        shape,
+        offsets,
+        dtype,
+        noise,
+        photons,
+        activity,
+        sources,
+        chunk_size,
+        seed,
+    ):
+        out[start : start + chunk.shape[0]] = chunk
+        start += chunk.shape[0]
+    return out
+
+
+def _gaussian(
+    positions: np.ndarray, centers: np.ndarray, widths: np.ndarray, support: float
+) -> np.ndarray:
+    # Profile of each source (sources, positions), truncated beyond the support
+    distances = positions - centers
+    return np.exp(-0.5 * (distances / widths) ** 2) * (np.abs(distances) <= support)
+
+
+def _scatter_indices(
+    rows: np.ndarray,
+    columns: np.ndarray,
+    padding: tuple[int, int],
+    canvas: tuple[int, int],
+) -> np.ndarray:
+    # Flat index of each pixel of the window of each source within the padded canvas
+    # (sources, rows, columns)
+    return (rows[:, :, np.newaxis] + padding[0]) * canvas[1] + (
+        columns[:, np.newaxis, :] + padding[1]
+    )
+
+
+def _broadcast_offsets(
+    offsets: float | ArrayLike, frames: int, columns: int
+) -> np.ndarray:
+    # (), (frames), or (frames, columns) -> (frames, columns)
+    offsets = np.asarray(offsets, dtype=np.float64)
+    if offsets.ndim == 1:
+        offsets = offsets[:, np.newaxis]
+    try:
+        return np.broadcast_to(offsets, (frames, columns))
+    except ValueError:
+        msg = (
+            f"The offsets {offsets.shape} must be a scalar, (frames={frames}), or "
+            f"(frames={frames}, columns={columns})."
+        )
+        raise ValueError(msg) from None
+
+
+def _cast(values: np.ndarray, dtype: DTypeLike) -> np.ndarray:
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        # NOTE: The values are rendered for each chunk, so they are rounded in-place
+        np.clip(np.rint(values, out=values), info.min, info.max, out=values)
+    return values.astype(dtype, copy=False)
@@ -15,8 +15,11 @@ except ImportError:
 __all__ = [
     "ImageBlockGenerator",
     "NDArrayLike",
+    "crop_image_block",
+    "extract_channel",
     "extract_image_block",
     "index_image_blocks",
+    "select_signal_rows",
     "wrap_cupy",
 ]
 
@@ -38,13 +41,15 @@ def compose(first_function: Callable) -> Callable:
     return decorator
 
 
-# This is to use dictionary dispatch in extract_image_block
+# This is to use dictionary dispatch in extract_image_block. The floating-point
+# reductions (mean, std) accumulate in the requested precision, while median and sum
+# operate in the native dtype of the images and therefore never promote the block.
 _POOL_FUNCS = {
-    "mean": lambda x: x.mean(axis=0).astype(x.dtype),
-    "median": lambda x: np.median(x, axis=0).astype(x.dtype),
-    "std": lambda x: x.std(axis=0).astype(x.dtype),
-    "sum": lambda x: x.sum(axis=0).astype(x.dtype),
-    None: lambda x: x,
+    "mean": lambda x, dtype: x.mean(axis=0, dtype=dtype).astype(x.dtype),
+    "median": lambda x, dtype: np.median(x, axis=0).astype(x.dtype),  # noqa: ARG005
+    "std": lambda x, dtype: x.std(axis=0, dtype=dtype).astype(x.dtype),
+    "sum": lambda x, dtype: x.sum(axis=0).astype(x.dtype),  # noqa: ARG005
+    None: lambda x, dtype: x,  # noqa: ARG005
 }
 
 
@@ -53,9 +58,79 @@ def extract_image_block(
     start: int,
     stop: int,
     pool: Literal["mean", "median", "std", "sum", None],
+    precision: Literal["float32", "float64"] = "float64",
+    stride: int = 1,
 ) -> NDArrayLike:
-    image_block = images[start:stop, ...]
-    return _POOL_FUNCS[pool](image_block)
+    image_block = images[start:stop:stride, ...]
+    return _POOL_FUNCS[pool](image_block, precision)
+
+
+def select_signal_rows(images: NDArrayLike, fraction: int = 4) -> tuple[int, int]:
+    """
+    Select the band of rows with the most signal (i.e., the greatest variation along
+    each line of the mean image). The band spans `1 / fraction` of the rows (and at
+    least one pair of lines), and begins on a forward-scanned (even) row.
+
+    :param images: The images (..., rows, columns).
+    :param fraction: The reciprocal of the fraction of rows to select.
+    :returns: The (start, stop) of the band of rows.
+    """
+    height = images.shape[-2] // 2 * 2
+    pairs = max(height // fraction // 2, 1)
+    mean_image = images.reshape(-1, *images.shape[-2:]).mean(axis=0, dtype=np.float32)
+    signal = mean_image[:height].std(axis=-1).reshape(-1, 2).sum(axis=-1)
+    # Total signal of each (overlapping) band of pairs of lines
+    totals = np.convolve(signal, np.ones(pairs), mode="valid")
+    start = 2 * int(np.argmax(totals))
+    return start, start + 2 * pairs
+
+
+def crop_image_block(
+    images: NDArrayLike,
+    rows: tuple[int, int] | Literal["auto"] | None = None,
+    columns: tuple[int, int] | None = None,
+) -> NDArrayLike:
+    """
+    Crop a block of images to the region of interest used to estimate its offset.
+
+    :param images: The images (..., rows, columns).
+    :param rows: The (start, stop) of the band of rows, "auto" to select the band
+        with the most signal (see :func:`select_signal_rows`), or None for all rows.
+    :param columns: The (start, stop) of the window of columns, or None for all
+        columns.
+    :returns: A view of the cropped images.
+    """
+    if rows == "auto":
+        rows = select_signal_rows(images)
+    if rows is not None:
+        images = images[..., rows[0] : rows[1], :]
+    if columns is not None:
+        images = images[..., columns[0] : columns[1]]
+    return images
+
+
+def extract_channel(
+    images: NDArrayLike,
+    channel: int | Literal["mean", "median", "std", "sum"] | None,
+    precision: Literal["float32", "float64"] = "float64",
+) -> NDArrayLike:
+    """
+    Extract the reference channel of multichannel images (..., channels, rows,
+    columns), or pool the channels into a single reference channel.
+
+    :param images: The images.
+    :param channel: The index of the reference channel, the pooling of the channels,
+        or None to retain all channels.
+    :param precision: The floating-point precision of the pooling.
+    :returns: The images of the reference channel (..., rows, columns).
+    """
+    match channel:
+        case None:
+            return images
+        case int():
+            return images[..., channel, :, :]
+        case _:
+            return _POOL_FUNCS[channel](np.moveaxis(images, -3, 0), precision)
 
 
 def index_image_blocks(
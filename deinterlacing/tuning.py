@@ -0,0 +1,228 @@
+import json
+import os
+import platform
+from dataclasses import fields
+from itertools import product
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from numpy.typing import DTypeLike
+from pydantic import ValidationError
+
+from deinterlacing.backends import available_fft_backends
+from deinterlacing.offsets import OffsetTrace
+from deinterlacing.parameters import DeinterlaceParameters
+from deinterlacing.tools import NDArrayLike
+
+__all__ = [
+    "cache_path",
+    "default_candidates",
+    "tune",
+    "tuned_parameters",
+]
+
+
+def cache_path() -> Path:
+    """
+    The JSON file in which tuned configurations are persisted, located in the user's
+    cache directory (i.e., `$XDG_CACHE_HOME/deinterlacing/tuning.json`, or
+    `~/.cache/deinterlacing/tuning.json`).
+
+    :returns: The path of the cache.
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+    return Path(root, "deinterlacing", "tuning.json")
+
+
+def default_candidates(
+    images: NDArrayLike, parameters: DeinterlaceParameters | None = None
+) -> dict[str, tuple[Any, ...]]:
+    """
+    The values of each parameter searched by :func:`tune` by default: pooled and
+    unpooled estimation, three block sizes, every installed FFT backend, and serial
+    or concurrent blocks. The `align` of the parameters is not varied by default,
+    since it changes the deinterlaced images.
+
+    :param images: The sample of images (frames, rows, columns).
+    :param parameters: The parameters shared by every candidate.
+    :returns: The values of each parameter.
+    """
+    parameters = parameters or DeinterlaceParameters()
+    frames = images.shape[0] // parameters.planes
+    cores = os.cpu_count() or 1
+    return {
+        "pool": (None, "mean"),
+        "block_size": tuple(sorted({max(frames // 8, 1), max(frames // 2, 1), frames})),
+        "fft_backend": available_fft_backends(),
+        "workers": (None, cores) if cores > 1 else (None,),
+    }
+
+
+def tune(
+    images: NDArrayLike,
+    parameters: DeinterlaceParameters | None = None,
+    candidates: dict[str, tuple[Any, ...]] | None = None,
+    tolerance: float = 0.5,
+    repeats: int = 3,
+    *,
+    cache: bool | str | Path = False,
+) -> DeinterlaceParameters:
+    """
+    Select the fastest configuration for images of the same shape and dtype as a
+    small sample of them (e.g., the first hundred frames of a new rig).
+
+    Every combination of the `candidates` is applied on top of the provided
+    parameters. Candidates whose offsets (see
+    :func:`estimate_offsets <deinterlacing.estimate_offsets>`) differ from those of
+    the provided parameters by more than `tolerance` pixels in any frame, or which are
+    invalid for the sample, are rejected. The remaining candidates deinterlace a copy
+    of the sample `repeats` times and the fastest (by its best time) is returned.
+
+    The selected configuration can be persisted to a JSON cache keyed by the host and
+    the shape and dtype of the frames, in which case
+    :func:`deinterlace <deinterlacing.deinterlace>` loads it whenever it is called
+    without parameters (see :func:`tuned_parameters`).
+
+    :param images: The sample of images (frames, rows, columns).
+    :param parameters: The parameters shared by every candidate and used as the
+        reference offsets.
+    :param candidates: The values of each parameter to search (see
+        :func:`default_candidates`). Including `align` trades accuracy for speed
+        within the `tolerance`.
+    :param tolerance: The maximum difference (in pixels) between the offsets of a
+        candidate and the reference offsets. Field-varying offsets are compared by
+        their median across columns.
+    :param repeats: The number of times each candidate is timed.
+    :param cache: Whether to persist the configuration to the default cache (see
+        :func:`cache_path`), or the path of the cache.
+    :returns: The parameters of the fastest configuration.
+    """
+    # NOTE: Imported on call, since deinterlace loads tuned parameters from this module
+    from deinterlacing.processing import deinterlace, estimate_offsets
+
+    base = _options(parameters or DeinterlaceParameters())
+    candidates = candidates or default_candidates(images, parameters)
+    reference = _offsets(
+        estimate_offsets(images, DeinterlaceParameters(**{**base, "progress": False}))
+    )
+
+    timings = {}
+    for values in product(*candidates.values()):
+        # NOTE: The progress bars of the candidates are always disabled
+        options = {**base, **dict(zip(candidates, values, strict=True))}
+        options["progress"] = False
+        try:
+            trace = estimate_offsets(images, DeinterlaceParameters(**options))
+        except ValueError:
+            continue
+        if np.max(np.abs(_offsets(trace) - reference), initial=0.0) > tolerance:
+            continue
+        elapsed = []
+        for _ in range(repeats):
+            sample = images.copy()
+            start = perf_counter()
+            deinterlace(sample, DeinterlaceParameters(**options))
+            elapsed.append(perf_counter() - start)
+        timings[values] = min(elapsed)
+
+    if not timings:
+        msg = (
+            f"No candidate configuration estimated offsets within {tolerance} pixels "
+            "of the reference."
+        )
+        raise ValueError(msg)
+    fastest = dict(zip(candidates, min(timings, key=timings.get), strict=True))
+    options = {**base, **fastest}
+
+    if cache:
+        path = cache_path() if cache is True else Path(cache)
+        tuned = _read_cache(path)
+        tuned[_cache_key(images.shape, images.dtype)] = options
+        _write_cache(path, tuned)
+    return DeinterlaceParameters(**options)
+
+
+def tuned_parameters(
+    shape: tuple[int, ...],
+    dtype: DTypeLike,
+    path: str | Path | None = None,
+) -> DeinterlaceParameters | None:
+    """
+    Load the configuration tuned on this host for images of the provided shape and
+    dtype (see :func:`tune`). The block size and unstable frames are limited to the
+    frames of each plane. Unreadable caches and invalid configurations (e.g., naming
+    an FFT backend that is no longer installed) are ignored.
+
+    :param shape: The shape of the images (frames, rows, columns).
+    :param dtype: The dtype of the images.
+    :param path: The path of the cache, or None for the default cache (see
+        :func:`cache_path`).
+    :returns: The tuned parameters, or None if no valid configuration was tuned for
+        the images.
+    """
+    options = _read_cache(cache_path() if path is None else Path(path)).get(
+        _cache_key(shape, dtype)
+    )
+    if not isinstance(options, dict):
+        return None
+    try:
+        parameters = DeinterlaceParameters(**options)
+    except (TypeError, ValidationError):
+        return None
+    if parameters.fft_backend not in available_fft_backends():
+        return None
+    frames = max(shape[0] // parameters.planes, 1)
+    for limited in ("block_size", "unstable"):
+        if (value := getattr(parameters, limited)) is not None:
+            setattr(parameters, limited, min(value, frames))
+    return parameters
+
+
+def _cache_key(shape: tuple[int, ...], dtype: DTypeLike) -> str:
+    # NOTE: The number of frames is excluded, since the sample is a fraction of the
+    #  images the configuration is applied to
+    frame = "x".join(str(size) for size in shape[1:])
+    return f"{platform.node()}/{frame}/{np.dtype(dtype).name}"
+
+
+def _read_cache(path: Path) -> dict[str, dict[str, Any]]:
+    # Missing, unreadable, or corrupt caches are empty
+    try:
+        tuned = json.loads(path.read_text())
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return {}
+    return tuned if isinstance(tuned, dict) else {}
+
+
+def _write_cache(path: Path, tuned: dict[str, dict[str, Any]]) -> None:
+    # NOTE: The cache is replaced atomically, so concurrent readers (or writers) never
+    #  observe a partially-written cache
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(
+        "w", dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as file:
+        json.dump(tuned, file, indent=4)
+    temporary = Path(file.name)
+    try:
+        temporary.replace(path)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def _options(parameters: DeinterlaceParameters) -> dict[str, Any]:
+    # The options that differ from the defaults (e.g., to be persisted as JSON)
+    return {
+        field.name: getattr(parameters, field.name)
+        for field in fields(parameters)
+        if getattr(parameters, field.name) != field.default
+    }
+
+
+def _offsets(trace: OffsetTrace) -> np.ndarray:
+    # The offset of each frame, reduced to the median across columns when variable
+    offsets = trace.framewise()
+    return np.median(offsets, axis=1) if offsets.ndim == 2 else offsets
@@ -37,6 +37,18 @@ def release_gpu() -> None:
     cp.cuda.runtime.deviceSynchronize()
 
 
+@pytest.fixture(autouse=True)
+def tuning_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Isolate the tests from any configurations tuned on this host.
+
+    :returns: None
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture(scope="session")
 def missing_cupy() -> bool:
     """
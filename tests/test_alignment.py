@@ -0,0 +1,193 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from deinterlacing.alignment import (
+    _PhaseRampCache,
+    align_pixels,
+    align_pixels_framewise,
+    align_subpixels,
+    align_subpixels_framewise,
+    align_subpixels_interpolated,
+    align_subpixels_interpolated_framewise,
+    align_variable,
+    correct_subpixel_offset,
+    interpolate_subpixel_offset,
+)
+
+
+def test_subpixel_correction_matches_complex_transform(artifact: np.ndarray) -> None:
+    """Test the real-input subpixel shift against the full complex transform."""
+    backward_lines = artifact[:2, 1::2, :].astype(np.float64)
+    offset = 1.37
+    vectorized = backward_lines.reshape(-1, backward_lines.shape[-1])
+    phase = -2.0 * np.pi * offset * np.fft.fftfreq(vectorized.shape[-1])
+    expected = np.real(
+        np.fft.ifft(np.fft.fft(vectorized, axis=-1) * np.exp(1j * phase), axis=-1)
+    )
+    np.testing.assert_allclose(
+        correct_subpixel_offset(backward_lines, offset), expected, atol=1e-9
+    )
+
+
+def test_subpixel_correction_single_precision(artifact: np.ndarray) -> None:
+    """Test single-precision subpixel shifts remain within float32 tolerance."""
+    backward_lines = artifact[:2, 1::2, :]
+    single = correct_subpixel_offset(backward_lines, 1.37, precision="float32")
+    double = correct_subpixel_offset(backward_lines, 1.37, precision="float64")
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, double, rtol=1e-4, atol=0.5)
+
+
+def test_align_subpixels_spectrum(artifact: np.ndarray) -> None:
+    """Test aligning from a retained spectrum is identical to transforming again."""
+    images = artifact[:3, ...]
+    expected = images.copy()
+    align_subpixels(expected, 0, 3, 1.37)
+    spectrum = np.fft.rfft(images[:, 1::2, :].astype(np.float64), axis=-1)
+    align_subpixels(images, 0, 3, 1.37, spectrum=spectrum)
+    np.testing.assert_array_equal(images, expected)
+
+
+def test_align_pixels_framewise(artifact: np.ndarray) -> None:
+    """Test framewise pixel alignment against aligning each frame individually."""
+    images = artifact[:5, ...]
+    offsets = np.array([9, -4, 0, 1, -1])
+    expected = images.copy()
+    for index, offset in enumerate(offsets):
+        align_pixels(expected, index, index + 1, offset)
+    align_pixels_framewise(images, 0, 5, offsets)
+    np.testing.assert_array_equal(images, expected)
+
+
+def test_align_subpixels_framewise(artifact: np.ndarray) -> None:
+    """Test framewise subpixel alignment against aligning each frame individually."""
+    images = artifact[:4, ...]
+    offsets = np.array([9.25, -4.5, 0.0, 1.37])
+    expected = images.copy()
+    for index, offset in enumerate(offsets):
+        align_subpixels(expected, index, index + 1, offset)
+    align_subpixels_framewise(images, 0, 4, offsets)
+    np.testing.assert_array_equal(images, expected)
+
+
+def test_align_variable_constant(artifact: np.ndarray) -> None:
+    """Test a constant, integer field-dependent offset is a pixel alignment."""
+    images = artifact[:2, ...]
+    expected = images.copy()
+    align_pixels(expected, 0, 2, 9)
+    align_variable(images, 0, 2, np.full(images.shape[-1], 9.0))
+    np.testing.assert_array_equal(images, expected)
+
+
+def test_align_variable_framewise(artifact: np.ndarray) -> None:
+    """Test per-frame field-dependent offsets against aligning each frame."""
+    images = artifact[:2, ...].astype(np.float64)
+    offsets = np.stack(
+        [np.linspace(-3, 3, images.shape[-1]), np.linspace(8, 10, images.shape[-1])]
+    )
+    expected = images.copy()
+    for index in range(2):
+        align_variable(expected, index, index + 1, offsets[index])
+    align_variable(images, 0, 2, offsets)
+    np.testing.assert_array_equal(images, expected)
+
+
+def test_phase_ramp_cache_reuse() -> None:
+    """Test repeated offsets are served from the cache without recalculation."""
+    cache = _PhaseRampCache()
+    ramp = cache.get(64, 1.37)
+    assert cache.get(64, 1.37) is ramp
+    assert (cache.hits, cache.misses) == (1, 1)
+    expected = np.exp(-2j * np.pi * 1.37 * np.fft.rfftfreq(64))
+    np.testing.assert_allclose(ramp, expected)
+    # Different lengths, offsets or precisions are distinct ramps
+    assert cache.get(64, 1.37, precision="float32").dtype == np.complex64
+    cache.get(32, 1.37)
+    cache.get(64, -1.37)
+    assert len(cache) == 4
+    assert cache.misses == 4
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_phase_ramp_cache_eviction() -> None:
+    """Test the least-recently-used ramps are evicted beyond the memory cap."""
+    ramp_bytes = (64 // 2 + 1) * np.dtype(np.complex128).itemsize
+    cache = _PhaseRampCache(max_bytes=2 * ramp_bytes)
+    cache.get(64, 0.5)
+    cache.get(64, 1.5)
+    cache.get(64, 0.5)
+    cache.get(64, 2.5)
+    assert len(cache) == 2
+    assert cache.nbytes == 2 * ramp_bytes
+    cache.get(64, 0.5)
+    cache.get(64, 1.5)
+    assert cache.misses == 4
+
+
+def test_phase_ramp_cache_threads() -> None:
+    """Test concurrent lookups are consistent and within the memory cap."""
+    ramp_bytes = (64 // 2 + 1) * np.dtype(np.complex128).itemsize
+    cache = _PhaseRampCache(max_bytes=8 * ramp_bytes)
+    offsets = np.tile(np.arange(16) * 0.25, 16)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ramps = list(executor.map(lambda offset: cache.get(64, offset), offsets))
+    for offset, ramp in zip(offsets, ramps, strict=True):
+        np.testing.assert_allclose(
+            ramp, np.exp(-2j * np.pi * offset * np.fft.rfftfreq(64))
+        )
+    assert len(cache) <= 8
+    assert cache.nbytes <= 8 * ramp_bytes
+    assert cache.hits + cache.misses == offsets.size
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "cubic", "lanczos"])
+def test_interpolated_integer_offset(artifact: np.ndarray, interpolation: str) -> None:
+    """Test interpolation kernels reduce to exact shifts for integer offsets."""
+    images = artifact[:3, ...].astype(np.float64)
+    expected = images.copy()
+    align_pixels(expected, 0, 3, 3)
+    align_subpixels_interpolated(images, 0, 3, 3.0, interpolation)
+    # Columns shifted in from outside the image replicate the edge (not retained)
+    np.testing.assert_array_equal(images[..., 3:], expected[..., 3:])
+
+
+@pytest.mark.parametrize(
+    ("interpolation", "tolerance"),
+    [("linear", 1e-2), ("cubic", 1e-3), ("lanczos", 5e-3)],
+)
+def test_interpolated_matches_fourier_shift(
+    interpolation: str, tolerance: float
+) -> None:
+    """Test interpolation kernels agree with the fourier shift on smooth lines."""
+    columns = np.arange(256)
+    lines = np.sin(2 * np.pi * columns / 64)[np.newaxis, :]
+    expected = correct_subpixel_offset(lines, 1.37)
+    shifted = interpolate_subpixel_offset(lines, 1.37, interpolation)
+    np.testing.assert_allclose(shifted[:, 8:-8], expected[:, 8:-8], atol=tolerance)
+
+
+def test_interpolated_in_place(artifact: np.ndarray) -> None:
+    """Test lines interpolated in-place (in chunks) match the returned lines."""
+    lines = artifact[:3, 1::2, :].astype(np.float64)
+    expected = interpolate_subpixel_offset(lines, -2.6, "lanczos")
+    assert interpolate_subpixel_offset(lines, -2.6, "lanczos", out=lines) is lines
+    np.testing.assert_array_equal(lines, expected)
+    np.testing.assert_array_equal(
+        interpolate_subpixel_offset(lines[0, 0], 1.5, "linear"),
+        interpolate_subpixel_offset(lines[:1, :1], 1.5, "linear")[0, 0],
+    )
+
+
+def test_interpolated_framewise(artifact: np.ndarray) -> None:
+    """Test framewise interpolation against aligning each frame individually."""
+    images = artifact[:5, ...].astype(np.float32)
+    offsets = np.array([1.25, -0.5, 1.25, 0.0, 3.75])
+    expected = images.copy()
+    for frame, offset in enumerate(offsets):
+        align_subpixels_interpolated(expected, frame, frame + 1, offset)
+    align_subpixels_interpolated_framewise(images, 0, 5, offsets)
+    np.testing.assert_array_equal(images, expected)
@@ -0,0 +1,102 @@
+from importlib.util import find_spec
+
+import numpy as np
+import pytest
+
+from deinterlacing import DeinterlaceParameters, deinterlace
+from deinterlacing.backends import (
+    _BACKENDS,
+    FFTBackend,
+    available_fft_backends,
+    get_fft_backend,
+    register_fft_backend,
+)
+from deinterlacing.offsets import OffsetWorkspace, calculate_offset_matrix
+
+
+class _CountingTransforms:
+    """numpy.fft, counting the forward and inverse transforms."""
+
+    rfftfreq = staticmethod(np.fft.rfftfreq)
+    ifftshift = staticmethod(np.fft.ifftshift)
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def rfft(self, *args, **kwargs) -> np.ndarray:
+        self.calls += 1
+        return np.fft.rfft(*args, **kwargs)
+
+    def irfft(self, *args, **kwargs) -> np.ndarray:
+        self.calls += 1
+        return np.fft.irfft(*args, **kwargs)
+
+
+@pytest.fixture
+def counting(monkeypatch: pytest.MonkeyPatch) -> _CountingTransforms:
+    transforms = _CountingTransforms()
+    monkeypatch.setitem(
+        _BACKENDS, "counting", (None, lambda _: FFTBackend("counting", transforms))
+    )
+    return transforms
+
+
+def test_numpy_backend() -> None:
+    """Test numpy is always available and is the module itself."""
+    assert "numpy" in available_fft_backends()
+    assert get_fft_backend("numpy") is np
+    with pytest.raises(ValueError, match="Invalid fft_backend"):
+        get_fft_backend("unknown")
+
+
+def test_register_fft_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test backends requiring missing modules are registered but unavailable."""
+    monkeypatch.setattr("deinterlacing.backends._BACKENDS", dict(_BACKENDS))
+    register_fft_backend("missing", lambda _: np, requires="not_a_module")
+    assert "missing" not in available_fft_backends()
+    with pytest.raises(ValueError, match="not available"):
+        get_fft_backend("missing")
+
+
+def test_fft_backend_workspace(
+    artifact: np.ndarray, counting: _CountingTransforms
+) -> None:
+    """Test backends are used with the in-place buffers of the workspace."""
+    images = artifact[:8]
+    backend = get_fft_backend("counting")
+    assert backend.pi == np.pi
+    expected = calculate_offset_matrix(images)
+    result = calculate_offset_matrix(images, backend, workspace=OffsetWorkspace())
+    np.testing.assert_allclose(result, expected)
+    assert counting.calls == 3
+
+
+@pytest.mark.parametrize("align", ["pixel", "subpixel"])
+def test_deinterlace_fft_backend(
+    artifact: np.ndarray, counting: _CountingTransforms, align: str
+) -> None:
+    """Test deinterlacing through a backend matches numpy."""
+    images = artifact[:64]
+    expected = images.copy()
+    deinterlace(expected, DeinterlaceParameters(block_size=16, unstable=4, align=align))
+    parameters = DeinterlaceParameters(
+        block_size=16, unstable=4, align=align, fft_backend="counting"
+    )
+    deinterlace(images, parameters)
+    np.testing.assert_array_equal(images, expected)
+    assert counting.calls > 0
+
+
+@pytest.mark.parametrize("name", ["scipy", "pyfftw"])
+def test_installed_fft_backend(artifact: np.ndarray, name: str) -> None:
+    """Test the multi-threaded backends match numpy when installed."""
+    if find_spec(name) is None:
+        pytest.skip(f"{name} is not installed")
+    images = artifact[:8]
+    backend = get_fft_backend(name, workers=2)
+    assert not backend.native_out
+    np.testing.assert_allclose(
+        calculate_offset_matrix(images, backend, workspace=OffsetWorkspace()),
+        calculate_offset_matrix(images),
+        atol=1e-10,
+    )
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from deinterlacing.instrumentation import BlockMetrics, MetricsRecorder
+
+
+def test_block_metrics() -> None:
+    """Test the derived metrics of a block."""
+    metrics = BlockMetrics(
+        start=4,
+        stop=12,
+        offset=2,
+        nbytes=1024,
+        extraction=0.5,
+        estimation=1.0,
+        alignment=0.5,
+    )
+    assert metrics.frames == 8
+    assert metrics.elapsed == 2.0
+    assert metrics.frames_per_second == 4.0
+
+
+def test_metrics_recorder() -> None:
+    """Test the recorded blocks are summarized by stage."""
+    recorder = MetricsRecorder()
+    assert recorder.summary()["frames_per_second"] == np.inf
+    recorder(BlockMetrics(0, 4, 1, 100, 1.0, 2.0, 1.0))
+    recorder(BlockMetrics(4, 12, 1, 200, 0.0, 3.0, 1.0, plane=1))
+    summary = recorder.summary()
+    assert summary["blocks"] == 2
+    assert summary["frames"] == 12
+    assert summary["nbytes"] == 300
+    assert summary["estimation"] == 5.0
+    assert summary["elapsed"] == 8.0
+    assert summary["frames_per_second"] == pytest.approx(1.5)
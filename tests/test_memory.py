@@ -0,0 +1,165 @@
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from deinterlacing import DeinterlaceParameters, deinterlace
+from deinterlacing.backends import (
+    _BACKENDS,
+    FFTBackend,
+    _RealTransforms,
+    available_fft_backends,
+)
+from deinterlacing.memory import (
+    _FALLBACK_AVAILABLE_MEMORY,
+    available_memory,
+    block_memory,
+    max_block_size,
+    pixel_cost,
+)
+from deinterlacing.synthetic import generate_stack
+
+
+@pytest.fixture
+def out_of_place(monkeypatch: pytest.MonkeyPatch) -> str:
+    # numpy.fft adapted like the backends without an `out` argument
+    transforms = _RealTransforms(np.fft.rfft, np.fft.irfft)
+    monkeypatch.setitem(
+        _BACKENDS, "out_of_place", (None, lambda _: FFTBackend("copy", transforms))
+    )
+    return "out_of_place"
+
+
+def _peak_memory(images: np.ndarray, parameters: DeinterlaceParameters) -> int:
+    # NOTE: The first call of some numpy routines allocates persistent caches
+    deinterlace(images.copy(), parameters)
+    tracemalloc.start()
+    try:
+        deinterlace(images, parameters)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.parametrize(
+    ("options", "dtype"),
+    [
+        pytest.param({}, "uint16", id="pixel"),
+        pytest.param({"precision": "float32"}, "uint16", id="pixel-float32"),
+        pytest.param({}, "float64", id="pixel-float64"),
+        pytest.param({"pool": "mean"}, "uint16", id="pool-mean"),
+        pytest.param({"pool": "median"}, "float64", id="pool-median"),
+        pytest.param({"pool": "std"}, "uint16", id="pool-std"),
+        pytest.param({"align": "subpixel"}, "uint16", id="subpixel"),
+        pytest.param(
+            {"align": "subpixel", "precision": "float32"},
+            "uint16",
+            id="subpixel-float32",
+        ),
+        pytest.param(
+            {"align": "subpixel", "pool": "std"}, "uint16", id="subpixel-pool-std"
+        ),
+        pytest.param(
+            {"align": "subpixel", "interpolation": "linear"},
+            "uint16",
+            id="subpixel-linear",
+        ),
+        pytest.param(
+            {"align": "subpixel", "interpolation": "lanczos", "precision": "float32"},
+            "uint16",
+            id="subpixel-lanczos-float32",
+        ),
+        pytest.param({"align": "variable"}, "uint16", id="variable"),
+        pytest.param(
+            {"align": "variable", "pool": "mean"}, "float64", id="variable-pool-mean"
+        ),
+    ],
+)
+def test_block_memory(options: dict[str, Any], dtype: str) -> None:
+    """Test the cost model bounds the measured peak memory of a block."""
+    images = generate_stack(32, (128, 128), offsets=3.0, dtype=dtype)
+    parameters = DeinterlaceParameters(progress=False, **options)
+    expected = block_memory(parameters, images.shape, images.dtype, len(images))
+    peak = _peak_memory(images, parameters)
+    assert 0.5 * expected <= peak <= expected
+
+
+@pytest.mark.parametrize("align", ["pixel", "subpixel", "variable"])
+@pytest.mark.parametrize("backend", [*available_fft_backends(), "out_of_place"])
+def test_fft_backend_memory(
+    out_of_place: str,  # noqa: ARG001
+    backend: str,
+    align: str,
+) -> None:
+    """Test the blocks selected for a budget fit within it for every FFT backend."""
+    images = generate_stack(64, (128, 128), offsets=3.0)
+    budget = 2**23
+    parameters = DeinterlaceParameters(
+        align=align, fft_backend=backend, memory_budget=budget, progress=False
+    )
+    parameters.validate_with_images(images)
+    assert 1 < parameters.block_size < len(images)
+    assert _peak_memory(images, parameters) <= budget
+
+
+def test_pixel_cost() -> None:
+    """Test the cost of each pixel depends on the dtype and precision."""
+    parameters = DeinterlaceParameters()
+    per_pixel, per_frame = pixel_cost(parameters, "uint16")
+    assert per_pixel == 15.0
+    assert per_frame == 32.0
+    assert pixel_cost(parameters, "float64")[0] == 18.0
+    assert pixel_cost(DeinterlaceParameters(pool="mean"), "uint16")[0] == 1.0
+    assert pixel_cost(DeinterlaceParameters(precision="float32"), "uint16") == (
+        15.0,
+        16.0,
+    )
+
+
+def test_pixel_cost_out_of_place(out_of_place: str) -> None:
+    """Test backends copying their transforms cost the result of each transform."""
+    parameters = DeinterlaceParameters(fft_backend=out_of_place)
+    assert pixel_cost(parameters, "uint16") == (18.0, 36.0)
+    parameters = DeinterlaceParameters(fft_backend=out_of_place, pool="mean")
+    assert pixel_cost(parameters, "uint16") == (1.0, 36.0)
+
+
+def test_max_block_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the block size is the largest whose memory fits within the budget."""
+    shape = (100, 64, 64)
+    parameters = DeinterlaceParameters()
+    budget = block_memory(parameters, shape, "uint16", 10)
+    assert max_block_size(parameters, shape, "uint16", budget) == 10
+    assert max_block_size(parameters, shape, "uint16", budget - 1) == 9
+    assert max_block_size(parameters, shape, "uint16", 1) == 1
+    assert max_block_size(parameters, shape, "uint16", 2**40) == 100
+
+    # Concurrent blocks share the budget
+    parameters = DeinterlaceParameters(workers=2, memory_budget=budget)
+    assert max_block_size(parameters, shape, "uint16") == 3
+    assert max_block_size(parameters, shape, "uint16", concurrent=False) == 10
+
+    monkeypatch.setattr("deinterlacing.memory.available_memory", lambda: 2 * budget)
+    parameters = DeinterlaceParameters(memory_budget="auto")
+    assert max_block_size(parameters, shape, "uint16") == 10
+
+
+def test_available_memory(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test the available memory includes reclaimable memory or falls back."""
+    meminfo = tmp_path.joinpath("meminfo")
+    meminfo.write_text(
+        "MemTotal:       8000 kB\nMemFree:        1000 kB\nMemAvailable:   4000 kB\n"
+    )
+    monkeypatch.setattr("deinterlacing.memory._MEMINFO", meminfo)
+    assert available_memory() == 4000 * 1024
+
+    # Without /proc/meminfo (e.g., macOS or Windows) nor psutil
+    monkeypatch.setattr("deinterlacing.memory._MEMINFO", tmp_path / "missing")
+    monkeypatch.setitem(sys.modules, "psutil", None)
+    assert available_memory() == _FALLBACK_AVAILABLE_MEMORY
+    parameters = DeinterlaceParameters(memory_budget="auto")
+    assert max_block_size(parameters, (100, 64, 64), "uint16") == 100
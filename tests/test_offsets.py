@@ -0,0 +1,229 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from deinterlacing.offsets import (
+    OffsetWorkspace,
+    calculate_alignment_error,
+    calculate_band_offset_matrices,
+    calculate_offset_matrices,
+    calculate_offset_matrix,
+    calculate_offset_matrix_and_spectrum,
+    find_pixel_offset,
+    find_pixel_offsets,
+    find_subpixel_offset,
+    find_subpixel_offsets,
+    find_variable_offset,
+    find_variable_offsets,
+)
+from deinterlacing.synthetic import generate_offsets, generate_stack
+
+
+def test_offset_matrix_matches_complex_transform(artifact: np.ndarray) -> None:
+    """Test the real-input offset matrix against the full complex transform."""
+    images = artifact[:4, ...].astype(np.float64)
+    backward = np.fft.fft(images[..., 1::2, :], axis=-1)
+    backward /= np.abs(backward) + 1e-10
+    forward = np.conj(np.fft.fft(images[..., ::2, :], axis=-1))
+    forward /= np.abs(forward) + 1e-10
+    expected = np.real(np.fft.ifft(backward * forward, axis=-1)).mean(axis=(0, 1))
+    np.testing.assert_allclose(
+        calculate_offset_matrix(images), np.fft.ifftshift(expected), atol=1e-12
+    )
+
+
+def test_offset_matrix_single_precision(artifact: np.ndarray) -> None:
+    """Test the single-precision offset error is bounded by the double-precision."""
+    for start in range(0, 64, 16):
+        block = artifact[start : start + 16, ...]
+        single = calculate_offset_matrix(block, precision="float32")
+        double = calculate_offset_matrix(block, precision="float64")
+        assert single.dtype == np.float32
+        assert find_pixel_offset(block, single, 15) == find_pixel_offset(
+            block, double, 15
+        )
+        assert (
+            abs(
+                find_subpixel_offset(block, single, 15)
+                - find_subpixel_offset(block, double, 15)
+            )
+            < 1e-3
+        )
+
+
+def test_alignment_error_minimized_at_offset(artifact: np.ndarray) -> None:
+    """Test the alignment error is smallest at the estimated offset."""
+    images = artifact[:4, ...]
+    offset = find_pixel_offset(images, calculate_offset_matrix(images), 15)
+    errors = [
+        calculate_alignment_error(images, candidate)
+        for candidate in range(offset - 3, offset + 4)
+    ]
+    assert np.argmin(errors) == 3
+
+
+def test_alignment_error_without_overlap(artifact: np.ndarray) -> None:
+    """Test offsets exceeding the width yield the maximum error rather than NaN."""
+    images = artifact[:4, ...]
+    for offset in (images.shape[-1], -images.shape[-1] - 1, -337.4):
+        assert calculate_alignment_error(images[..., :256], offset) == 2.0
+
+
+def test_alignment_error_variable(artifact: np.ndarray) -> None:
+    """Test constant field-dependent offsets yield the error of the offset."""
+    images = artifact[:4, ...]
+    for offset in (-3.2, 0.0, 9.0):
+        assert calculate_alignment_error(
+            images, np.full(images.shape[-1], offset)
+        ) == pytest.approx(calculate_alignment_error(images, offset))
+    assert calculate_alignment_error(images, np.full(images.shape[-1], 1e4)) == 2.0
+
+
+def test_offset_matrices_batch(artifact: np.ndarray) -> None:
+    """Test the per-frame offset matrices average to the offset matrix."""
+    images = artifact[:4, ...]
+    offset_matrices = calculate_offset_matrices(images)
+    assert offset_matrices.shape == (4, images.shape[-1])
+    np.testing.assert_allclose(
+        offset_matrices.mean(axis=0), calculate_offset_matrix(images)
+    )
+
+
+def test_offset_matrix_and_spectrum(artifact: np.ndarray) -> None:
+    """Test the retained spectrum is that of the backward lines."""
+    images = artifact[:4, ...]
+    offset_matrix, spectrum = calculate_offset_matrix_and_spectrum(images)
+    np.testing.assert_array_equal(offset_matrix, calculate_offset_matrix(images))
+    np.testing.assert_array_equal(
+        spectrum, np.fft.rfft(images[:, 1::2, :].astype(np.float64), axis=-1)
+    )
+
+
+@pytest.mark.parametrize("precision", ["float32", "float64"])
+def test_offset_workspace(artifact: np.ndarray, precision: str) -> None:
+    """Test the workspace is reused by smaller blocks and yields identical results."""
+    workspace = OffsetWorkspace()
+    images = artifact[:4, ...]
+    np.testing.assert_array_equal(
+        calculate_offset_matrix(images, precision=precision, workspace=workspace),
+        calculate_offset_matrix(images, precision=precision),
+    )
+    nbytes = workspace.nbytes
+    assert nbytes > 0
+    # A smaller block reuses (a view of) the existing buffers
+    np.testing.assert_array_equal(
+        calculate_offset_matrices(images[:3], precision=precision, workspace=workspace),
+        calculate_offset_matrices(images[:3], precision=precision),
+    )
+    assert workspace.nbytes == nbytes
+    expected_matrix, expected_spectrum = calculate_offset_matrix_and_spectrum(
+        images, precision=precision
+    )
+    offset_matrix, spectrum = calculate_offset_matrix_and_spectrum(
+        images, precision=precision, workspace=workspace
+    )
+    np.testing.assert_array_equal(offset_matrix, expected_matrix)
+    np.testing.assert_array_equal(spectrum, expected_spectrum)
+    # Each thread is given its own buffers
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(lambda: workspace.nbytes).result() == 0
+    workspace.clear()
+    assert workspace.nbytes == 0
+
+
+def test_strided_offset_matrix(artifact: np.ndarray) -> None:
+    """Test striding the frames of noisy images trades little accuracy for speed."""
+    rng = np.random.default_rng(0)
+    images = artifact[:16, ...].astype(np.float64)
+    images += rng.normal(0, images.std(), images.shape)
+    expected = find_pixel_offset(images, calculate_offset_matrix(images), 15)
+    strided = calculate_offset_matrix(images[::4])
+    assert abs(find_pixel_offset(images, strided, 15) - expected) <= 1
+
+
+def _reference_pixel_offset(offset_matrix: np.ndarray, subsearch: int) -> int:
+    # Scalar reference implementation of the pixel offset (one matrix at a time)
+    center = offset_matrix.shape[-1] // 2
+    window = offset_matrix[center - subsearch : center + subsearch + 1]
+    peak = np.argmax(window)
+    if peak == subsearch:
+        pk0, pk1 = np.argpartition(-window, 2)[:2]
+        if pk1 - pk0 != 1:
+            peak = pk1
+    return -(peak - subsearch)
+
+
+def _reference_subpixel_offset(offset_matrix: np.ndarray, subsearch: int) -> float:
+    # Scalar reference implementation of the subpixel offset (one matrix at a time)
+    offset = _reference_pixel_offset(offset_matrix, subsearch)
+    peak = offset_matrix.shape[0] // 2 - offset
+    if peak <= 0 or peak >= offset_matrix.shape[0] - 1:
+        return float(offset)
+    y0, y1, y2 = offset_matrix[peak - 1], offset_matrix[peak], offset_matrix[peak + 1]
+    denominator = y0 - 2 * y1 + y2
+    if abs(denominator) < 1e-10:
+        return float(offset)
+    return offset - 0.5 * (y0 - y2) / denominator
+
+
+def test_find_offsets_batch(artifact: np.ndarray) -> None:
+    """Test the vectorized peak finders against scalar reference implementations."""
+    images = artifact[:8, ...]
+    width, center = images.shape[-1], images.shape[-1] // 2
+    # Edge cases: a zero peak with an adjacent second peak, a zero peak with a
+    # distant second peak, a flat offset matrix, and peaks at the search boundary
+    edge_cases = np.zeros((5, width))
+    edge_cases[0, [center, center + 1]] = 1.0, 0.5
+    edge_cases[1, [center, center - 4]] = 1.0, 0.5
+    edge_cases[3, center - 15] = 1.0
+    edge_cases[4, center + 15] = 1.0
+    rng = np.random.default_rng(0)
+    offset_matrices = np.concatenate(
+        [
+            calculate_offset_matrices(images),
+            rng.normal(size=(32, width)),
+            edge_cases,
+        ]
+    )
+    pixel_offsets = find_pixel_offsets(images, offset_matrices, 15)
+    subpixel_offsets = find_subpixel_offsets(images, offset_matrices, 15)
+    for index, offset_matrix in enumerate(offset_matrices):
+        assert pixel_offsets[index] == _reference_pixel_offset(offset_matrix, 15)
+        assert subpixel_offsets[index] == _reference_subpixel_offset(offset_matrix, 15)
+        assert find_pixel_offset(images, offset_matrix, 15) == pixel_offsets[index]
+        assert (
+            find_subpixel_offset(images, offset_matrix, 15) == subpixel_offsets[index]
+        )
+
+
+def test_find_offsets_batch_shape(artifact: np.ndarray) -> None:
+    """Test the vectorized peak finders preserve the leading dimensions."""
+    images = artifact[:6, ...]
+    offset_matrices = calculate_offset_matrices(images).reshape(2, 3, -1)
+    assert find_pixel_offsets(images, offset_matrices, 15).shape == (2, 3)
+    assert find_subpixel_offsets(images, offset_matrices, 15).shape == (2, 3)
+
+
+def test_find_variable_offset(artifact: np.ndarray) -> None:
+    """Test the field-dependent offset is smooth and consistent with the offset."""
+    images = artifact[:4, ...]
+    offset_matrices = calculate_band_offset_matrices(images, bands=4)
+    assert offset_matrices.shape == (4, 4, images.shape[-1] // 4)
+    offsets = find_variable_offset(images, offset_matrices, 15)
+    assert offsets.shape == (images.shape[-1],)
+    assert abs(offsets[images.shape[-1] // 2] - 9) < 1
+    assert np.abs(np.diff(offsets)).max() < 0.1
+    np.testing.assert_allclose(
+        find_variable_offsets(images, offset_matrices, 15), np.stack([offsets] * 4)
+    )
+
+
+@pytest.mark.parametrize("fill_fraction", [1e-6, 0.8])
+def test_find_variable_offset_ground_truth(fill_fraction: float) -> None:
+    """Test the field-dependent offset matches the offsets of a synthetic stack."""
+    truth = generate_offsets(8, 512, 3.0, fill_fraction=fill_fraction)
+    images = generate_stack(8, (256, 512), offsets=truth)
+    offset_matrices = calculate_band_offset_matrices(images, bands=4)
+    offsets = find_variable_offset(images, offset_matrices, 15)
+    np.testing.assert_allclose(offsets, truth[0], atol=0.25)
@@ -61,6 +61,15 @@ def test_validate_positive_integer() -> None:
     with pytest.raises(ValidationError):
         DeinterlaceParameters(subsearch=-3)
 
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(workers=0)
+
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(probe_interval=0)
+
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(drift_tolerance=-0.1)
+
 
 def test_validate_with_images(large_artifact: np.ndarray) -> None:
     """
@@ -146,6 +155,29 @@ def test_gpu_not_available(monkeypatch: pytest.MonkeyPatch) -> None:
         params.validate_with_images(np.zeros((10, 64, 64)))
 
 
+def test_gpu_process_executor() -> None:
+    """
+    Test validation when GPU requested with the process executor.
+
+    :returns: None
+    """
+    params = DeinterlaceParameters(use_gpu=True, workers=2, executor="process")
+    with pytest.raises(ValueError, match="process executor"):
+        params.validate_with_images(np.zeros((10, 64, 64)))
+
+
+def test_probe_interval_with_workers(large_artifact: np.ndarray) -> None:
+    """
+    Test validation when adaptive re-estimation is requested with multiple workers.
+
+    :param large_artifact: Sample image stack fixture
+    :returns: None
+    """
+    params = DeinterlaceParameters(probe_interval=4, workers=2)
+    with pytest.raises(ValueError, match="probe_interval"):
+        params.validate_with_images(large_artifact)
+
+
 def test_pool_options() -> None:
     """
     Test all valid pool options.
@@ -169,6 +201,170 @@ def test_align_options() -> None:
     params2 = DeinterlaceParameters(align="subpixel")
     assert params2.align == "subpixel"
 
+    params3 = DeinterlaceParameters(align="variable", bands=8)
+    assert params3.align == "variable"
+    assert params3.bands == 8
+
+
+def test_bands_too_large(large_artifact: np.ndarray) -> None:
+    """
+    Test validation when the bands are too narrow to search for an offset.
+
+    :param large_artifact: Sample image stack fixture
+    :returns: None
+    """
+    params = DeinterlaceParameters(align="variable", bands=large_artifact.shape[-1])
+    with pytest.raises(ParameterError) as exc_info:
+        params.validate_with_images(large_artifact)
+    assert "bands" in str(exc_info.value)
+
+
+def test_precision_options() -> None:
+    """
+    Test valid and invalid precision options.
+
+    :returns: None
+    """
+    assert DeinterlaceParameters().precision == "float64"
+    assert DeinterlaceParameters(precision="float32").precision == "float32"
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(precision="float16")
+
+
+def test_interpolation_options() -> None:
+    """
+    Test valid and invalid interpolation options.
+
+    :returns: None
+    """
+    assert DeinterlaceParameters().interpolation == "fft"
+    for interpolation in ("fft", "linear", "cubic", "lanczos"):
+        parameters = DeinterlaceParameters(interpolation=interpolation)
+        assert parameters.interpolation == interpolation
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(interpolation="nearest")
+
+
+def test_stride_options() -> None:
+    """
+    Test valid and invalid stride options.
+
+    :returns: None
+    """
+    assert DeinterlaceParameters().stride == 1
+    assert DeinterlaceParameters(stride=4).stride == 4
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(stride=0)
+
+
+def test_region_of_interest(artifact: np.ndarray) -> None:
+    """
+    Test valid and invalid regions of interest.
+
+    :returns: None
+    """
+    parameters = DeinterlaceParameters(rows=(32, 96), columns=(100, 200))
+    parameters.validate_with_images(artifact)
+    DeinterlaceParameters(rows="auto").validate_with_images(artifact)
+    with pytest.raises(ParameterError):
+        DeinterlaceParameters(rows=(32, 1024)).validate_with_images(artifact)
+    with pytest.raises(ValueError, match="even"):
+        DeinterlaceParameters(rows=(33, 96)).validate_with_images(artifact)
+    with pytest.raises(ParameterError):
+        DeinterlaceParameters(columns=(200, 100)).validate_with_images(artifact)
+    with pytest.raises(ValueError, match="subsearch"):
+        DeinterlaceParameters(columns=(0, 30)).validate_with_images(artifact)
+    parameters = DeinterlaceParameters(align="variable", columns=(100, 200))
+    with pytest.raises(ValueError, match="variable"):
+        parameters.validate_with_images(artifact)
+
+
+def test_channel_options(artifact: np.ndarray) -> None:
+    """
+    Test valid and invalid reference channels.
+
+    :returns: None
+    """
+    multichannel = np.stack([artifact[:8], artifact[:8]], axis=1)
+    DeinterlaceParameters(channel=1).validate_with_images(multichannel)
+    DeinterlaceParameters(channel="mean").validate_with_images(multichannel)
+    # The subsearch is derived from the spatial dimensions only
+    parameters = DeinterlaceParameters(subsearch=None)
+    parameters.validate_with_images(multichannel)
+    assert parameters.subsearch == 512 // 16
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(channel="max")
+    with pytest.raises(ParameterError):
+        DeinterlaceParameters(channel=2).validate_with_images(multichannel)
+    with pytest.raises(ValueError, match="multichannel"):
+        DeinterlaceParameters(channel=0).validate_with_images(artifact)
+    with pytest.raises(ValueError, match="frames"):
+        DeinterlaceParameters().validate_with_images(artifact[0])
+
+
+def test_planes_options(artifact: np.ndarray) -> None:
+    """
+    Test the block size and unstable frames are bounded by the frames of each plane.
+
+    :returns: None
+    """
+    images = artifact[:9]
+    parameters = DeinterlaceParameters(planes=2)
+    parameters.validate_with_images(images)
+    assert parameters.block_size == 4
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(planes=0)
+    with pytest.raises(ParameterError):
+        DeinterlaceParameters(planes=10).validate_with_images(images)
+    with pytest.raises(ParameterError):
+        DeinterlaceParameters(planes=2, block_size=5).validate_with_images(images)
+    with pytest.raises(ParameterError):
+        DeinterlaceParameters(planes=2, unstable=5).validate_with_images(images)
+
+
+def test_fft_backend_options(
+    artifact: np.ndarray, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test the FFT backend must be registered and installed.
+
+    :returns: None
+    """
+    images = artifact[:4]
+    DeinterlaceParameters(fft_backend="numpy").validate_with_images(images)
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(fft_workers=0)
+    with pytest.raises(ValueError, match="not available"):
+        DeinterlaceParameters(fft_backend="unknown").validate_with_images(images)
+    monkeypatch.setattr(
+        "deinterlacing.parameters.available_fft_backends", lambda: ("numpy",)
+    )
+    with pytest.raises(ValueError, match="scipy"):
+        DeinterlaceParameters(fft_backend="scipy").validate_with_images(images)
+
+
+def test_memory_budget_options(large_artifact: np.ndarray) -> None:
+    """
+    Test the block size is derived from the memory budget when not provided.
+
+    :returns: None
+    """
+    images = large_artifact
+    frame = images[0].size
+    parameters = DeinterlaceParameters(memory_budget=(15 * 4 + 32) * frame)
+    parameters.validate_with_images(images)
+    assert parameters.block_size == 4
+    parameters = DeinterlaceParameters(block_size=2, memory_budget=1)
+    parameters.validate_with_images(images)
+    assert parameters.block_size == 2
+    parameters = DeinterlaceParameters(memory_budget=2**40)
+    parameters.validate_with_images(images)
+    assert parameters.block_size == len(images)
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(memory_budget=0)
+    with pytest.raises(ValidationError):
+        DeinterlaceParameters(memory_budget="half")
+
 
 def test_small_image_handling(small_artifact: np.ndarray) -> None:
     """
@@ -1,8 +1,32 @@
+from pathlib import Path
+
 import numpy as np
 import pytest
 
-from deinterlacing import DeinterlaceParameters
-from deinterlacing.processing import deinterlace
+from deinterlacing import (
+    DeinterlaceParameters,
+    MetricsRecorder,
+    OffsetTrace,
+    apply_offsets,
+    estimate_offsets,
+)
+from deinterlacing.alignment import align_pixels
+from deinterlacing.offsets import calculate_alignment_error
+from deinterlacing.processing import _AdaptiveOffset, deinterlace, deinterlace_file
+
+
+@pytest.fixture
+def adaptive(monkeypatch: pytest.MonkeyPatch) -> list[_AdaptiveOffset]:
+    # Records every adaptive offset calculation, so their estimations can be counted
+    calculations = []
+
+    class _RecordedOffset(_AdaptiveOffset):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            calculations.append(self)
+
+    monkeypatch.setattr("deinterlacing.processing._AdaptiveOffset", _RecordedOffset)
+    return calculations
 
 
 def test_deinterlace_frames_gt_dims(
@@ -122,3 +146,360 @@ def test_deinterlacing_subpixel(
     parameters = DeinterlaceParameters(align="subpixel")
     deinterlace(artifact, parameters)
     np.testing.assert_allclose(artifact, subpixel_corrected)
+
+
+def test_deinterlace_single_precision(
+    artifact: np.ndarray, corrected: np.ndarray
+) -> None:
+    """Test single-precision deinterlacing arrives at the same ground truth."""
+    parameters = DeinterlaceParameters(block_size=16, precision="float32")
+    deinterlace(artifact, parameters)
+    np.testing.assert_array_equal(artifact, corrected)
+
+
+def test_deinterlace_single_precision_pool(
+    artifact: np.ndarray, corrected: np.ndarray
+) -> None:
+    """Test single-precision pooling arrives at the same ground truth."""
+    parameters = DeinterlaceParameters(pool="mean", precision="float32")
+    deinterlace(artifact[:3, :, :], parameters)
+    np.testing.assert_array_equal(artifact[:3, :, :], corrected[:3, :, :])
+
+
+def test_deinterlace_workers(artifact: np.ndarray, corrected: np.ndarray) -> None:
+    """Test concurrent block deinterlacing is identical to serial deinterlacing."""
+    artifact = artifact[:64, :, :]
+    parameters = DeinterlaceParameters(block_size=7, unstable=5, workers=4)
+    deinterlace(artifact, parameters)
+    np.testing.assert_array_equal(artifact, corrected[:64, :, :])
+
+
+def test_deinterlace_process_executor(
+    artifact: np.ndarray, corrected: np.ndarray
+) -> None:
+    """Test deinterlacing in worker processes over shared memory."""
+    artifact = artifact[:32, :, :]
+    parameters = DeinterlaceParameters(
+        block_size=7, unstable=3, workers=2, executor="process"
+    )
+    deinterlace(artifact, parameters)
+    np.testing.assert_array_equal(artifact, corrected[:32, :, :])
+
+
+def test_deinterlace_process_executor_memmap(
+    artifact: np.ndarray, corrected: np.ndarray, tmp_path: Path
+) -> None:
+    """Test deinterlacing a memory-mapped file in place in worker processes."""
+    filename = tmp_path.joinpath("artifact.npy")
+    np.save(filename, artifact[:32, :, :])
+    images = np.load(filename, mmap_mode="r+")
+    parameters = DeinterlaceParameters(block_size=7, workers=2, executor="process")
+    deinterlace(images, parameters)
+    del images
+    np.testing.assert_array_equal(np.load(filename), corrected[:32, :, :])
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_deinterlace_observer(
+    artifact: np.ndarray,
+    corrected: np.ndarray,
+    capsys: pytest.CaptureFixture,
+    workers: int | None,
+) -> None:
+    """Test the metrics of every block are reported and the bar can be disabled."""
+    artifact = artifact[:32, :, :]
+    recorder = MetricsRecorder()
+    parameters = DeinterlaceParameters(
+        block_size=8, unstable=4, workers=workers, progress=False
+    )
+    trace = estimate_offsets(artifact, parameters)
+    deinterlace(artifact, parameters, observer=recorder)
+    np.testing.assert_array_equal(artifact, corrected[:32, :, :])
+    assert "Deinterlacing" not in capsys.readouterr().err
+    unstable, *blocks = sorted(recorder.blocks, key=lambda block: block.start)
+    assert unstable.unstable
+    assert (unstable.start, unstable.stop, len(unstable.offset)) == (0, 4, 4)
+    assert [(block.start, block.stop) for block in blocks] == [
+        (4, 12),
+        (12, 20),
+        (20, 28),
+        (28, 32),
+    ]
+    np.testing.assert_array_equal(unstable.offset, trace.offsets[:4])
+    np.testing.assert_array_equal([block.offset for block in blocks], trace.offsets[4:])
+    assert all(block.estimation > 0 for block in blocks)
+    assert recorder.summary()["nbytes"] == artifact.nbytes
+
+
+def test_deinterlace_file_observer(artifact: np.ndarray, tmp_path: Path) -> None:
+    """Test the metrics of each streamed block are reported within the stack."""
+    filename = tmp_path.joinpath("artifact.npy")
+    np.save(filename, artifact[:16, :, :])
+    recorder = MetricsRecorder()
+    parameters = DeinterlaceParameters(block_size=6, unstable=2, planes=2)
+    deinterlace_file(filename, parameters=parameters, observer=recorder)
+    assert [
+        (block.plane, block.start, block.stop, block.unstable)
+        for block in recorder.blocks
+    ] == [
+        (0, 0, 2, True),
+        (0, 2, 8, False),
+        (1, 0, 2, True),
+        (1, 2, 8, False),
+    ]
+
+
+def test_deinterlace_file(
+    artifact: np.ndarray, corrected: np.ndarray, tmp_path: Path
+) -> None:
+    """Test streaming a read-only numpy file to a separate output file."""
+    filename = tmp_path.joinpath("artifact.npy")
+    np.save(filename, artifact[:32, :, :])
+    # NOTE: A budget smaller than the footprint of a single frame forces single
+    #  frame blocks, so the estimate must still match whole-stack deinterlacing
+    out_path = deinterlace_file(
+        filename, tmp_path.joinpath("corrected.npy"), memory_budget=1
+    )
+    np.testing.assert_array_equal(np.load(out_path), corrected[:32, :, :])
+    np.testing.assert_array_equal(np.load(filename), artifact[:32, :, :])
+
+
+def test_deinterlace_file_raw_in_place(
+    artifact: np.ndarray, corrected: np.ndarray, tmp_path: Path
+) -> None:
+    """Test deinterlacing a raw binary file in-place."""
+    filename = tmp_path.joinpath("artifact.bin")
+    artifact[:32, :, :].tofile(filename)
+    shape = (32, *artifact.shape[1:])
+    parameters = DeinterlaceParameters(unstable=2)
+    deinterlace_file(filename, parameters=parameters, shape=shape, dtype=np.uint16)
+    images = np.fromfile(filename, dtype=np.uint16).reshape(shape)
+    np.testing.assert_array_equal(images, corrected[:32, :, :])
+
+
+def test_deinterlace_file_raw_requires_shape(tmp_path: Path) -> None:
+    """Test raw files cannot be deinterlaced without their shape and dtype."""
+    filename = tmp_path.joinpath("artifact.bin")
+    np.zeros((2, 8, 8), dtype=np.uint16).tofile(filename)
+    with pytest.raises(ValueError, match="shape and dtype"):
+        deinterlace_file(filename)
+
+
+def test_deinterlace_adaptive(
+    artifact: np.ndarray, corrected: np.ndarray, adaptive: list[_AdaptiveOffset]
+) -> None:
+    """Test adaptive re-estimation arrives at the same ground truth."""
+    artifact = artifact[:64, :, :]
+    parameters = DeinterlaceParameters(block_size=4, unstable=2, probe_interval=8)
+    recorder = MetricsRecorder()
+    deinterlace(artifact, parameters, observer=recorder)
+    np.testing.assert_array_equal(artifact, corrected[:64, :, :])
+    # Only the probe blocks of the stable stack are estimated
+    (calculation,) = adaptive
+    blocks = sum(not metrics.unstable for metrics in recorder.blocks)
+    assert calculation.estimations == -(-blocks // 8)
+
+
+def test_deinterlace_adaptive_drift(
+    artifact: np.ndarray, adaptive: list[_AdaptiveOffset]
+) -> None:
+    """Test adaptive re-estimation detects drift and re-estimates the offset."""
+    artifact = artifact[:32, :, :]
+    parameters = DeinterlaceParameters(block_size=4, probe_interval=100)
+    deinterlace(artifact.copy(), parameters)
+    artifact[16:, 1::2, :] = np.roll(artifact[16:, 1::2, :], 3, axis=-1)
+    expected = artifact.copy()
+    deinterlace(expected, DeinterlaceParameters(block_size=4))
+    deinterlace(artifact, parameters)
+    np.testing.assert_array_equal(artifact, expected)
+    stable, drifting = adaptive
+    assert stable.estimations == 1
+    assert drifting.estimations > stable.estimations
+
+
+def test_deinterlace_adaptive_variable(artifact: np.ndarray) -> None:
+    """Test adaptive re-estimation of field-dependent offsets."""
+    artifact = artifact[:16, :, :]
+    expected = artifact.copy()
+    deinterlace(expected, DeinterlaceParameters(block_size=4, align="variable"))
+    parameters = DeinterlaceParameters(block_size=4, align="variable", probe_interval=3)
+    deinterlace(artifact, parameters)
+    np.testing.assert_array_equal(artifact, expected)
+
+
+def test_deinterlace_unstable_batches(
+    artifact: np.ndarray, subpixel_corrected: np.ndarray
+) -> None:
+    """Test the unstable frames are deinterlaced identically in batches."""
+    artifact = artifact[:16, :, :]
+    parameters = DeinterlaceParameters(block_size=3, unstable=10, align="subpixel")
+    deinterlace(artifact, parameters)
+    np.testing.assert_allclose(artifact, subpixel_corrected[:16, :, :])
+
+
+def test_deinterlace_variable(artifact: np.ndarray, corrected: np.ndarray) -> None:
+    """Test field-dependent deinterlacing aligns at least as well as pixels."""
+    artifact = artifact[:8, :, :]
+    framewise = artifact.copy()
+    deinterlace(artifact, DeinterlaceParameters(align="variable"))
+    assert calculate_alignment_error(artifact, 0) <= calculate_alignment_error(
+        corrected[:8, :, :], 0
+    )
+    # The unstable (individually deinterlaced) frames arrive at the same result
+    parameters = DeinterlaceParameters(align="variable", unstable=8, block_size=3)
+    deinterlace(framewise, parameters)
+    np.testing.assert_array_equal(framewise, artifact)
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "cubic", "lanczos"])
+def test_deinterlace_interpolated(
+    artifact: np.ndarray, subpixel_corrected: np.ndarray, interpolation: str
+) -> None:
+    """Test interpolated subpixel alignment aligns as well as the fourier shift."""
+    artifact = artifact[:16, :, :]
+    framewise = artifact.copy()
+    parameters = DeinterlaceParameters(align="subpixel", interpolation=interpolation)
+    deinterlace(artifact, parameters)
+    assert calculate_alignment_error(artifact, 0) <= 1.1 * calculate_alignment_error(
+        subpixel_corrected[:16, :, :], 0
+    )
+    # The unstable (individually deinterlaced) frames arrive at the same result
+    parameters = DeinterlaceParameters(
+        align="subpixel", interpolation=interpolation, unstable=16, block_size=4
+    )
+    deinterlace(framewise, parameters)
+    # NOTE: The offsets may differ in the last bit, so allow for rounding
+    np.testing.assert_allclose(framewise, artifact, atol=1)
+
+
+def test_deinterlace_subpixel_blocks(
+    artifact: np.ndarray, subpixel_corrected: np.ndarray
+) -> None:
+    """Test the fused estimation and correction of subpixel blocks."""
+    artifact = artifact[:16, :, :]
+    parameters = DeinterlaceParameters(block_size=4, align="subpixel")
+    deinterlace(artifact, parameters)
+    np.testing.assert_array_equal(artifact, subpixel_corrected[:16, :, :])
+
+
+def test_deinterlace_fast_estimation(
+    artifact: np.ndarray, corrected: np.ndarray
+) -> None:
+    """Test frame striding arrives at the ground truth."""
+    artifact = artifact[:32, :, :]
+    parameters = DeinterlaceParameters(block_size=16, stride=4)
+    deinterlace(artifact, parameters)
+    np.testing.assert_array_equal(artifact, corrected[:32, :, :])
+
+
+@pytest.mark.parametrize(
+    ("rows", "columns"), [("auto", None), ((128, 384), None), ("auto", (64, 448))]
+)
+def test_deinterlace_region_of_interest(
+    artifact: np.ndarray,
+    corrected: np.ndarray,
+    rows: tuple[int, int] | str,
+    columns: tuple[int, int] | None,
+) -> None:
+    """Test estimating from a region of interest still aligns the entire frame."""
+    artifact = artifact[:32, :, :]
+    parameters = DeinterlaceParameters(
+        block_size=16, unstable=4, rows=rows, columns=columns
+    )
+    deinterlace(artifact, parameters)
+    np.testing.assert_array_equal(artifact, corrected[:32, :, :])
+
+
+@pytest.mark.parametrize("align", ["pixel", "subpixel", "variable"])
+def test_estimate_and_apply_offsets(
+    artifact: np.ndarray, align: str, tmp_path: Path
+) -> None:
+    """Test estimating and then applying offsets is identical to deinterlacing."""
+    artifact = artifact[:16, :, :]
+    expected = artifact.copy()
+    parameters = DeinterlaceParameters(block_size=4, unstable=3, align=align)
+    deinterlace(expected, parameters)
+    original = artifact.copy()
+    trace = estimate_offsets(artifact, parameters)
+    np.testing.assert_array_equal(artifact, original)
+    assert len(trace) == 3 + 4
+    assert trace.frames == 16
+    assert trace.framewise().shape[0] == 16
+    # The offsets survive a round-trip to disk
+    trace = OffsetTrace.load(trace.save(tmp_path / "offsets"))
+    assert trace.align == align
+    apply_offsets(artifact, trace, parameters)
+    np.testing.assert_array_equal(artifact, expected)
+
+
+def test_apply_offsets_validation(artifact: np.ndarray) -> None:
+    """Test offsets are only applied to compatible images and alignments."""
+    artifact = artifact[:8, :, :]
+    trace = estimate_offsets(artifact, DeinterlaceParameters(block_size=4))
+    with pytest.raises(ValueError, match="align"):
+        apply_offsets(artifact, trace, DeinterlaceParameters(align="subpixel"))
+    with pytest.raises(ValueError, match="frames"):
+        apply_offsets(artifact[:4, :, :], trace)
+    apply_offsets(artifact, trace)
+
+
+@pytest.mark.parametrize("channel", [0, "mean", None])
+def test_deinterlace_multichannel(
+    artifact: np.ndarray, corrected: np.ndarray, channel: int | str | None
+) -> None:
+    """Test every channel is aligned by the offsets of the reference channel."""
+    multichannel = np.stack([artifact[:16], artifact[:16] // 2], axis=1)
+    parameters = DeinterlaceParameters(block_size=4, unstable=4, channel=channel)
+    deinterlace(multichannel, parameters)
+    np.testing.assert_array_equal(multichannel[:, 0], corrected[:16])
+    np.testing.assert_array_equal(multichannel[:, 1], corrected[:16] // 2)
+
+
+@pytest.mark.parametrize("align", ["subpixel", "variable"])
+def test_estimate_and_apply_multichannel(artifact: np.ndarray, align: str) -> None:
+    """Test offsets estimated from all channels are applied to all channels."""
+    multichannel = np.stack([artifact[:16], artifact[:16] // 2], axis=1)
+    expected = multichannel.copy()
+    parameters = DeinterlaceParameters(block_size=4, unstable=4, align=align)
+    deinterlace(expected, parameters)
+    apply_offsets(multichannel, estimate_offsets(multichannel, parameters), parameters)
+    np.testing.assert_array_equal(multichannel, expected)
+
+
+@pytest.fixture
+def volume(artifact: np.ndarray) -> np.ndarray:
+    """Interleaved volume of two planes, the second of which has a smaller offset."""
+    second = artifact[:9].copy()
+    align_pixels(second, 0, 9, 3)
+    volume = np.empty((18, *artifact.shape[1:]), dtype=artifact.dtype)
+    volume[0::2] = artifact[:9]
+    volume[1::2] = second
+    return volume
+
+
+@pytest.mark.parametrize("unstable", [None, 2])
+def test_deinterlace_planes(
+    volume: np.ndarray, corrected: np.ndarray, unstable: int | None
+) -> None:
+    """Test each plane of an interleaved volume is given its own offsets."""
+    parameters = DeinterlaceParameters(planes=2, block_size=4, unstable=unstable)
+    trace = estimate_offsets(volume, parameters)
+    assert trace.step == 2
+    framewise = trace.framewise()
+    assert set(framewise[0::2].tolist()) == {9}
+    assert set(framewise[1::2].tolist()) == {6}
+    expected = volume.copy()
+    apply_offsets(expected, trace)
+    deinterlace(volume, parameters)
+    np.testing.assert_array_equal(volume, expected)
+    np.testing.assert_array_equal(volume[0::2], corrected[:9])
+
+
+def test_deinterlace_file_planes(volume: np.ndarray, tmp_path: Path) -> None:
+    """Test the planes of an interleaved volume are deinterlaced out-of-core."""
+    filename = tmp_path.joinpath("volume.npy")
+    np.save(filename, volume)
+    parameters = DeinterlaceParameters(planes=2, block_size=4, unstable=1)
+    out_path = deinterlace_file(filename, tmp_path.joinpath("out.npy"), parameters)
+    deinterlace(volume, DeinterlaceParameters(planes=2, block_size=4, unstable=1))
+    np.testing.assert_array_equal(np.load(out_path), volume)
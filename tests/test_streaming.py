@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from deinterlacing import DeinterlaceParameters
+from deinterlacing.streaming import StreamingDeinterlacer
+
+
+def test_streaming_block(artifact: np.ndarray, corrected: np.ndarray) -> None:
+    """Test block streaming arrives at the same ground truth as deinterlace."""
+    parameters = DeinterlaceParameters(block_size=5, unstable=2)
+    streamer = StreamingDeinterlacer(parameters, mode="block")
+    chunks = [artifact[start : start + 3, ...] for start in range(0, 24, 3)]
+    frames = np.stack(list(streamer.stream(chunks)))
+    np.testing.assert_array_equal(frames, corrected[:24, ...])
+
+
+def test_streaming_block_latency(artifact: np.ndarray) -> None:
+    """Test block streaming returns frames once the unstable frames and block fill."""
+    parameters = DeinterlaceParameters(block_size=4, unstable=2)
+    streamer = StreamingDeinterlacer(parameters, mode="block")
+    returned = [streamer.push(artifact[index, ...]).shape[0] for index in range(10)]
+    assert returned == [1, 1, 0, 0, 0, 4, 0, 0, 0, 4]
+    assert streamer.buffered == 0
+
+
+def test_streaming_rolling(artifact: np.ndarray, corrected: np.ndarray) -> None:
+    """Test rolling streaming returns every frame immediately."""
+    parameters = DeinterlaceParameters(block_size=4, unstable=1)
+    streamer = StreamingDeinterlacer(parameters, mode="rolling")
+    frames = [streamer.push(artifact[index, ...]) for index in range(8)]
+    assert all(frame.shape[0] == 1 for frame in frames)
+    assert streamer.flush().shape[0] == 0
+    np.testing.assert_array_equal(np.concatenate(frames), corrected[:8, ...])
+
+
+def test_streaming_rolling_multichannel(
+    artifact: np.ndarray, corrected: np.ndarray
+) -> None:
+    """Test rolling streaming estimates the offsets from the reference channel."""
+    # The other channels are shifted by a different offset, which would dominate the
+    # estimate if the channels were pooled
+    shifted = artifact[:8].copy()
+    shifted[..., 1::2, :] = np.roll(shifted[..., 1::2, :], 6, axis=-1)
+    multichannel = np.stack([artifact[:8], shifted, shifted], axis=1)
+    parameters = DeinterlaceParameters(block_size=4, unstable=1, channel=0)
+    streamer = StreamingDeinterlacer(parameters, mode="rolling")
+    frames = np.concatenate(
+        [streamer.push(multichannel[index : index + 2]) for index in range(0, 8, 2)]
+    )
+    np.testing.assert_array_equal(frames[:, 0], corrected[:8, ...])
+
+
+def test_streaming_requires_block_size() -> None:
+    """Test streaming cannot proceed without a block size."""
+    with pytest.raises(ValueError, match="block_size"):
+        StreamingDeinterlacer(DeinterlaceParameters())
+    with pytest.raises(ValueError, match="planes"):
+        StreamingDeinterlacer(DeinterlaceParameters(block_size=4, planes=2))
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from deinterlacing import DeinterlaceParameters, estimate_offsets
+from deinterlacing.alignment import align_pixels
+from deinterlacing.synthetic import generate_offsets, generate_stack, stream_stack
+
+
+def test_generate_offsets() -> None:
+    """Test constant, drifting, and field-varying offsets."""
+    np.testing.assert_array_equal(generate_offsets(4, 8, 2.5), np.full(4, 2.5))
+    np.testing.assert_allclose(generate_offsets(3, 8, 1.0, drift=2.0), [1.0, 2.0, 3.0])
+    offsets = generate_offsets(2, 9, 2.0, fill_fraction=0.8)
+    assert offsets.shape == (2, 9)
+    assert offsets[0, 4] == 2.0
+    assert offsets[0, 0] == offsets[0, -1] == pytest.approx(1.2)
+    with pytest.raises(ValueError, match="fill_fraction"):
+        generate_offsets(2, 9, fill_fraction=1.5)
+
+
+def test_generate_stack() -> None:
+    """Test stacks are reproducible regardless of how they are chunked."""
+    images = generate_stack(20, (32, 48), dtype="float32", noise="pmt", chunk_size=3)
+    assert images.shape == (20, 32, 48)
+    assert images.dtype == np.float32
+    np.testing.assert_array_equal(
+        images, generate_stack(20, (32, 48), dtype="float32", noise="pmt")
+    )
+    chunks = list(stream_stack(20, (32, 48), dtype="float32", noise="pmt"))
+    np.testing.assert_array_equal(np.concatenate(chunks), images)
+    out = np.zeros((20, 32, 48), dtype="uint8")
+    assert generate_stack(20, (32, 48), dtype="uint8", photons=1e4, out=out) is out
+    assert out.max() == 255
+    with pytest.raises(ValueError, match="offsets"):
+        generate_stack(20, (32, 48), offsets=np.zeros(7))
+    with pytest.raises(ValueError, match="noise"):
+        generate_stack(20, (32, 48), noise="gaussian")
+
+
+def test_generate_stack_ground_truth() -> None:
+    """Test aligning the backward lines by the offsets recovers the ground truth."""
+    truth = generate_stack(4, (32, 64), offsets=0, dtype="float64", noise="none")
+    images = generate_stack(4, (32, 64), offsets=3, dtype="float64", noise="none")
+    assert not np.allclose(images, truth)
+    align_pixels(images, 0, 4, 3)
+    np.testing.assert_allclose(images[..., 3:], truth[..., 3:])
+
+
+def test_estimate_synthetic_offsets() -> None:
+    """Test the estimated offsets match the ground truth of a time-varying stack."""
+    offsets = np.repeat([2, -3, 4, 1], 16)
+    images = generate_stack(64, (128, 128), offsets=offsets)
+    trace = estimate_offsets(images, DeinterlaceParameters(block_size=16))
+    np.testing.assert_array_equal(trace.framewise(), offsets)
@@ -0,0 +1,40 @@
+import numpy as np
+
+from deinterlacing.tools import crop_image_block, extract_channel, select_signal_rows
+
+
+def test_select_signal_rows() -> None:
+    """Test the band with the most signal is selected on an even row."""
+    rng = np.random.default_rng(0)
+    images = np.zeros((4, 64, 32))
+    images[:, 33:49, :] = rng.random((4, 16, 32))
+    start, stop = select_signal_rows(images)
+    assert start % 2 == 0
+    assert stop - start == 16
+    assert 30 <= start <= 34
+    # Small images still include at least one pair of lines
+    assert select_signal_rows(images[..., :3, :]) == (0, 2)
+
+
+def test_crop_image_block(artifact: np.ndarray) -> None:
+    """Test cropping returns views of the region of interest."""
+    images = artifact[:2, ...]
+    cropped = crop_image_block(images, (32, 96), (100, 200))
+    assert cropped.shape == (2, 64, 100)
+    assert np.shares_memory(cropped, images)
+    np.testing.assert_array_equal(cropped, images[:, 32:96, 100:200])
+    assert crop_image_block(images) is images
+    assert crop_image_block(images, "auto").shape == (2, 128, 512)
+
+
+def test_extract_channel() -> None:
+    """Test extracting or pooling the reference channel of multichannel images."""
+    images = np.arange(2 * 3 * 4 * 5).reshape(2, 3, 4, 5)
+    assert extract_channel(images, None) is images
+    np.testing.assert_array_equal(extract_channel(images, 1), images[:, 1])
+    np.testing.assert_array_equal(
+        extract_channel(images, "mean"), images.mean(axis=1).astype(images.dtype)
+    )
+    np.testing.assert_array_equal(extract_channel(images, "sum"), images.sum(axis=1))
+    # Pooled blocks (channels, rows, columns) are also supported
+    np.testing.assert_array_equal(extract_channel(images[0], 2), images[0, 2])
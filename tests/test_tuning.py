@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deinterlacing import MetricsRecorder, deinterlace, tune
+from deinterlacing.synthetic import generate_stack
+from deinterlacing.tuning import cache_path, default_candidates, tuned_parameters
+
+
+@pytest.fixture
+def sample() -> np.ndarray:
+    return generate_stack(16, (64, 64), offsets=3.0)
+
+
+def test_default_candidates(sample: np.ndarray) -> None:
+    """Test the default candidates span the frames of the sample."""
+    candidates = default_candidates(sample)
+    assert candidates["block_size"] == (2, 8, 16)
+    assert "numpy" in candidates["fft_backend"]
+    assert None in candidates["workers"]
+
+
+def test_tune(sample: np.ndarray, tmp_path: Path) -> None:
+    """Test the fastest candidate is persisted and loaded for the same frames."""
+    path = tmp_path.joinpath("tuning.json")
+    candidates = {"pool": (None, "mean"), "block_size": (4, 16)}
+    parameters = tune(sample, candidates=candidates, repeats=1, cache=path)
+    assert parameters.pool in candidates["pool"]
+    assert parameters.block_size in candidates["block_size"]
+    assert len(json.loads(path.read_text())) == 1
+
+    tuned = tuned_parameters((100, 64, 64), "uint16", path)
+    assert tuned == parameters
+    assert tuned_parameters((2, 64, 64), "uint16", path).block_size == 2
+    assert tuned_parameters((100, 64, 64), "float32", path) is None
+    assert tuned_parameters((100, 32, 64), "uint16", path) is None
+    assert tuned_parameters((100, 64, 64), "uint16", tmp_path / "missing.json") is None
+
+
+def test_tune_rejects_candidates(sample: np.ndarray) -> None:
+    """Test invalid or inaccurate candidates are rejected."""
+    parameters = tune(sample, candidates={"block_size": (4, 32)}, repeats=1)
+    assert parameters.block_size == 4
+    with pytest.raises(ValueError, match="No candidate"):
+        tune(sample, candidates={"block_size": (32,)}, repeats=1)
+    with pytest.raises(ValueError, match="No candidate"):
+        tune(sample, candidates={"pool": (None,)}, tolerance=-1.0, repeats=1)
+
+
+def test_deinterlace_tuned(sample: np.ndarray) -> None:
+    """Test deinterlace loads the tuned configuration without parameters."""
+    tune(sample, candidates={"block_size": (4,)}, repeats=1, cache=True)
+    assert cache_path().exists()
+    recorder = MetricsRecorder()
+    deinterlace(np.concatenate([sample, sample]), observer=recorder)
+    assert [metrics.frames for metrics in recorder.blocks] == [4] * 8
+
+
+def test_tuned_parameters_invalid_cache(sample: np.ndarray, tmp_path: Path) -> None:
+    """Test corrupt caches and invalid configurations are ignored."""
+    path = tmp_path.joinpath("tuning.json")
+    tune(sample, candidates={"block_size": (4,)}, repeats=1, cache=path)
+    assert list(tmp_path.iterdir()) == [path]
+    (key,) = json.loads(path.read_text())
+    for entry in (
+        {"fft_backend": "unknown"},
+        {"block_size": 0},
+        [4],
+    ):
+        path.write_text(json.dumps({key: entry}))
+        assert tuned_parameters(sample.shape, sample.dtype, path) is None
+    path.write_text(json.dumps({key: {"block_size": 4, "unstable": 32}}))
+    assert tuned_parameters(sample.shape, sample.dtype, path).unstable == 16
+    path.write_text(json.dumps({key: {"block_size": 4}})[:-3])
+    assert tuned_parameters(sample.shape, sample.dtype, path) is None
+    tune(sample, candidates={"block_size": (8,)}, repeats=1, cache=path)
+    assert tuned_parameters(sample.shape, sample.dtype, path).block_size == 8
+
+
+def test_deinterlace_corrupt_cache(sample: np.ndarray) -> None:
+    """Test deinterlace falls back to the defaults if the cache is corrupt."""
+    cache_path().parent.mkdir(parents=True)
+    cache_path().write_text("{")
+    recorder = MetricsRecorder()
+    deinterlace(sample, observer=recorder)
+    assert [metrics.frames for metrics in recorder.blocks] == [16]